@@ -0,0 +1,73 @@
+"""Measures how long `import python_on_whales` and creating a `DockerClient` take.
+
+Each measure runs in a new interpreter with `python -X importtime`, so nothing
+is already in `sys.modules`. The components (`docker.container`,
+`docker.image`...) are imported the first time they are used, the last
+scenario shows the cost of the first use of `docker.container`.
+
+    python benchmarks/import_time.py
+"""
+
+import re
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "import python_on_whales": "import python_on_whales",
+    "DockerClient()": "import python_on_whales; python_on_whales.DockerClient()",
+    "docker.container": (
+        "import python_on_whales; python_on_whales.DockerClient().container"
+    ),
+}
+RUNS = 10
+
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def run_with_import_time(code):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stderr=subprocess.PIPE,
+        check=True,
+        text=True,
+    )
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match is not None:
+            yield match.group(4), len(match.group(3)) == 1, int(match.group(2))
+
+
+def measure(code, startup_modules):
+    """Returns the import time, in seconds, and the modules imported.
+
+    The modules imported when the interpreter starts are not counted.
+    """
+    total_us = 0
+    modules = []
+    for module, top_level, cumulative_us in run_with_import_time(code):
+        if module in startup_modules:
+            continue
+        modules.append(module)
+        if top_level:
+            # its cumulative time includes the modules it imported
+            total_us += cumulative_us
+    return total_us / 1e6, modules
+
+
+def main():
+    startup_modules = {x for x, _, _ in run_with_import_time("pass")}
+    for name, code in SCENARIOS.items():
+        durations = []
+        for _ in range(RUNS):
+            duration, modules = measure(code, startup_modules)
+            durations.append(duration)
+        own_modules = [x for x in modules if x.startswith("python_on_whales")]
+        print(
+            f"{name:<26} {statistics.median(durations) * 1000:>8.1f} ms "
+            f"{len(modules):>5} modules ({len(own_modules)} of python_on_whales)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Measures how many inspect results per second are parsed, per object type.
+
+The inspect results are the json files of `tests/python_on_whales/components/jsons`,
+put in an array indented like the output of `docker <type> inspect`. It compares
+decoding the array with `json.loads` and validating each dict (the previous
+implementation) with validating each element of the array with
+`model_validate_json`, without decoding it first. Containers and volumes
+are still parsed from dicts: pydantic builds each `Path` twice when validating
+json, which makes `model_validate_json` slower for them.
+
+    python benchmarks/inspect_parsing.py
+"""
+
+import json
+import timeit
+
+from python_on_whales.components.container.models import ContainerInspectResult
+from python_on_whales.components.image.models import ImageInspectResult
+from python_on_whales.components.network.models import NetworkInspectResult
+from python_on_whales.components.node.models import NodeInspectResult
+from python_on_whales.components.service.models import ServiceInspectResult
+from python_on_whales.components.task.models import TaskInspectResult
+from python_on_whales.components.volume.models import VolumeInspectResult
+from python_on_whales.test_utils import get_all_jsons
+from python_on_whales.utils import split_json_array
+
+ROWS = 200
+
+MODELS = {
+    "containers": ContainerInspectResult,
+    "images": ImageInspectResult,
+    "networks": NetworkInspectResult,
+    "nodes": NodeInspectResult,
+    "services": ServiceInspectResult,
+    "tasks": TaskInspectResult,
+    "volumes": VolumeInspectResult,
+}
+
+
+def main():
+    for object_type, model in MODELS.items():
+        samples = [json.loads(x.read_text()) for x in get_all_jsons(object_type)]
+        rows = [samples[i % len(samples)] for i in range(ROWS)]
+        json_array = (json.dumps(rows, indent=4) + "\n").encode()
+
+        def from_dicts():
+            return [model(**x) for x in json.loads(json_array.decode())]
+
+        def from_bytes():
+            return [model.model_validate_json(x) for x in split_json_array(json_array)]
+
+        assert from_dicts() == from_bytes()
+        print(object_type)
+        for name, parse in [("json.loads + dicts", from_dicts), ("bytes", from_bytes)]:
+            duration = min(timeit.repeat(parse, number=1, repeat=5))
+            print(f"    {name:<20} {ROWS / duration:>12,.0f} results/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Measures the cost of a cold inspect when only a few attributes are read.
+
+The inspect results are the json files of `tests/python_on_whales/components/jsons`.
+It compares validating the whole document, like before the sub-models were
+validated lazily, with reading a single nested attribute.
+
+    python benchmarks/lazy_inspect.py
+"""
+
+import json
+import timeit
+
+from python_on_whales.components.container.models import ContainerInspectResult
+from python_on_whales.components.node.models import NodeInspectResult
+from python_on_whales.components.service.models import ServiceInspectResult
+from python_on_whales.test_utils import get_all_jsons
+
+ROWS = 200
+
+CASES = [
+    ("containers", ContainerInspectResult, lambda x: x.state.status),
+    ("services", ServiceInspectResult, lambda x: x.spec.labels),
+    ("nodes", NodeInspectResult, lambda x: x.status.state),
+]
+
+
+def main():
+    for object_type, model, read_attribute in CASES:
+        samples = [json.loads(x.read_text()) for x in get_all_jsons(object_type)]
+        rows = [samples[i % len(samples)] for i in range(ROWS)]
+
+        def validate_everything():
+            for json_object in rows:
+                model(**json_object)._validate_pending_sub_models()
+
+        def read_one_attribute():
+            for json_object in rows:
+                read_attribute(model(**json_object))
+
+        print(object_type)
+        for name, parse in [
+            ("everything", validate_everything),
+            ("one attribute", read_one_attribute),
+        ]:
+            duration = min(timeit.repeat(parse, number=1, repeat=5))
+            print(f"    {name:<20} {ROWS / duration:>12,.0f} results/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Measures how many commands per second can be launched, depending on the memory used.
+
+Each scenario runs in a new interpreter which allocates (and touches) a
+buffer to reach the given memory usage, then runs `true` many times with
+`python_on_whales.utils.run`: once with the spawn server, started before the
+allocation, and once without it, where each command forks the interpreter.
+
+    python benchmarks/spawn.py
+    python benchmarks/spawn.py 100 1000 4000
+"""
+
+import subprocess
+import sys
+
+SCENARIO = """
+import time
+from python_on_whales import spawn_server
+from python_on_whales.utils import run
+
+if {use_spawn_server}:
+    spawn_server.start_spawn_server()
+buffer = bytearray({size_mb} * 1024 * 1024)
+# the pages are only really allocated when they are written
+buffer[::4096] = b"\\x01" * len(range(0, len(buffer), 4096))
+
+run(["true"])
+start = time.perf_counter()
+for _ in range({launches}):
+    run(["true"])
+print({launches} / (time.perf_counter() - start))
+"""
+DEFAULT_SIZES_MB = [100, 4000]
+LAUNCHES = 300
+
+
+def launches_per_second(size_mb, use_spawn_server):
+    code = SCENARIO.format(
+        size_mb=size_mb, use_spawn_server=use_spawn_server, launches=LAUNCHES
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], stdout=subprocess.PIPE, check=True, text=True
+    )
+    return float(result.stdout)
+
+
+def main():
+    sizes_mb = [int(x) for x in sys.argv[1:]] or DEFAULT_SIZES_MB
+    print(f"{'RSS':>8} {'fork (launches/s)':>18} {'spawn server (launches/s)':>26}")
+    for size_mb in sizes_mb:
+        fork = launches_per_second(size_mb, use_spawn_server=False)
+        spawn_server = launches_per_second(size_mb, use_spawn_server=True)
+        print(f"{size_mb:>5} MB {fork:>18.0f} {spawn_server:>26.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Measures how many `docker stats` rows per second `ContainerStats` parses.
+
+The rows are the json files of `tests/python_on_whales/components/jsons/stats`.
+It compares the current parser with the previous implementation, which built
+a `pydantic.TypeAdapter(pydantic.ByteSize)` for each of the six sizes of a row.
+
+    python benchmarks/stats_parsing.py
+"""
+
+import json
+import timeit
+
+import pydantic
+
+from python_on_whales.components.container.cli_wrapper import ContainerStats
+from python_on_whales.test_utils import get_all_jsons
+
+ROWS = 1000
+
+
+def parse_with_type_adapters(json_dict):
+    def parse(value):
+        return pydantic.TypeAdapter(pydantic.ByteSize).validate_python(value)
+
+    return (
+        parse(json_dict["BlockIO"].split("/")[0]),
+        parse(json_dict["BlockIO"].split("/")[1]),
+        float(json_dict["CPUPerc"][:-1]),
+        float(json_dict["MemPerc"][:-1]),
+        parse(json_dict["MemUsage"].split("/")[0]),
+        parse(json_dict["MemUsage"].split("/")[1]),
+        parse(json_dict["NetIO"].split("/")[0]),
+        parse(json_dict["NetIO"].split("/")[1]),
+    )
+
+
+def main():
+    samples = [json.loads(x.read_text()) for x in get_all_jsons("stats")]
+    rows = [samples[i % len(samples)] for i in range(ROWS)]
+
+    for name, parse in [
+        ("TypeAdapter per field (previous)", parse_with_type_adapters),
+        ("ContainerStats", ContainerStats),
+    ]:
+        duration = min(
+            timeit.repeat(lambda: [parse(x) for x in rows], number=1, repeat=5)
+        )
+        print(f"{name:<35} {ROWS / duration:>12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Measures the per-line overhead of streaming the output of processes.
+
+It compares the selector-based reader of `stream_stdout_and_stderr` with the
+previous implementation, which started two threads per process and passed
+each line through a `queue.Queue`. Two scenarios are measured: one process
+printing many lines, and many processes printing lines at the same time,
+like when following the logs of many containers.
+
+    python benchmarks/stream_lines.py
+"""
+
+import subprocess
+import sys
+import time
+from queue import Queue
+from threading import Thread
+
+from python_on_whales.utils import iter_pipes_lines, stream_stdout_and_stderr
+
+PRINTER = "import sys\nsys.stdout.write('some log line of a container\\n' * {})"
+
+
+def printer_cmd(lines):
+    return [sys.executable, "-c", PRINTER.format(lines)]
+
+
+def reader(pipe, pipe_name, queue):
+    try:
+        with pipe:
+            for line in iter(pipe.readline, b""):
+                queue.put((pipe_name, line))
+    finally:
+        queue.put(None)
+
+
+def threads_and_queue(processes):
+    queue = Queue()
+    for process in processes:
+        for pipe, name in [(process.stdout, "stdout"), (process.stderr, "stderr")]:
+            Thread(target=reader, args=[pipe, name, queue], daemon=True).start()
+    count = 0
+    for _ in range(2 * len(processes)):
+        for _ in iter(queue.get, None):
+            count += 1
+    return count
+
+
+def selector(processes):
+    pipes = {}
+    for process in processes:
+        pipes[process.stdout] = "stdout"
+        pipes[process.stderr] = "stderr"
+    return sum(1 for _ in iter_pipes_lines(pipes))
+
+
+def measure(name, function, processes_count, lines):
+    processes = [
+        subprocess.Popen(
+            printer_cmd(lines), stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        for _ in range(processes_count)
+    ]
+    start = time.perf_counter()
+    count = function(processes)
+    duration = time.perf_counter() - start
+    for process in processes:
+        process.wait()
+    assert count == processes_count * lines
+    print(
+        f"{name:<22} {processes_count:>4} processes "
+        f"{count / duration:>12,.0f} lines/s {duration / count * 1e9:>8,.0f} ns/line"
+    )
+
+
+def main():
+    for processes_count, lines in [(1, 1_000_000), (300, 5_000)]:
+        measure("threads and queue", threads_and_queue, processes_count, lines)
+        measure("selector", selector, processes_count, lines)
+
+    start = time.perf_counter()
+    count = sum(1 for _ in stream_stdout_and_stderr(printer_cmd(1_000_000)))
+    duration = time.perf_counter() - start
+    print(f"stream_stdout_and_stderr {count / duration:>18,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,41 +1,111 @@
-from .client_config import ClientNotFoundError
-from .components.buildx.cli_wrapper import Builder
-from .components.config.cli_wrapper import Config
-from .components.container.cli_wrapper import Container, ContainerStats
-from .components.context.cli_wrapper import (
-    Context,
-    DockerContextConfig,
-    KubernetesContextConfig,
-)
-from .components.image.cli_wrapper import Image
-from .components.network.cli_wrapper import Network
-from .components.node.cli_wrapper import Node
-from .components.plugin.cli_wrapper import Plugin
-from .components.pod.cli_wrapper import Pod
-from .components.secret.cli_wrapper import Secret
-from .components.service.cli_wrapper import Service
-from .components.stack.cli_wrapper import Stack
-from .components.system.cli_wrapper import SystemInfo
-from .components.task.cli_wrapper import Task
-from .components.volume.cli_wrapper import Volume
-from .docker_client import DockerClient, Version
-from .exceptions import DockerException
-
-# alias
-docker = DockerClient(client_type="docker")
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .async_docker_client import AsyncDockerClient
+    from .client_config import ClientNotFoundError
+    from .components.buildx.cli_wrapper import Builder
+    from .components.config.cli_wrapper import Config
+    from .components.container.cli_wrapper import (
+        Container,
+        ContainerStats,
+        ContainerStatsHistory,
+        ContainerStatsSeries,
+        ContainerSummary,
+    )
+    from .components.context.cli_wrapper import (
+        Context,
+        DockerContextConfig,
+        KubernetesContextConfig,
+    )
+    from .components.image.cli_wrapper import Image, ImageSummary
+    from .components.network.cli_wrapper import Network
+    from .components.node.cli_wrapper import Node
+    from .components.plugin.cli_wrapper import Plugin
+    from .components.pod.cli_wrapper import Pod
+    from .components.secret.cli_wrapper import Secret
+    from .components.service.cli_wrapper import Service
+    from .components.stack.cli_wrapper import Stack
+    from .components.system.cli_wrapper import SystemInfo
+    from .components.task.cli_wrapper import Task
+    from .components.volume.cli_wrapper import Volume
+    from .docker_client import DockerClient, Version
+    from .exceptions import DockerException
+    from .log_cursor import LogCursor, LogRecord
+
+    docker: DockerClient
+
+# The modules are imported when one of their attributes is used for the
+# first time, so that `import python_on_whales` stays fast.
+_LAZY_ATTRIBUTES = {
+    "AsyncDockerClient": ".async_docker_client",
+    "Builder": ".components.buildx.cli_wrapper",
+    "ClientNotFoundError": ".client_config",
+    "Config": ".components.config.cli_wrapper",
+    "Container": ".components.container.cli_wrapper",
+    "ContainerStats": ".components.container.cli_wrapper",
+    "ContainerStatsHistory": ".components.container.cli_wrapper",
+    "ContainerStatsSeries": ".components.container.cli_wrapper",
+    "ContainerSummary": ".components.container.cli_wrapper",
+    "Context": ".components.context.cli_wrapper",
+    "DockerClient": ".docker_client",
+    "DockerContextConfig": ".components.context.cli_wrapper",
+    "DockerException": ".exceptions",
+    "Image": ".components.image.cli_wrapper",
+    "ImageSummary": ".components.image.cli_wrapper",
+    "KubernetesContextConfig": ".components.context.cli_wrapper",
+    "LogCursor": ".log_cursor",
+    "LogRecord": ".log_cursor",
+    "Network": ".components.network.cli_wrapper",
+    "Node": ".components.node.cli_wrapper",
+    "Plugin": ".components.plugin.cli_wrapper",
+    "Pod": ".components.pod.cli_wrapper",
+    "Secret": ".components.secret.cli_wrapper",
+    "Service": ".components.service.cli_wrapper",
+    "Stack": ".components.stack.cli_wrapper",
+    "SystemInfo": ".components.system.cli_wrapper",
+    "Task": ".components.task.cli_wrapper",
+    "Version": ".docker_client",
+    "Volume": ".components.volume.cli_wrapper",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name == "docker":
+        # alias
+        value = __getattr__("DockerClient")(client_type="docker")
+    elif name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES) + ["docker"])
+
 
 __all__ = [
+    "AsyncDockerClient",
     "Builder",
     "ClientNotFoundError",
     "Config",
     "Container",
     "ContainerStats",
+    "ContainerStatsHistory",
+    "ContainerStatsSeries",
+    "ContainerSummary",
     "Context",
     "DockerClient",
     "DockerContextConfig",
     "DockerException",
     "Image",
+    "ImageSummary",
     "KubernetesContextConfig",
+    "LogCursor",
+    "LogRecord",
     "Network",
     "Node",
     "Plugin",
@@ -0,0 +1,535 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+)
+
+# the components have circular imports between them, importing the docker
+# client first loads them in an order that works.
+import python_on_whales.docker_client
+from python_on_whales.client_config import (
+    ClientConfig,
+    DockerCLICaller,
+    ReloadableObjectFromJson,
+)
+from python_on_whales.components.compose.cli_wrapper import ComposeCLI
+from python_on_whales.components.compose.models import ComposeEvent
+from python_on_whales.components.container.cli_wrapper import (
+    Container,
+    ContainerCLI,
+    ValidContainer,
+)
+from python_on_whales.components.image.cli_wrapper import Image, ImageCLI
+from python_on_whales.components.system.cli_wrapper import SystemCLI
+from python_on_whales.components.system.models import DockerEvent
+from python_on_whales.exceptions import NoSuchImage
+from python_on_whales.utils import (
+    AsyncProcessStream,
+    ValidPath,
+    format_mapping_for_cli,
+    format_signal_arg,
+    format_time_arg,
+    run_async,
+    split_json_array,
+    stream_stdout_and_stderr_async,
+    to_list,
+)
+
+
+def _from_inspect_json(
+    cls: Type[ReloadableObjectFromJson],
+    client_config: ClientConfig,
+    json_object: Union[Dict[str, Any], bytes],
+):
+    docker_object = cls(client_config, "", is_immutable_id=True)
+    inspect_result = docker_object._parse_json_object_or_report(json_object)
+    docker_object._immutable_id = getattr(inspect_result, docker_object._id_in_inspect)
+    docker_object._set_inspect_result(inspect_result)
+    return docker_object
+
+
+def _in_executor(function: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+    @functools.wraps(function)
+    async def run_in_executor(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(function, *args, **kwargs)
+        )
+
+    return run_in_executor
+
+
+class AsyncDockerCLICaller(DockerCLICaller):
+    """Base class of the async CLIs.
+
+    The commands that are the most used are implemented natively with
+    `asyncio.create_subprocess_exec`. All the other methods of the
+    synchronous CLI (`_sync_cli_class`) are still available, they're awaitable
+    and run in the default executor of the event loop.
+    """
+
+    _sync_cli_class: Type[DockerCLICaller] = DockerCLICaller
+
+    def __init__(
+        self, client_config: ClientConfig, sync_cli: Optional[DockerCLICaller] = None
+    ):
+        super().__init__(client_config)
+        if sync_cli is None:
+            sync_cli = self._sync_cli_class(client_config)
+        self._sync_cli = sync_cli
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        sync_attribute = getattr(self._sync_cli, name)
+        if isinstance(sync_attribute, DockerCLICaller):
+            # nested CLI, like docker.buildx.imagetools
+            async_cli = AsyncDockerCLICaller(self.client_config, sync_attribute)
+        elif callable(sync_attribute):
+            async_cli = _in_executor(sync_attribute)
+        else:
+            return sync_attribute
+        setattr(self, name, async_cli)
+        return async_cli
+
+
+class AsyncContainerCLI(AsyncDockerCLICaller):
+    _sync_cli_class = ContainerCLI
+
+    async def execute(
+        self,
+        container: ValidContainer,
+        command: Sequence[str],
+        detach: bool = False,
+        envs: Mapping[str, str] = {},
+        env_files: Union[ValidPath, Iterable[ValidPath]] = (),
+        interactive: bool = False,
+        privileged: bool = False,
+        user: Optional[str] = None,
+        workdir: Optional[ValidPath] = None,
+        stream: bool = False,
+        detach_keys: Optional[str] = None,
+    ) -> Union[None, str, AsyncProcessStream]:
+        """Execute a command inside a container.
+
+        Same as `docker.container.execute(...)`. With `stream=True`,
+        an `AsyncProcessStream` is returned, use `async for` to iterate
+        over it.
+        """
+        if isinstance(command, str):
+            raise TypeError(
+                "The second argument ('command') should be a sequence of strings."
+            )
+        if detach and stream:
+            raise ValueError(
+                "You can't detach and stream at the same time. It's not compatible."
+            )
+        full_cmd = self.docker_cmd + ["exec"]
+        full_cmd.add_flag("--detach", detach)
+        full_cmd.add_simple_arg("--detach-keys", detach_keys)
+        full_cmd.add_args_mapping("--env", envs)
+        full_cmd.add_args_iterable_or_single("--env-file", env_files)
+        full_cmd.add_flag("--interactive", interactive)
+        full_cmd.add_flag("--privileged", privileged)
+        full_cmd.add_simple_arg("--user", user)
+        full_cmd.add_simple_arg("--workdir", workdir)
+        full_cmd.append(container)
+        full_cmd.extend(command)
+
+        if stream:
+            return await stream_stdout_and_stderr_async(
+                full_cmd, pipe_stdin=interactive
+            )
+        result = await run_async(full_cmd)
+        if detach:
+            return None
+        return result
+
+    async def inspect(
+        self, x: Union[ValidContainer, Iterable[ValidContainer]]
+    ) -> Union[Container, List[Container]]:
+        """Returns a container object from a name or ID.
+
+        All the containers are inspected with a single command. Note that
+        reading the attributes of the returned objects later on may
+        refresh them synchronously, like with the regular client.
+        """
+        references = to_list(x)
+        if references == []:
+            return []
+        full_cmd = self.docker_cmd + ["container", "inspect", *references]
+        containers = [
+            _from_inspect_json(Container, self.client_config, json_object)
+            for json_object in split_json_array(await run_async(full_cmd))
+        ]
+        if isinstance(x, Iterable) and not isinstance(x, str):
+            return containers
+        return containers[0]
+
+    async def kill(
+        self,
+        containers: Union[ValidContainer, Iterable[ValidContainer]],
+        signal: Optional[Union[int, str]] = None,
+    ) -> None:
+        """Kill one or more containers."""
+        containers = to_list(containers)
+        if containers == []:
+            return
+        full_cmd = self.docker_cmd + ["container", "kill"]
+        full_cmd.add_simple_arg("--signal", format_signal_arg(signal))
+        full_cmd += containers
+        await run_async(full_cmd)
+
+    async def list(
+        self, all: bool = False, filters: Iterable[Any] = ()
+    ) -> List[Container]:
+        """List the containers on the host."""
+        full_cmd = self.docker_cmd + ["container", "list", "-q", "--no-trunc"]
+        full_cmd.add_flag("--all", all)
+        full_cmd.add_args_iterable("--filter", (f"{f[0]}={f[1]}" for f in filters))
+        return [
+            Container(self.client_config, x, is_immutable_id=True)
+            for x in (await run_async(full_cmd)).splitlines()
+        ]
+
+    async def logs(
+        self,
+        container: ValidContainer,
+        *,
+        details: bool = False,
+        since: Union[None, datetime, timedelta] = None,
+        tail: Optional[int] = None,
+        timestamps: bool = False,
+        until: Union[None, datetime, timedelta] = None,
+        follow: bool = False,
+        stream: bool = False,
+    ) -> Union[str, AsyncProcessStream]:
+        """Returns the logs of a container as a string or an async iterator.
+
+        See `docker.container.logs(...)` for the arguments. With `stream=True`,
+        an `AsyncProcessStream` yielding `(source, content)` tuples is returned.
+        """
+        full_cmd = self.docker_cmd + ["container", "logs"]
+        full_cmd.add_flag("--details", details)
+        full_cmd.add_simple_arg("--since", format_time_arg(since))
+        full_cmd.add_simple_arg("--tail", tail)
+        full_cmd.add_flag("--timestamps", timestamps)
+        full_cmd.add_simple_arg("--until", format_time_arg(until))
+        full_cmd.add_flag("--follow", follow)
+        full_cmd.append(container)
+
+        iterator = await stream_stdout_and_stderr_async(full_cmd)
+        if stream:
+            return iterator
+        return "".join([line.decode() async for _, line in iterator])
+
+    async def remove(
+        self,
+        containers: Union[ValidContainer, Iterable[ValidContainer]],
+        force: bool = False,
+        volumes: bool = False,
+    ) -> None:
+        """Removes one or more containers."""
+        containers = to_list(containers)
+        if containers == []:
+            return
+        full_cmd = self.docker_cmd + ["container", "rm"]
+        full_cmd.add_flag("--force", force)
+        full_cmd.add_flag("--volumes", volumes)
+        full_cmd += containers
+        await run_async(full_cmd)
+
+    async def restart(
+        self,
+        containers: Union[ValidContainer, Iterable[ValidContainer]],
+        time: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """Restarts one or more containers."""
+        containers = to_list(containers)
+        if containers == []:
+            return
+        full_cmd = self.docker_cmd + ["container", "restart"]
+        if isinstance(time, timedelta):
+            time = int(time.total_seconds())
+        full_cmd.add_simple_arg("--time", time)
+        full_cmd += containers
+        await run_async(full_cmd)
+
+    async def start(
+        self, containers: Union[ValidContainer, Iterable[ValidContainer]]
+    ) -> None:
+        """Starts one or more created/stopped containers, without attaching."""
+        containers = to_list(containers)
+        if containers == []:
+            return
+        await run_async(self.docker_cmd + ["container", "start", *containers])
+
+    async def stop(
+        self,
+        containers: Union[ValidContainer, Iterable[ValidContainer]],
+        time: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """Stops one or more running containers."""
+        containers = to_list(containers)
+        if containers == []:
+            return
+        full_cmd = self.docker_cmd + ["container", "stop"]
+        if isinstance(time, timedelta):
+            time = int(time.total_seconds())
+        full_cmd.add_simple_arg("--time", time)
+        full_cmd += containers
+        await run_async(full_cmd)
+
+    async def wait(
+        self, x: Union[ValidContainer, Iterable[ValidContainer]]
+    ) -> Union[int, List[int]]:
+        """Waits until one or more containers stop, then returns their exit codes."""
+        containers = to_list(x)
+        if containers == []:
+            return []
+        exit_codes = await run_async(
+            self.docker_cmd + ["container", "wait", *containers]
+        )
+        if isinstance(x, Iterable) and not isinstance(x, str):
+            return [int(exit_code) for exit_code in exit_codes.splitlines()]
+        return int(exit_codes)
+
+
+class AsyncImageCLI(AsyncDockerCLICaller):
+    _sync_cli_class = ImageCLI
+
+    async def exists(self, x: str) -> bool:
+        """Returns `True` if the image exists. `False` otherwise."""
+        try:
+            await self.inspect(x)
+        except NoSuchImage:
+            return False
+        return True
+
+    async def inspect(self, x: Union[str, Iterable[str]]) -> Union[Image, List[Image]]:
+        """Creates `python_on_whales.Image` objects, with a single command."""
+        references = to_list(x)
+        if references == []:
+            return []
+        full_cmd = self.docker_cmd + ["image", "inspect", *references]
+        images = [
+            _from_inspect_json(Image, self.client_config, json_object)
+            for json_object in split_json_array(await run_async(full_cmd))
+        ]
+        if isinstance(x, str):
+            return images[0]
+        return images
+
+    async def list(
+        self,
+        repository_or_tag: Optional[str] = None,
+        filters: Iterable[Any] = (),
+        all: bool = False,
+    ) -> List[Image]:
+        """Returns the list of Docker images present on the machine."""
+        full_cmd = self.docker_cmd + ["image", "list", "--quiet", "--no-trunc"]
+        full_cmd.add_flag("--all", all)
+        full_cmd.add_args_iterable("--filter", (f"{f[0]}={f[1]}" for f in filters))
+        if repository_or_tag is not None:
+            full_cmd.append(repository_or_tag)
+        ids = set((await run_async(full_cmd)).splitlines())
+        return [Image(self.client_config, x, is_immutable_id=True) for x in ids]
+
+    async def pull(
+        self,
+        x: Union[str, Iterable[str]],
+        quiet: bool = False,
+        platform: Optional[str] = None,
+    ) -> Union[Image, List[Image]]:
+        """Pull one or more docker image(s).
+
+        When multiple images are given, they are pulled concurrently.
+        """
+        images = list(OrderedDict.fromkeys(to_list(x)))
+        if images == []:
+            return []
+
+        async def pull_single_tag(image_name: str) -> None:
+            full_cmd = self.docker_cmd + ["image", "pull"]
+            full_cmd.add_flag("--quiet", quiet)
+            if platform:
+                full_cmd.append(f"--platform={platform}")
+            full_cmd.append(image_name)
+            await run_async(full_cmd, capture_stdout=quiet, capture_stderr=quiet)
+
+        await asyncio.gather(*(pull_single_tag(image) for image in images))
+        return await self.inspect(x if isinstance(x, str) else images)
+
+    async def remove(
+        self,
+        x: Union[str, Image, Iterable[Union[str, Image]]],
+        force: bool = False,
+        prune: bool = True,
+    ) -> None:
+        """Remove one or more docker images."""
+        images = to_list(x)
+        if images == []:
+            return
+        full_cmd = self.docker_cmd + ["image", "rm"]
+        full_cmd.add_flag("--force", force)
+        full_cmd.add_flag("--no-prune", not prune)
+        full_cmd.extend(images)
+        await run_async(full_cmd)
+
+    async def tag(self, source_image: Union[Image, str], new_tag: str) -> None:
+        """Adds a tag to a Docker image."""
+        await run_async(self.docker_cmd + ["image", "tag", str(source_image), new_tag])
+
+
+class AsyncComposeCLI(AsyncDockerCLICaller):
+    _sync_cli_class = ComposeCLI
+
+    async def events(self, services: List[str] = []) -> AsyncIterator[ComposeEvent]:
+        """Async iterator over the Docker Compose events for the specified services."""
+        full_cmd = self.docker_compose_cmd + ["events", "--json"] + services
+        async for stream_origin, stream_content in await stream_stdout_and_stderr_async(
+            full_cmd
+        ):
+            if stream_origin == "stdout":
+                yield ComposeEvent(**json.loads(stream_content))
+
+    async def logs(
+        self,
+        services: Union[str, List[str]] = [],
+        tail: Optional[str] = None,
+        follow: bool = False,
+        no_log_prefix: bool = False,
+        timestamps: bool = False,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        stream: bool = False,
+    ) -> Union[str, AsyncProcessStream]:
+        """View output from containers, as a string or an async iterator."""
+        full_cmd = self.docker_compose_cmd + ["logs", "--no-color"]
+        full_cmd.add_simple_arg("--tail", tail)
+        full_cmd.add_flag("--follow", follow)
+        full_cmd.add_flag("--no-log-prefix", no_log_prefix)
+        full_cmd.add_flag("--timestamps", timestamps)
+        full_cmd.add_simple_arg("--since", since)
+        full_cmd.add_simple_arg("--until", until)
+        full_cmd += to_list(services)
+
+        iterator = await stream_stdout_and_stderr_async(full_cmd)
+        if stream:
+            return iterator
+        return "".join([line.decode() async for _, line in iterator])
+
+    async def ps(
+        self, services: Optional[List[str]] = None, all: bool = False
+    ) -> List[Container]:
+        """Returns the containers that were created by the current project."""
+        full_cmd = self.docker_compose_cmd + ["ps", "--quiet"]
+        full_cmd.add_flag("--all", all)
+        if services:
+            full_cmd += services
+        ids = (await run_async(full_cmd)).splitlines()
+        if len(ids) > 0 and "experimental" in ids[0]:
+            ids.pop(0)
+        return [Container(self.client_config, x, is_immutable_id=True) for x in ids]
+
+
+class AsyncSystemCLI(AsyncDockerCLICaller):
+    _sync_cli_class = SystemCLI
+
+    async def events(
+        self,
+        since: Union[None, datetime, timedelta] = None,
+        until: Union[None, datetime, timedelta] = None,
+        filters: Dict[str, str] = {},
+    ) -> AsyncIterator[DockerEvent]:
+        """Async iterator over the docker events, see `docker.system.events(...)`."""
+        full_cmd = self.docker_cmd + ["system", "events", "--format", "{{json .}}"]
+        full_cmd.add_simple_arg("--since", format_time_arg(since))
+        full_cmd.add_simple_arg("--until", format_time_arg(until))
+        full_cmd.add_args_iterable_or_single(
+            "--filter", format_mapping_for_cli(filters)
+        )
+        async for stream_origin, stream_content in await stream_stdout_and_stderr_async(
+            full_cmd
+        ):
+            if stream_origin == "stdout":
+                yield DockerEvent(**json.loads(stream_content))
+
+
+class AsyncDockerClient(DockerCLICaller):
+    """Creates a Docker client usable with asyncio.
+
+    It takes the same arguments as `python_on_whales.DockerClient`.
+
+    ```python
+    import asyncio
+    from python_on_whales.async_docker_client import AsyncDockerClient
+
+    async def main():
+        docker = AsyncDockerClient()
+        containers = await docker.container.list()
+        async for source, line in await docker.container.logs(
+            containers[0], follow=True, stream=True
+        ):
+            print(line)
+
+    asyncio.run(main())
+    ```
+
+    The most common commands of `container`, `image`, `compose` and `system`
+    are run with `asyncio.create_subprocess_exec` and streams (`logs`,
+    `events`, `execute(..., stream=True)`) are async iterators read by the
+    event loop. No thread is used for those. All the other methods of the
+    synchronous client are still there and awaitable, but they run in
+    the default executor of the event loop.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._sync_client = python_on_whales.docker_client.DockerClient(*args, **kwargs)
+        super().__init__(self._sync_client.client_config)
+
+        self.compose = AsyncComposeCLI(self.client_config)
+        self.container = AsyncContainerCLI(self.client_config)
+        self.image = AsyncImageCLI(self.client_config)
+        self.system = AsyncSystemCLI(self.client_config)
+
+        # aliases
+        self.execute = self.container.execute
+        self.images = self.image.list
+        self.kill = self.container.kill
+        self.logs = self.container.logs
+        self.ps = self.container.list
+        self.pull = self.image.pull
+        self.remove = self.container.remove
+        self.restart = self.container.restart
+        self.start = self.container.start
+        self.stop = self.container.stop
+        self.tag = self.image.tag
+        self.wait = self.container.wait
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        sync_attribute = getattr(self._sync_client, name)
+        if isinstance(sync_attribute, DockerCLICaller):
+            async_attribute = AsyncDockerCLICaller(self.client_config, sync_attribute)
+        else:
+            async_attribute = _in_executor(sync_attribute)
+        setattr(self, name, async_attribute)
+        return async_attribute
@@ -1,19 +1,81 @@
 import json
+import math
+import os
 import shutil
 import tempfile
+import threading
+import time
 import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Literal, Mapping, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import pydantic
 
 from . import utils
-from .utils import ValidPath, run, to_list
+from .exceptions import (
+    NoSuchContainer,
+    NoSuchImage,
+    NoSuchNetwork,
+    NoSuchService,
+    NoSuchVolume,
+)
+from .utils import ValidPath, to_docker_camel, to_list
+
+if TYPE_CHECKING:
+    from .components.system.cli_wrapper import EventBus
+    from .engine_api import EngineAPIClient
 
 CACHE_VALIDITY_PERIOD = 0.01
 
+# protects the lazy creation of the helpers shared by all the users of a ClientConfig
+_LAZY_INIT_LOCK = threading.RLock()
+
+# the start time of the frozen snapshots of the current thread (or asyncio
+# task), by id of the client config.
+_SNAPSHOT_STARTS: ContextVar[Dict[int, float]] = ContextVar(
+    "_SNAPSHOT_STARTS", default={}
+)
+
+# the fields used to build `docker_cmd` and `docker_compose_cmd`
+_COMMAND_FIELDS = frozenset(
+    [
+        "config",
+        "context",
+        "debug",
+        "host",
+        "log_level",
+        "tls",
+        "tlscacert",
+        "tlscert",
+        "tlskey",
+        "tlsverify",
+        "compose_files",
+        "compose_profiles",
+        "compose_env_file",
+        "compose_env_files",
+        "compose_project_name",
+        "compose_project_directory",
+        "compose_compatibility",
+        "client_call",
+    ]
+)
+
 
 class ParsingError(Exception):
     pass
@@ -75,7 +137,101 @@ class ClientConfig:
     compose_compatibility: Optional[bool] = None
     client_call: List[str] = field(default_factory=lambda: ["docker"])
     client_type: Literal["docker", "podman", "nerdctl", "unknown"] = "unknown"
+    transport: Literal["cli", "engine_api"] = "cli"
+    cache_validity_period: Optional[float] = None
+    cache_validity_periods: Mapping[str, float] = field(default_factory=dict)
+    event_driven_cache: bool = False
+    inspect_batch_window: Optional[float] = None
     _client_call_with_path: Optional[List[Union[Path, str]]] = None
+    _engine_api: Optional["EngineAPIClient"] = field(
+        default=None, compare=False, repr=False
+    )
+    _engine_api_resolved: bool = field(default=False, compare=False, repr=False)
+    _inspect_cache: Optional["EventDrivenInspectCache"] = field(
+        default=None, compare=False, repr=False
+    )
+    _inspect_broker: Optional["InspectBroker"] = field(
+        default=None, compare=False, repr=False
+    )
+    _event_bus: Optional["EventBus"] = field(default=None, compare=False, repr=False)
+    _command_cache: Dict[str, Tuple[List[Union[Path, str]], Command]] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _COMMAND_FIELDS:
+            # the commands are rebuilt the next time they're needed.
+            # Note that mutating a list in place, like `compose_files.append()`,
+            # isn't detected, the attribute must be assigned again.
+            super().__setattr__("_command_cache", {})
+            if name == "client_call":
+                super().__setattr__("_client_call_with_path", None)
+
+    def get_event_bus(self) -> "EventBus":
+        """Returns the event bus of this client, creating it if needed."""
+        from python_on_whales.components.system.cli_wrapper import EventBus
+
+        with _LAZY_INIT_LOCK:
+            if self._event_bus is None:
+                self._event_bus = EventBus(self)
+        return self._event_bus
+
+    def get_inspect_cache(self) -> Optional["EventDrivenInspectCache"]:
+        """Returns the event-driven inspect cache, starting it if needed.
+
+        Returns `None` if `event_driven_cache` is not enabled.
+        """
+        if not self.event_driven_cache:
+            return None
+        with _LAZY_INIT_LOCK:
+            if self._inspect_cache is None:
+                self._inspect_cache = EventDrivenInspectCache(self)
+                self._inspect_cache.start()
+        return self._inspect_cache
+
+    def get_inspect_broker(self) -> Optional["InspectBroker"]:
+        """Returns the broker coalescing concurrent inspect calls.
+
+        Returns `None` if `inspect_batch_window` is not set.
+        """
+        if self.inspect_batch_window is None:
+            return None
+        with _LAZY_INIT_LOCK:
+            if self._inspect_broker is None:
+                self._inspect_broker = InspectBroker(self.inspect_batch_window)
+        return self._inspect_broker
+
+    def get_cache_validity_period(self, object_type: str) -> float:
+        """Returns, in seconds, how long an inspect result of this type can be reused.
+
+        `object_type` is the name of the class, like `"Container"` or `"Image"`.
+        """
+        if object_type in self.cache_validity_periods:
+            return self.cache_validity_periods[object_type]
+        if self.cache_validity_period is not None:
+            return self.cache_validity_period
+        return CACHE_VALIDITY_PERIOD
+
+    @contextmanager
+    def frozen_snapshot(self) -> Iterator[None]:
+        snapshot_starts = _SNAPSHOT_STARTS.get()
+        if id(self) in snapshot_starts:
+            # nested snapshot, the outer one is used
+            yield
+            return
+        token = _SNAPSHOT_STARTS.set({**snapshot_starts, id(self): time.monotonic()})
+        try:
+            yield
+        finally:
+            _SNAPSHOT_STARTS.reset(token)
+
+    def get_snapshot_start(self) -> Optional[float]:
+        """Returns when the frozen snapshot of the current thread or task started.
+
+        Returns `None` outside of `frozen_snapshot()`.
+        """
+        return _SNAPSHOT_STARTS.get().get(id(self))
 
     def get_client_call_with_path(self) -> List[Union[Path, str]]:
         if self._client_call_with_path is None:
@@ -95,9 +251,79 @@ class ClientConfig:
             )
         return which_result
 
+    def get_engine_api(self) -> Optional["EngineAPIClient"]:
+        """Returns the Engine API client to use, or `None` if the CLI must be used.
+
+        The Engine API is only used when `transport="engine_api"` and when
+        we're sure that the CLI would talk to the same daemon on a local Unix
+        socket. In all other cases, we fall back to the CLI.
+        """
+        if not self._engine_api_resolved:
+            self._engine_api = self._make_engine_api()
+            self._engine_api_resolved = True
+        return self._engine_api
+
+    def _make_engine_api(self) -> Optional["EngineAPIClient"]:
+        if self.transport != "engine_api":
+            return None
+        if self.client_type not in ("docker", "unknown"):
+            # podman's compatibility API doesn't return the same json as
+            # `podman inspect`, which is what our models expect.
+            return None
+        if self.client_type == "unknown" and Path(self.client_call[0]).stem != "docker":
+            # e.g. `client_call=["podman"]`, the CLI may not talk to the docker socket
+            return None
+        if len(self.client_call) > 1 or not self._uses_default_context():
+            return None
+        if self.tls or self.tlsverify:
+            return None
+        from .engine_api import EngineAPIClient, get_unix_socket_path
+
+        socket_path = get_unix_socket_path(self.host)
+        if socket_path is None or not os.path.exists(socket_path):
+            return None
+        return EngineAPIClient(socket_path)
+
+    def _uses_default_context(self) -> bool:
+        if self.context is not None:
+            return self.context == "default"
+        if os.environ.get("DOCKER_CONTEXT", "default") != "default":
+            return False
+        if self.host is not None or os.environ.get("DOCKER_HOST"):
+            # --host and DOCKER_HOST have priority over the current context in the config file
+            return True
+        config_dir = self.config or os.environ.get("DOCKER_CONFIG")
+        if config_dir is None:
+            config_dir = Path.home() / ".docker"
+        try:
+            docker_config = json.loads((Path(config_dir) / "config.json").read_text())
+        except (OSError, ValueError):
+            return True
+        return docker_config.get("currentContext", "default") == "default"
+
+    def _get_cached_command(self, name: str, build) -> Command:
+        # The client call is part of the key to notice when
+        # `get_client_call_with_path` doesn't return the same thing anymore.
+        client_call_with_path = self.get_client_call_with_path()
+        cached = self._command_cache.get(name)
+        if cached is None or cached[0] is not client_call_with_path:
+            cached = (client_call_with_path, build(client_call_with_path))
+            self._command_cache[name] = cached
+        # a copy, because the callers add their arguments to it
+        return Command(cached[1])
+
     @property
     def docker_cmd(self) -> Command:
-        result = Command(self.get_client_call_with_path())
+        return self._get_cached_command("docker", self._build_docker_cmd)
+
+    @property
+    def docker_compose_cmd(self) -> Command:
+        return self._get_cached_command("compose", self._build_docker_compose_cmd)
+
+    def _build_docker_cmd(
+        self, client_call_with_path: List[Union[Path, str]]
+    ) -> Command:
+        result = Command(client_call_with_path)
 
         if self.config is not None:
             result += ["--config", self.config]
@@ -131,9 +357,10 @@ class ClientConfig:
 
         return result
 
-    @property
-    def docker_compose_cmd(self) -> Command:
-        base_cmd = self.docker_cmd + ["compose"]
+    def _build_docker_compose_cmd(
+        self, client_call_with_path: List[Union[Path, str]]
+    ) -> Command:
+        base_cmd = self._build_docker_cmd(client_call_with_path) + ["compose"]
         base_cmd.add_args_iterable_or_single("--file", self.compose_files)
         base_cmd.add_args_iterable_or_single("--profile", self.compose_profiles)
         if self.compose_env_files:
@@ -167,6 +394,107 @@ class DockerCLICaller:
         return self.client_config.docker_compose_cmd
 
 
+# The type of the events sent by the daemon about each kind of object.
+# Objects not listed here can't be invalidated by events and always use the
+# cache validity period.
+EVENT_TYPES = {
+    "Config": "config",
+    "Container": "container",
+    "Image": "image",
+    "Network": "network",
+    "Node": "node",
+    "Plugin": "plugin",
+    "Secret": "secret",
+    "Service": "service",
+    "Volume": "volume",
+}
+
+
+class EventDrivenInspectCache:
+    """Tells which inspect results are still valid by following `docker system events`.
+
+    The events are received from the event bus of the client. Each event
+    increments a sequence number, which is recorded for the object concerned.
+    An inspect result fetched when the sequence number was `n` stays valid
+    as long as no event numbered after `n` concerned this object. Results
+    are thus kept indefinitely but never outlive a change by more than the
+    latency of one event.
+
+    When the events can't be followed (the daemon restarted, the command
+    failed...), `is_valid` returns `None` and the usual cache validity period
+    is used until the bus is connected again. Everything fetched before that
+    is considered stale.
+    """
+
+    # when more ids than this are tracked, we forget them and everything is
+    # considered stale, to bound the memory used.
+    max_tracked_ids = 100_000
+
+    def __init__(self, client_config: ClientConfig):
+        self.client_config = client_config
+        self.sequence = 0
+        self._valid_since = 0
+        self._connection_id: Optional[int] = None
+        self._changed_ids: Dict[str, int] = {}
+        self._changed_types: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._event_bus: Optional["EventBus"] = None
+
+    def start(self) -> None:
+        self._event_bus = self.client_config.get_event_bus()
+        self._event_bus.subscribe(callback=self._handle_event)
+        with self._lock:
+            self._check_connection()
+
+    def is_valid(
+        self, object_type: str, object_id: str, fetch_sequence: Optional[int]
+    ) -> Optional[bool]:
+        """Returns `None` if the events can't tell if this inspect result is valid."""
+        event_type = EVENT_TYPES.get(object_type)
+        if event_type is None or fetch_sequence is None:
+            return None
+        with self._lock:
+            if not self._event_bus.connected:
+                return None
+            self._check_connection()
+            if fetch_sequence < self._valid_since:
+                return False
+            last_change = max(
+                self._changed_ids.get(object_id, 0),
+                self._changed_types.get(event_type, 0),
+            )
+        return last_change <= fetch_sequence
+
+    def _check_connection(self) -> None:
+        # events may have been missed between two connections of the bus
+        connection_id = self._event_bus.connection_id
+        if connection_id != self._connection_id:
+            self._connection_id = connection_id
+            self.sequence += 1
+            self._valid_since = self.sequence
+
+    def _handle_event(self, event) -> None:
+        actor_id = event.actor.id if event.actor is not None else None
+        attributes = (event.actor.attributes if event.actor is not None else None) or {}
+        with self._lock:
+            self._check_connection()
+            self.sequence += 1
+            if actor_id is None or (
+                event.type == "image" and not actor_id.startswith("sha256:")
+            ):
+                # we don't know which object changed, e.g. `image pull` gives
+                # the name of the image, not its id.
+                self._changed_types[event.type] = self.sequence
+            else:
+                self._changed_ids[actor_id] = self.sequence
+            if event.type in ("network", "volume") and "container" in attributes:
+                # connecting a network changes the inspect result of the container too
+                self._changed_ids[attributes["container"]] = self.sequence
+            if len(self._changed_ids) > self.max_tracked_ids:
+                self._changed_ids.clear()
+                self._valid_since = self.sequence + 1
+
+
 class ReloadableObject(DockerCLICaller):
     def __init__(
         self,
@@ -176,16 +504,19 @@ class ReloadableObject(DockerCLICaller):
         is_immutable_id: bool = False,
     ):
         super().__init__(client_config)
-        self._last_refreshed_time = datetime.min
+        self._last_refreshed_time = -math.inf
         self._inspect_result = None
+        self._pinned_inspect_result = False
+        self._fetch_sequence: Optional[int] = None
         self._immutable_id = None
         self._reference = None
         self._id_in_inspect = id_in_inspect
         if is_immutable_id:
             self._immutable_id = reference_or_id
         else:
+            fetch_sequence = self._get_cache_sequence()
             self._set_inspect_result(
-                self._fetch_and_parse_inspect_result(reference_or_id)
+                self._fetch_and_parse_inspect_result(reference_or_id), fetch_sequence
             )
             self._immutable_id = getattr(self._inspect_result, self._id_in_inspect)
 
@@ -201,13 +532,34 @@ class ReloadableObject(DockerCLICaller):
         return self._get_immutable_id()
 
     def _needs_reload(self) -> bool:
-        return (datetime.now() - self._last_refreshed_time) >= timedelta(
-            seconds=CACHE_VALIDITY_PERIOD
+        is_valid = None
+        inspect_cache = self.client_config.get_inspect_cache()
+        if inspect_cache is not None and self._inspect_result is not None:
+            is_valid = inspect_cache.is_valid(
+                type(self).__name__, self._immutable_id, self._fetch_sequence
+            )
+        if (
+            self._pinned_inspect_result
+            and self._inspect_result is not None
+            and is_valid is not False
+        ):
+            # a pinned result is kept until an event tells that it changed.
+            return False
+        snapshot_start = self.client_config.get_snapshot_start()
+        if snapshot_start is not None:
+            # in a frozen snapshot, each object is inspected at most once.
+            return self._last_refreshed_time < snapshot_start
+        if is_valid is not None:
+            return not is_valid
+        validity_period = self.client_config.get_cache_validity_period(
+            type(self).__name__
         )
+        return time.monotonic() - self._last_refreshed_time >= validity_period
 
     def reload(self):
+        fetch_sequence = self._get_cache_sequence()
         self._set_inspect_result(
-            self._fetch_and_parse_inspect_result(self._immutable_id)
+            self._fetch_and_parse_inspect_result(self._immutable_id), fetch_sequence
         )
 
     def _fetch_and_parse_inspect_result(self, reference: str):
@@ -218,9 +570,20 @@ class ReloadableObject(DockerCLICaller):
             self.reload()
         return self._inspect_result
 
-    def _set_inspect_result(self, inspect_result):
+    def _get_cache_sequence(self) -> Optional[int]:
+        # must be called before fetching, so that events arriving during
+        # the fetch invalidate the result.
+        inspect_cache = self.client_config.get_inspect_cache()
+        if inspect_cache is None:
+            return None
+        return inspect_cache.sequence
+
+    def _set_inspect_result(self, inspect_result, fetch_sequence: Optional[int] = None):
+        if fetch_sequence is None:
+            fetch_sequence = self._get_cache_sequence()
         self._inspect_result = inspect_result
-        self._last_refreshed_time = datetime.now()
+        self._fetch_sequence = fetch_sequence
+        self._last_refreshed_time = time.monotonic()
 
     def _get_immutable_id(self):
         if self._immutable_id is None:
@@ -236,34 +599,345 @@ class ReloadableObjectFromJson(ReloadableObject):
     def _fetch_inspect_result_json(self, reference):
         raise NotImplementedError
 
+    def _fetch_inspect_results_json(self, references: List[str]) -> List[Any]:
+        """Inspects multiple objects with a single command.
+
+        Only implemented by the objects that support `bulk_reload`.
+        """
+        raise NotImplementedError
+
     def _parse_json_object(self, json_object: Dict[str, Any]):
         raise NotImplementedError
 
+    def _parse_json_text(self, json_text: Union[str, bytes]):
+        """Parses the inspect result from its json, not decoded yet.
+
+        Overridden to validate the json directly with pydantic, without
+        building python dicts first.
+        """
+        return self._parse_json_object(json.loads(json_text))
+
     def _fetch_and_parse_inspect_result(self, reference: str):
-        json_object = self._fetch_inspect_result_json(reference)
+        inspect_broker = self.client_config.get_inspect_broker()
+        if inspect_broker is None:
+            json_object = self._fetch_inspect_result_json(reference)
+        else:
+            json_object = inspect_broker.fetch_inspect_result_json(self, reference)
+        return self._parse_json_object_or_report(json_object)
+
+    def _parse_json_object_or_report(
+        self, json_object: Union[Dict[str, Any], str, bytes]
+    ):
+        """Parses the inspect result, from a json object or its json text."""
         try:
+            if isinstance(json_object, (str, bytes)):
+                return self._parse_json_text(json_object)
             return self._parse_json_object(json_object)
         except pydantic.ValidationError as err:
-            fd, json_response_file = tempfile.mkstemp(suffix=".json", text=True)
-            with open(json_response_file, "w") as f:
-                json.dump(json_object, f, indent=2)
-
-            raise ParsingError(
-                f"There was an error parsing the json response from the Docker daemon. \n"
-                f"This is a bug with python-on-whales itself. Please head to \n"
-                f"https://github.com/gabrieldemarmiesse/python-on-whales/issues \n"
-                f"and open an issue. You should copy this error message and \n"
-                f"the json response from the Docker daemon. The json response was put \n"
-                f"in {json_response_file} because it's a bit too big to be printed \n"
-                f"on the screen. Make sure that there are no sensitive data in the \n"
-                f"json file before copying it in the github issue."
-            ) from err
-
-
-def bulk_reload(docker_objects: List[ReloadableObjectFromJson]):
-    assert len(set(x.client_config for x in docker_objects)) == 1
+            raise parsing_error_with_report(_decode_json(json_object)) from err
+
+
+def parsing_error_with_report(json_object: Any) -> ParsingError:
+    """Returns the error to raise when a json response of the daemon can't be parsed.
+
+    The json response is written in a temporary file, to be attached to a bug report.
+    """
+    fd, json_response_file = tempfile.mkstemp(suffix=".json", text=True)
+    with open(json_response_file, "w") as f:
+        json.dump(json_object, f, indent=2)
+
+    return ParsingError(
+        f"There was an error parsing the json response from the Docker daemon. \n"
+        f"This is a bug with python-on-whales itself. Please head to \n"
+        f"https://github.com/gabrieldemarmiesse/python-on-whales/issues \n"
+        f"and open an issue. You should copy this error message and \n"
+        f"the json response from the Docker daemon. The json response was put \n"
+        f"in {json_response_file} because it's a bit too big to be printed \n"
+        f"on the screen. Make sure that there are no sensitive data in the \n"
+        f"json file before copying it in the github issue."
+    )
+
+
+# Windows limits the length of a command line to 32767 characters, so
+# we don't put too many IDs in a single inspect command.
+BULK_INSPECT_CHUNK_SIZE = 200
+
+
+def bulk_reload(docker_objects: List[ReloadableObjectFromJson], pin: bool = False):
+    """Refreshes the inspect result of many objects of the same type at once.
+
+    Only one `docker <type> inspect id1 id2 ...` command is launched (per
+    chunk of `BULK_INSPECT_CHUNK_SIZE` objects) instead of one per object.
+    Objects that disappeared in the meantime are skipped, reading their
+    attributes will raise the usual exception. Other errors of the inspect
+    command are raised.
+
+    Parameters:
+        docker_objects: The objects to reload. They must be of the same type
+            and have the same client config.
+        pin: If `True`, the objects keep this inspect result until `reload()`
+            is called explicitly, instead of refreshing it when the cache
+            validity period is over. With the event-driven cache, an event
+            concerning an object still invalidates its inspect result.
+    """
+    if len(docker_objects) == 0:
+        return
+    first_object = docker_objects[0]
+    assert all(
+        type(x) is type(first_object) and x.client_config == first_object.client_config
+        for x in docker_objects
+    )
+    for i in range(0, len(docker_objects), BULK_INSPECT_CHUNK_SIZE):
+        _bulk_reload_chunk(docker_objects[i : i + BULK_INSPECT_CHUNK_SIZE], pin)
+
+
+def bulk_inspect_json(docker_objects: List[ReloadableObjectFromJson]) -> List[Any]:
+    """Returns the json inspect results of many objects of the same type.
+
+    Same as `bulk_reload`, but the results are neither parsed nor stored in
+    the objects. The objects that disappeared in the meantime are skipped.
+    """
+    json_objects = []
+    for i in range(0, len(docker_objects), BULK_INSPECT_CHUNK_SIZE):
+        chunk = docker_objects[i : i + BULK_INSPECT_CHUNK_SIZE]
+        all_ids = [x._get_immutable_id() for x in chunk]
+        json_objects_by_id = _fetch_json_objects(chunk[0], all_ids)
+        json_objects += [
+            _decode_json(json_objects_by_id[x])
+            for x in all_ids
+            if x in json_objects_by_id
+        ]
+    return json_objects
+
+
+def inspect_json(
+    client_config: ClientConfig,
+    object_type: str,
+    references: List[str],
+    fields: Optional[Sequence[str]] = None,
+) -> List[Dict[str, Any]]:
+    """Inspects objects with a single command and returns the json, not validated.
+
+    Parameters:
+        client_config: The client config to use.
+        object_type: `"container"` or `"image"`.
+        references: The names or ids of the objects. If one of them doesn't
+            exist, the usual exception is raised.
+        fields: If set, the dicts only have these fields of the inspect
+            results, like `"State.Status"`. They're selected by the CLI
+            with a Go template.
+    """
+    if len(references) == 0:
+        return []
+    engine_api = client_config.get_engine_api()
+    if engine_api is not None:
+        json_objects = [
+            json.loads(engine_api.inspect(object_type, x)) for x in references
+        ]
+        if fields is None:
+            return json_objects
+        return [utils.select_inspect_fields(x, fields) for x in json_objects]
+    full_cmd = client_config.docker_cmd + [object_type, "inspect"]
+    if fields is None:
+        return json.loads(utils.run(full_cmd + references))
+    full_cmd += ["--format", utils.inspect_fields_template(fields)]
+    return utils.parse_json_lines(utils.run(full_cmd + references))
+
+
+def _decode_json(json_object: Any) -> Any:
+    # the inspect results can be returned as json text, see `split_json_array`
+    if isinstance(json_object, (str, bytes)):
+        return json.loads(json_object)
+    return json_object
+
+
+def _bulk_reload_chunk(docker_objects: List[ReloadableObjectFromJson], pin: bool):
     all_ids = [x._get_immutable_id() for x in docker_objects]
-    full_cmd = docker_objects[0].docker_cmd + ["inspect"] + all_ids
-    json_str = run(full_cmd)
-    for json_obj, docker_object in zip(json.loads(json_str), docker_objects):
-        docker_object._set_inspect_result(docker_object._parse_json_object(json_obj))
+    fetch_sequence = docker_objects[0]._get_cache_sequence()
+    json_objects_by_id = _fetch_json_objects(docker_objects[0], all_ids)
+    for docker_object in docker_objects:
+        json_object = json_objects_by_id.get(docker_object._get_immutable_id())
+        if json_object is None:
+            continue
+        docker_object._set_inspect_result(
+            docker_object._parse_json_object_or_report(json_object), fetch_sequence
+        )
+        docker_object._pinned_inspect_result = pin
+
+
+def _fetch_json_objects(
+    docker_object: ReloadableObjectFromJson, references: List[str]
+) -> Dict[str, Any]:
+    """Inspects objects of the type of `docker_object` with a single command.
+
+    Returns the json objects (or their json text) by reference. The
+    references of the objects that don't exist (anymore) are missing from
+    the result.
+    """
+    try:
+        json_objects = docker_object._fetch_inspect_results_json(references)
+    except (
+        NoSuchContainer,
+        NoSuchImage,
+        NoSuchNetwork,
+        NoSuchService,
+        NoSuchVolume,
+    ) as err:
+        # Some objects were removed since they were listed. The daemon still
+        # sent the inspect results of the others. Other errors (daemon down,
+        # permission denied...) are raised.
+        try:
+            json_objects = utils.split_json_array(err.stdout or "[]")
+        except ValueError:
+            json_objects = []
+
+    if len(json_objects) == len(references):
+        return dict(zip(references, json_objects))
+    # we can't know which ones are missing with names, only with ids.
+    id_key = to_docker_camel(docker_object._id_in_inspect)
+    return {
+        _decode_json(json_object).get(id_key): json_object
+        for json_object in json_objects
+    }
+
+
+class _PendingInspect:
+    def __init__(self):
+        self.done = threading.Event()
+        self.json_object: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class InspectBroker:
+    """Coalesces the inspect calls made concurrently by multiple threads.
+
+    Threads asking for the inspect result of the same object while it's
+    being fetched wait for this result instead of launching another process.
+    A request for an object is sent at once if no object of the same type
+    is being inspected. Otherwise, the requests arriving within
+    `batch_window` seconds are gathered in a single `docker <type> inspect`
+    command, like `bulk_reload` does.
+    """
+
+    def __init__(self, batch_window: float):
+        self.batch_window = batch_window
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Tuple[type, str], _PendingInspect] = {}
+        self._open_batches: Dict[type, List[str]] = {}
+        # number of batches being fetched, by type
+        self._fetching: Dict[type, int] = {}
+
+    def fetch_inspect_result_json(
+        self, docker_object: ReloadableObjectFromJson, reference: str
+    ) -> Any:
+        object_type = type(docker_object)
+        is_leader = gather = False
+        with self._lock:
+            pending = self._in_flight.get((object_type, reference))
+            if pending is None:
+                pending = _PendingInspect()
+                self._in_flight[(object_type, reference)] = pending
+                if object_type not in self._open_batches:
+                    self._open_batches[object_type] = []
+                    is_leader = True
+                    # when nothing else is being inspected, there is no one to wait for.
+                    gather = self._fetching.get(object_type, 0) > 0
+                self._open_batches[object_type].append(reference)
+
+        if is_leader:
+            # the first thread of a batch waits for the others and fetches
+            # the results for everyone.
+            batch = None
+            try:
+                if gather:
+                    time.sleep(self.batch_window)
+                batch = self._take_batch(object_type)
+                self._fetch_batch(docker_object, batch)
+            except BaseException as err:
+                # e.g. KeyboardInterrupt, the other threads must not wait forever.
+                if batch is None:
+                    batch = self._take_batch(object_type)
+                error = RuntimeError(
+                    "The thread inspecting this object was interrupted."
+                )
+                error.__cause__ = err
+                self._finish_batch(
+                    object_type, batch, {}, {reference: error for reference in batch}
+                )
+                raise
+            finally:
+                if batch is not None:
+                    with self._lock:
+                        self._fetching[object_type] -= 1
+
+        pending.done.wait()
+        if pending.error is not None:
+            raise pending.error
+        return pending.json_object
+
+    def _take_batch(self, object_type: type) -> Dict[str, _PendingInspect]:
+        """Closes the open batch of this type, new requests start another one."""
+        with self._lock:
+            references = self._open_batches.pop(object_type)
+            self._fetching[object_type] = self._fetching.get(object_type, 0) + 1
+            return {x: self._in_flight[(object_type, x)] for x in references}
+
+    def _fetch_batch(
+        self,
+        docker_object: ReloadableObjectFromJson,
+        batch: Dict[str, _PendingInspect],
+    ) -> None:
+        object_type = type(docker_object)
+        references = list(batch)
+        json_objects_by_reference = {}
+        if len(references) > 1 and _supports_bulk_inspect(object_type):
+            try:
+                for i in range(0, len(references), BULK_INSPECT_CHUNK_SIZE):
+                    chunk = references[i : i + BULK_INSPECT_CHUNK_SIZE]
+                    json_objects_by_reference.update(
+                        _fetch_json_objects(docker_object, chunk)
+                    )
+            except Exception:
+                # each object is inspected alone below, which raises the
+                # right exception in the right thread.
+                pass
+
+        errors = {}
+        for reference in references:
+            if reference in json_objects_by_reference:
+                continue
+            try:
+                # alone in its batch, or not found by the bulk inspect.
+                # We inspect it alone to get the right exception.
+                json_objects_by_reference[reference] = (
+                    docker_object._fetch_inspect_result_json(reference)
+                )
+            except Exception as err:
+                errors[reference] = err
+        self._finish_batch(object_type, batch, json_objects_by_reference, errors)
+
+    def _finish_batch(
+        self,
+        object_type: type,
+        batch: Dict[str, _PendingInspect],
+        json_objects_by_reference: Dict[str, Any],
+        errors: Dict[str, BaseException],
+    ) -> None:
+        # the threads asking for these objects until now share the results
+        with self._lock:
+            for reference, pending in batch.items():
+                if self._in_flight.get((object_type, reference)) is pending:
+                    del self._in_flight[(object_type, reference)]
+        for reference, pending in batch.items():
+            if pending.done.is_set():
+                continue
+            pending.json_object = json_objects_by_reference.get(reference)
+            pending.error = errors.get(reference)
+            pending.done.set()
+
+
+def _supports_bulk_inspect(object_type: type) -> bool:
+    return (
+        object_type._fetch_inspect_results_json
+        is not ReloadableObjectFromJson._fetch_inspect_results_json
+    )
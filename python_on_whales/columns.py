@@ -0,0 +1,170 @@
+"""Tables of docker objects stored column by column.
+
+Building a table from `Container` or `Image` objects validates the full
+inspect result of each object with pydantic, then reads it attribute by
+attribute. The functions of this module build the columns directly from
+the json printed by the CLI (or from the rows of `ContainerSummary`,
+`ContainerStats`...), which is much faster for big tables.
+
+```python
+from python_on_whales import docker
+from python_on_whales.columns import to_columns
+
+containers = docker.container.list(all=True, details="columns")
+print(containers["state.status"])
+stats = to_columns(docker.stats()).to_pandas()
+```
+"""
+
+from __future__ import annotations
+
+import functools
+import typing
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+import pydantic
+
+from python_on_whales.utils import parse_byte_size, parse_rfc3339_nano
+
+if TYPE_CHECKING:
+    import pandas
+    import pyarrow
+
+
+class Columns(Dict[str, List[Any]]):
+    """A table, as a dict of column name to the list of the values of this column.
+
+    All the columns have the same length. Nested objects are flattened, their
+    columns are named with dots, like `"state.status"`.
+    """
+
+    @property
+    def num_rows(self) -> int:
+        for values in self.values():
+            return len(values)
+        return 0
+
+    def to_pandas(self) -> "pandas.DataFrame":
+        """Returns a `pandas.DataFrame`. Needs pandas to be installed."""
+        import pandas
+
+        return pandas.DataFrame(self)
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """Returns a `pyarrow.Table`. Needs pyarrow to be installed."""
+        import pyarrow
+
+        return pyarrow.table(self)
+
+
+def to_columns(rows: Sequence[Any]) -> Columns:
+    """Builds the columns of a list of rows with `__slots__`.
+
+    The rows can be `ContainerSummary`, `ImageSummary`, `ContainerStats` or
+    `PodStats` objects. There is a column per attribute.
+    """
+    if len(rows) == 0:
+        return Columns()
+    names = [x for x in type(rows[0]).__slots__ if x != "client_config"]
+    return Columns({name: [getattr(row, name) for row in rows] for name in names})
+
+
+def model_columns(
+    model_class: Type[pydantic.BaseModel], json_objects: Sequence[Mapping[str, Any]]
+) -> Columns:
+    """Builds the columns of json objects with the schema of a model.
+
+    The objects are not validated by pydantic. There is a column per field of
+    `model_class`. Fields which are models themselves, like `state` in
+    `ContainerInspectResult`, are flattened into one column per field. Lists
+    and dicts are left as they are in the json. Dates and sizes are parsed.
+    """
+    columns = Columns()
+    _add_model_columns(columns, model_class, json_objects, "")
+    return columns
+
+
+def _add_model_columns(
+    columns: Columns,
+    model_class: Type[pydantic.BaseModel],
+    json_objects: Sequence[Any],
+    prefix: str,
+) -> None:
+    for field_name, alias, nested_model, convert in _get_fields(model_class):
+        values = [x.get(alias) if isinstance(x, dict) else None for x in json_objects]
+        if nested_model is not None:
+            # the nested objects are read once, for all their fields
+            _add_model_columns(columns, nested_model, values, f"{prefix}{field_name}.")
+        elif convert is _identity:
+            columns[prefix + field_name] = values
+        else:
+            columns[prefix + field_name] = [
+                None if x is None else convert(x) for x in values
+            ]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_fields(
+    model_class: Type[pydantic.BaseModel],
+) -> List[Tuple[str, str, Optional[Type[pydantic.BaseModel]], Callable[[Any], Any]]]:
+    """Returns the name, json key, nested model and converter of each field."""
+    alias_generator = model_class.model_config.get("alias_generator")
+    result = []
+    for field_name, field in model_class.model_fields.items():
+        alias = field.alias
+        if alias is None and alias_generator is not None:
+            alias = alias_generator(field_name)
+        elif alias is None:
+            alias = field_name
+        annotation = _remove_optional(field.annotation)
+        if isinstance(annotation, type) and issubclass(annotation, pydantic.BaseModel):
+            result.append((field_name, alias, annotation, _identity))
+        else:
+            result.append((field_name, alias, None, _get_converter(annotation)))
+    return result
+
+
+def _remove_optional(annotation: Any) -> Any:
+    if typing.get_origin(annotation) is typing.Union:
+        arguments = [x for x in typing.get_args(annotation) if x is not type(None)]
+        if len(arguments) == 1:
+            return arguments[0]
+    return annotation
+
+
+def _get_converter(annotation: Any) -> Callable[[Any], Any]:
+    if annotation is datetime:
+        return _to_datetime
+    if annotation is pydantic.ByteSize:
+        return _to_byte_size
+    if annotation in (int, float):
+        # the CLI sometimes prints numbers as strings
+        return lambda x: annotation(x) if isinstance(x, str) else x
+    return _identity
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    try:
+        return parse_rfc3339_nano(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_byte_size(value: Any) -> int:
+    return parse_byte_size(value) if isinstance(value, str) else value
+
+
+def _identity(value: Any) -> Any:
+    return value
@@ -9,7 +9,7 @@ from typing_extensions import Literal
 
 import python_on_whales.components.container.cli_wrapper
 import python_on_whales.components.volume.cli_wrapper
-from python_on_whales.client_config import DockerCLICaller
+from python_on_whales.client_config import DockerCLICaller, bulk_reload
 from python_on_whales.components.compose.models import (
     ComposeConfig,
     ComposeEvent,
@@ -474,9 +474,18 @@ class ComposeCLI(DockerCLICaller):
         self,
         services: Optional[List[str]] = None,
         all: bool = False,
+        prefetch: bool = False,
     ) -> List[python_on_whales.components.container.cli_wrapper.Container]:
         """Returns the containers that were created by the current project.
 
+        Parameters:
+            services: Only return the containers of those services.
+            all: Also return the stopped containers.
+            prefetch: If `True`, all the containers are inspected with a single
+                command and the returned objects keep this inspect result until
+                `reload()` is called on them. Reading their attributes then
+                doesn't launch any process.
+
         # Returns
             A `List[python_on_whales.Container]`
         """
@@ -492,7 +501,12 @@ class ComposeCLI(DockerCLICaller):
             ids.pop(0)
 
         Container = python_on_whales.components.container.cli_wrapper.Container
-        return [Container(self.client_config, x, is_immutable_id=True) for x in ids]
+        containers = [
+            Container(self.client_config, x, is_immutable_id=True) for x in ids
+        ]
+        if prefetch:
+            bulk_reload(containers, pin=True)
+        return containers
 
     def ls(
         self, all: bool = False, filters: Dict[str, str] = {}
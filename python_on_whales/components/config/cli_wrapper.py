@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union, overload
@@ -15,7 +14,12 @@ from python_on_whales.components.config.models import (
     ConfigSpec,
     DockerObjectVersion,
 )
-from python_on_whales.utils import format_mapping_for_cli, run, to_list
+from python_on_whales.utils import (
+    format_mapping_for_cli,
+    run,
+    split_json_array,
+    to_list,
+)
 
 
 class Config(ReloadableObjectFromJson):
@@ -31,12 +35,17 @@ class Config(ReloadableObjectFromJson):
         self.remove()
 
     def _fetch_inspect_result_json(self, reference):
-        json_str = run(self.docker_cmd + ["config", "inspect", reference])
-        return json.loads(json_str)[0]
+        json_array = run(
+            self.docker_cmd + ["config", "inspect", reference], decode=False
+        )
+        return split_json_array(json_array)[0]
 
     def _parse_json_object(self, json_object: Dict[str, Any]):
         return ConfigInspectResult(**json_object)
 
+    def _parse_json_text(self, json_text: Union[str, bytes]) -> ConfigInspectResult:
+        return ConfigInspectResult.model_validate_json(json_text)
+
     def _get_inspect_result(self) -> ConfigInspectResult:
         """Only there to allow tools to know the return type"""
         return super()._get_inspect_result()
@@ -1,19 +1,30 @@
 from __future__ import annotations
 
+import heapq
 import inspect
+import itertools
 import json
+import math
+import re
 import shlex
+import sys
 import textwrap
+import time
 import warnings
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
+from subprocess import PIPE, Popen
 from typing import (
     Any,
     Dict,
     Iterable,
+    Iterator,
     List,
     Literal,
     Mapping,
+    NamedTuple,
     Optional,
     Sequence,
     Tuple,
@@ -22,7 +33,6 @@ from typing import (
     overload,
 )
 
-import pydantic
 from typing_extensions import TypeAlias, Unpack
 
 import python_on_whales.components.image.cli_wrapper
@@ -31,9 +41,14 @@ import python_on_whales.components.pod.cli_wrapper
 import python_on_whales.components.volume.cli_wrapper
 from python_on_whales.client_config import (
     ClientConfig,
+    Command,
     DockerCLICaller,
     ReloadableObjectFromJson,
+    bulk_inspect_json,
+    bulk_reload,
+    inspect_json,
 )
+from python_on_whales.columns import Columns, model_columns
 from python_on_whales.components.container.models import (
     ContainerConfig,
     ContainerGraphDriver,
@@ -43,18 +58,31 @@ from python_on_whales.components.container.models import (
     Mount,
     NetworkSettings,
 )
+from python_on_whales.components.system.models import DockerEvent
 from python_on_whales.exceptions import NoSuchContainer
+from python_on_whales.log_cursor import LogCursor, LogRecord, read_log_records
 from python_on_whales.utils import (
+    DEFAULT_CHUNK_SIZE,
+    PipesLinesReader,
     ValidPath,
     ValidPortMapping,
-    custom_parse_object_as,
     format_port_arg,
     format_signal_arg,
     format_time_arg,
+    get_docker_exception_type,
     join_if_not_none,
+    parse_byte_size,
+    parse_byte_size_pair,
+    parse_go_time,
+    parse_json_lines,
+    parse_percentage,
+    parse_rfc3339_nano,
+    popen,
     removeprefix,
     run,
+    split_json_array,
     stream_stdout_and_stderr,
+    stream_stdout_in_chunks,
     to_list,
     to_seconds,
 )
@@ -103,10 +131,26 @@ class Container(ReloadableObjectFromJson):
             self.remove(volumes=True)
 
     def _fetch_inspect_result_json(self, reference):
-        json_str = run(self.docker_cmd + ["container", "inspect", reference])
-        return json.loads(json_str)[0]
+        engine_api = self.client_config.get_engine_api()
+        if engine_api is not None:
+            return engine_api.inspect("container", reference)
+        json_array = run(
+            self.docker_cmd + ["container", "inspect", reference], decode=False
+        )
+        return split_json_array(json_array)[0]
+
+    def _fetch_inspect_results_json(self, references):
+        engine_api = self.client_config.get_engine_api()
+        if engine_api is not None:
+            return engine_api.inspect_many("container", references)
+        json_array = run(
+            self.docker_cmd + ["container", "inspect", *references], decode=False
+        )
+        return split_json_array(json_array)
 
     def _parse_json_object(self, json_object: Dict[str, Any]):
+        # Not validated from the json text with `model_validate_json`: pydantic
+        # builds each `Path` twice in this case, which makes it slower.
         return ContainerInspectResult(**json_object)
 
     def _get_inspect_result(self) -> ContainerInspectResult:
@@ -327,13 +371,15 @@ class Container(ReloadableObjectFromJson):
         """
         return ContainerCLI(self.client_config).exists(self.id)
 
-    def export(self, output: ValidPath) -> None:
+    def export(
+        self, output: Optional[ValidPath] = None, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Optional[Iterator[bytes]]:
         """Export this container filesystem.
 
         See the [`docker.container.export`](../sub-commands/container.md) command for
         information about the arguments.
         """
-        return ContainerCLI(self.client_config).export(self, output)
+        return ContainerCLI(self.client_config).export(self, output, chunk_size)
 
     def init(self) -> None:
         """Initialize this container.
@@ -1098,15 +1144,25 @@ class ContainerCLI(DockerCLICaller):
         else:
             return True
 
-    def export(self, container: ValidContainer, output: ValidPath) -> None:
+    def export(
+        self,
+        container: ValidContainer,
+        output: Optional[ValidPath] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Optional[Iterator[bytes]]:
         """Export a container's filesystem as a tar archive
 
         Alias: `docker.export(...)`
 
         Parameters:
             container: The container to export.
-            output: The path of the output tar archive. Returning a generator of bytes
-                is not yet implemented.
+            output: The path of the output tar archive. If `output` is None, an
+                iterator of bytes is returned, to stream the archive elsewhere.
+            chunk_size: When streaming, the size in bytes of the chunks yielded
+                (only the last one can be smaller). Default is 1 MiB.
+
+        # Returns
+            `Optional[Iterator[bytes]]`. If output is a path, nothing is returned.
 
         # Raises
             `python_on_whales.exceptions.NoSuchContainer` if the container does not exists.
@@ -1117,8 +1173,7 @@ class ContainerCLI(DockerCLICaller):
         full_cmd.append(container)
 
         if output is None:
-            # we must return a generator of bytes
-            raise NotImplementedError
+            return stream_stdout_in_chunks(full_cmd, chunk_size)
         else:
             run(full_cmd)
 
@@ -1154,22 +1209,64 @@ class ContainerCLI(DockerCLICaller):
     @overload
     def inspect(self, x: Iterable[ValidContainer], /) -> List[Container]: ...
 
+    @overload
+    def inspect(
+        self, x: ValidContainer, /, *, raw: Literal[True]
+    ) -> Dict[str, Any]: ...
+
+    @overload
     def inspect(
-        self, x: Union[ValidContainer, Iterable[ValidContainer]], /
-    ) -> Union[Container, List[Container]]:
+        self, x: Iterable[ValidContainer], /, *, raw: Literal[True]
+    ) -> List[Dict[str, Any]]: ...
+
+    @overload
+    def inspect(self, x: ValidContainer, /, *, fields: List[str]) -> Dict[str, Any]: ...
+
+    @overload
+    def inspect(
+        self, x: Iterable[ValidContainer], /, *, fields: List[str]
+    ) -> List[Dict[str, Any]]: ...
+
+    def inspect(
+        self,
+        x: Union[ValidContainer, Iterable[ValidContainer]],
+        /,
+        *,
+        raw: bool = False,
+        fields: Optional[List[str]] = None,
+    ) -> Union[Container, List[Container], Dict[str, Any], List[Dict[str, Any]]]:
         """Returns a container object from a name or ID.
 
         Parameters:
             x: A container name or ID, or a list of container names
                 and/or IDs
+            raw: If `True`, returns the json inspect result as a dict, without
+                validating it. All the containers are inspected with a single
+                command.
+            fields: If set, returns a dict with only these fields of the inspect
+                result, like `["State.Status", "Config.Labels"]`. The names
+                are the ones of the json, and they're selected by
+                `docker container inspect --format`, so the rest isn't even
+                sent to python. All the containers are inspected with a single
+                command.
 
         Returns:
             A `python_on_whales.Container` object or a list of those
-            if a list of IDs was passed as input.
+            if a list of IDs was passed as input. A dict, or a list of dicts,
+            if `raw` or `fields` is used.
 
         # Raises
             `python_on_whales.exceptions.NoSuchContainer` if the container does not exists.
         """
+        if raw and fields is not None:
+            raise ValueError("`raw` and `fields` can't be used together.")
+        if raw or fields is not None:
+            json_objects = inspect_json(
+                self.client_config, "container", [str(y) for y in to_list(x)], fields
+            )
+            if isinstance(x, Iterable) and not isinstance(x, str):
+                return json_objects
+            return json_objects[0]
 
         if isinstance(x, Iterable) and not isinstance(x, str):
             return [Container(self.client_config, reference) for reference in x]
@@ -1250,6 +1347,7 @@ class ContainerCLI(DockerCLICaller):
 
         # Raises
             `python_on_whales.exceptions.NoSuchContainer` if the container does not exist.
+            With `stream=True`, it's raised when iterating.
 
         If you are a bit confused about `follow` and `stream`, here are some use cases.
 
@@ -1259,9 +1357,6 @@ class ContainerCLI(DockerCLICaller):
         in memory because they are too big, use `stream=True`.
         """
 
-        # first we verify that the container exists and raise an exception if not.
-        self.inspect(container)
-
         full_cmd = self.docker_cmd + ["container", "logs"]
         full_cmd.add_flag("--details", details)
         full_cmd.add_simple_arg("--since", format_time_arg(since))
@@ -1278,11 +1373,281 @@ class ContainerCLI(DockerCLICaller):
         else:
             return "".join(x[1].decode() for x in iterator)
 
+    def log_records(
+        self,
+        container: ValidContainer,
+        *,
+        cursor: Optional[LogCursor] = None,
+        since: Union[None, datetime, timedelta] = None,
+        tail: Optional[int] = None,
+        until: Union[None, datetime, timedelta] = None,
+        follow: bool = False,
+    ) -> Iterator[LogRecord]:
+        """Returns the logs of a container as an iterator of parsed records.
+
+        Parameters:
+            container: The container to get the logs of
+            cursor: A `python_on_whales.LogCursor`. It's advanced as the records
+                are read, and if it was already used, the logs are resumed
+                after the last record read, without duplicates.
+            since: Use a datetime or timedelta to specify the lower
+                date limit for the logs. Ignored if the cursor was already used.
+            tail: Number of lines to show from the end of the logs (default all)
+            until: Use a datetime or a timedelta to specify the upper date
+                limit for the logs.
+            follow: Continue to stream the logs until the container stops.
+
+        # Returns
+            An iterator of `python_on_whales.LogRecord`, which are named tuples
+            `(timestamp, source, line)`. `timestamp` is a `datetime`,
+            `source` is `"stdout"` or `"stderr"` and `line` is `bytes`.
+
+        # Raises
+            `python_on_whales.exceptions.NoSuchContainer` if the container does not
+            exist, when iterating.
+        """
+        full_cmd = self.docker_cmd + ["container", "logs"]
+        full_cmd.add_simple_arg("--tail", tail)
+        full_cmd.add_simple_arg("--until", format_time_arg(until))
+        full_cmd.add_flag("--follow", follow)
+        return read_log_records(full_cmd, container, cursor or LogCursor(), since)
+
+    def logs_many(
+        self,
+        containers: Union[ValidContainer, Iterable[ValidContainer]] = (),
+        *,
+        filters: Optional[Iterable[ContainerListFilter]] = None,
+        since: Union[None, datetime, timedelta] = None,
+        tail: Optional[int] = None,
+        until: Union[None, datetime, timedelta] = None,
+        follow: bool = False,
+        reorder_window: float = 0.1,
+    ) -> Iterator[ContainerLogLine]:
+        """Returns the logs of many containers, merged in a single iterator.
+
+        A `docker container logs --timestamps` process is started for each
+        container, and all of them are read from the calling thread.
+
+        ```python
+        from python_on_whales import docker
+
+        for container_id, source, timestamp, line in docker.container.logs_many(
+            filters=[("label", "com.docker.compose.project=my_project")],
+            follow=True,
+        ):
+            print(container_id[:12], timestamp, line.decode(), end="")
+        ```
+
+        Parameters:
+            containers: The containers to get the logs of.
+            filters: Also get the logs of the running containers matching
+                those filters (see `docker.container.list`). With `follow=True`,
+                the containers matching the filters that start later are added
+                as well, thanks to `docker system events`.
+            since: Use a datetime or timedelta to specify the lower
+                date limit for the logs.
+            tail: Number of lines to show from the end of the logs of each
+                container (default all).
+            until: Use a datetime or a timedelta to specify the upper date
+                limit for the logs.
+            follow: Continue to stream the logs until the containers stop
+                (and forever if `filters` is given).
+            reorder_window: Lines are kept this many seconds before being
+                yielded, and yielded by order of timestamp. Lines arriving
+                later than that can be out of order.
+
+        # Returns
+            An iterator of `ContainerLogLine`, which are named tuples
+            `(container_id, source, timestamp, line)`. `source` is `"stdout"`
+            or `"stderr"`, `timestamp` is a `datetime`, `line` is `bytes`.
+
+        # Raises
+            `python_on_whales.exceptions.NoSuchContainer` if any of the
+            containers do not exist.
+        """
+        if sys.platform == "win32":
+            raise NotImplementedError("logs_many is not available on Windows.")
+        containers = to_list(containers)
+        container_ids = [
+            x["Id"]
+            for x in inspect_json(
+                self.client_config,
+                "container",
+                [str(x) for x in containers],
+                fields=["Id"],
+            )
+        ]
+
+        logs_cmd = self.docker_cmd + ["container", "logs", "--timestamps"]
+        logs_cmd.add_simple_arg("--until", format_time_arg(until))
+        logs_cmd.add_flag("--follow", follow)
+        # containers started after the call are followed from the start
+        new_containers_logs_cmd = Command(logs_cmd)
+        logs_cmd.add_simple_arg("--since", format_time_arg(since))
+        logs_cmd.add_simple_arg("--tail", tail)
+
+        events_cmd = None
+        if filters is not None:
+            filters = list(filters)
+            if follow:
+                events_cmd = self.docker_cmd + ["system", "events"]
+                events_cmd += ["--format", "{{json .}}"]
+                events_cmd += ["--filter", "type=container", "--filter", "event=start"]
+                # the events are replayed from here, so that containers
+                # starting while we list them are not missed.
+                events_cmd.add_simple_arg("--since", format_time_arg(datetime.now()))
+            for container in self.list(filters=filters):
+                if container.id not in container_ids:
+                    container_ids.append(container.id)
+
+        return self._merge_logs(
+            container_ids,
+            logs_cmd,
+            new_containers_logs_cmd,
+            events_cmd,
+            filters,
+            reorder_window,
+        )
+
+    def _merge_logs(
+        self,
+        container_ids: List[str],
+        logs_cmd: Command,
+        new_containers_logs_cmd: Command,
+        events_cmd: Optional[Command],
+        filters: Optional[List[ContainerListFilter]],
+        reorder_window: float,
+    ) -> Iterator[ContainerLogLine]:
+        reader = PipesLinesReader()
+        processes: Dict[Any, Popen] = {}
+        open_pipes: Dict[Any, int] = {}
+        outputs_without_timestamp: Dict[Any, bytes] = {}
+        # (timestamp, order of arrival, time of arrival, log line)
+        pending_lines: List[Tuple[datetime, int, float, ContainerLogLine]] = []
+        arrival_order = itertools.count()
+
+        def start_process(key: Any, full_cmd: List[Any]):
+            full_cmd = [str(x) for x in full_cmd]
+            process = popen(full_cmd, stdout=PIPE, stderr=PIPE)
+            processes[key] = process
+            open_pipes[key] = 2
+            outputs_without_timestamp[key] = b""
+            reader.add(process.stdout, (key, "stdout"))
+            reader.add(process.stderr, (key, "stderr"))
+
+        def finish_process(key: Any):
+            process = processes.pop(key)
+            process.stdout.close()
+            process.stderr.close()
+            exit_code = process.wait()
+            stderr = outputs_without_timestamp.pop(key)
+            exception_type = get_docker_exception_type(stderr)
+            if exit_code == 0 or (
+                key in attached_containers and exception_type is NoSuchContainer
+            ):
+                # a container started and removed before we could read its logs
+                return
+            raise exception_type(
+                command_launched=process.args, return_code=exit_code, stderr=stderr
+            )
+
+        def handle_event(line: bytes):
+            event = DockerEvent(**json.loads(line))
+            container_id = event.actor.id if event.actor is not None else None
+            if container_id is None or container_id in processes:
+                return
+            if self.list(filters=[*filters, ("id", container_id)]) != []:
+                attached_containers.add(container_id)
+                start_process(container_id, new_containers_logs_cmd + [container_id])
+
+        attached_containers = set()
+        try:
+            if events_cmd is not None:
+                start_process("events", events_cmd)
+            for container_id in container_ids:
+                start_process(container_id, logs_cmd + [container_id])
+
+            while len(reader) > 0 or pending_lines:
+                timeout = None
+                if pending_lines:
+                    oldest_arrival = pending_lines[0][2]
+                    timeout = max(0, oldest_arrival + reorder_window - time.monotonic())
+                lines = reader.read(timeout) if len(reader) > 0 else []
+                now = time.monotonic()
+                for (key, source), line in lines:
+                    if line is None:
+                        open_pipes[key] -= 1
+                        if open_pipes[key] == 0:
+                            finish_process(key)
+                    elif key == "events":
+                        if source == "stdout":
+                            handle_event(line)
+                        else:
+                            outputs_without_timestamp[key] += line
+                    else:
+                        timestamp, _, content = line.partition(b" ")
+                        try:
+                            parsed_timestamp = parse_rfc3339_nano(timestamp.decode())
+                        except ValueError:
+                            # an error message of the CLI
+                            outputs_without_timestamp[key] += line
+                            continue
+                        log_line = ContainerLogLine(
+                            key, source, parsed_timestamp, content
+                        )
+                        heapq.heappush(
+                            pending_lines,
+                            (parsed_timestamp, next(arrival_order), now, log_line),
+                        )
+
+                while pending_lines and (
+                    len(reader) == 0 or pending_lines[0][2] + reorder_window <= now
+                ):
+                    yield heapq.heappop(pending_lines)[3]
+        finally:
+            for process in processes.values():
+                process.kill()
+                process.stdout.close()
+                process.stderr.close()
+                process.wait()
+            reader.close()
+
+    @overload
+    def list(
+        self,
+        all: bool = ...,
+        filters: Union[Iterable[ContainerListFilter], Mapping[str, Any]] = ...,
+        prefetch: bool = ...,
+        details: Literal["objects"] = ...,
+    ) -> List[Container]: ...
+
+    @overload
+    def list(
+        self,
+        all: bool = ...,
+        filters: Union[Iterable[ContainerListFilter], Mapping[str, Any]] = ...,
+        prefetch: bool = ...,
+        *,
+        details: Literal["summary"],
+    ) -> List[ContainerSummary]: ...
+
+    @overload
+    def list(
+        self,
+        all: bool = ...,
+        filters: Union[Iterable[ContainerListFilter], Mapping[str, Any]] = ...,
+        prefetch: bool = ...,
+        *,
+        details: Literal["columns"],
+    ) -> Columns: ...
+
     def list(
         self,
         all: bool = False,
         filters: Union[Iterable[ContainerListFilter], Mapping[str, Any]] = (),
-    ) -> List[Container]:
+        prefetch: bool = False,
+        details: Literal["objects", "summary", "columns"] = "objects",
+    ):
         """List the containers on the host.
 
         Alias: `docker.ps(...)`
@@ -1290,9 +1655,24 @@ class ContainerCLI(DockerCLICaller):
         Parameters:
             all: If `True`, also returns containers that are not running.
             filters: Filters to apply when listing containers.
+            prefetch: If `True`, all the containers are inspected with a single
+                command and the returned objects keep this inspect result until
+                `reload()` is called on them. Reading their attributes then
+                doesn't launch any process.
+            details: With `"summary"`, returns the rows of the `docker ps`
+                table (names, image, status, ports...) as
+                `python_on_whales.ContainerSummary`, without inspecting the
+                containers. Use `ContainerSummary.to_container()` to get the
+                full `Container`. With `"columns"`, all the containers are
+                inspected with a single command and a
+                `python_on_whales.columns.Columns` table is built from the
+                json, without creating the models. Nested fields are
+                flattened, like `state.status`.
 
         # Returns
-            A `List[python_on_whales.Container]`
+            A `List[python_on_whales.Container]`, a
+            `List[python_on_whales.ContainerSummary]` if `details="summary"`,
+            or a `python_on_whales.columns.Columns` if `details="columns"`.
         """
         if isinstance(filters, Mapping):
             filters = filters.items()
@@ -1302,17 +1682,38 @@ class ContainerCLI(DockerCLICaller):
                 f"filters={list(filters)}",
                 DeprecationWarning,
             )
-        full_cmd = self.docker_cmd
-        full_cmd += ["container", "list", "-q", "--no-trunc"]
-        full_cmd.add_flag("--all", all)
-        full_cmd.add_args_iterable("--filter", (f"{f[0]}={f[1]}" for f in filters))
+        if details != "objects" and prefetch:
+            raise ValueError(f"`prefetch` can't be used with details='{details}'")
+        if details == "summary":
+            full_cmd = self.docker_cmd + ["container", "list", "--no-trunc"]
+            full_cmd += ["--format", "{{json .}}"]
+            full_cmd.add_flag("--all", all)
+            full_cmd.add_args_iterable("--filter", (f"{f[0]}={f[1]}" for f in filters))
+            return [
+                ContainerSummary(self.client_config, x)
+                for x in parse_json_lines(run(full_cmd))
+            ]
+
+        engine_api = self.client_config.get_engine_api()
+        if engine_api is not None:
+            ids = [x["Id"] for x in engine_api.list_containers(all, filters)]
+        else:
+            full_cmd = self.docker_cmd
+            full_cmd += ["container", "list", "-q", "--no-trunc"]
+            full_cmd.add_flag("--all", all)
+            full_cmd.add_args_iterable("--filter", (f"{f[0]}={f[1]}" for f in filters))
+            ids = run(full_cmd).splitlines()
 
         # TODO: add a test for the fix of is_immutable_id, without it, we get
         # race conditions (we read the attributes of a container but it might not exist.
-        return [
-            Container(self.client_config, x, is_immutable_id=True)
-            for x in run(full_cmd).splitlines()
+        containers = [
+            Container(self.client_config, x, is_immutable_id=True) for x in ids
         ]
+        if details == "columns":
+            return model_columns(ContainerInspectResult, bulk_inspect_json(containers))
+        if prefetch:
+            bulk_reload(containers, pin=True)
+        return containers
 
     def pause(
         self, containers: Union[ValidContainer, Iterable[ValidContainer]]
@@ -2006,11 +2407,31 @@ class ContainerCLI(DockerCLICaller):
         else:
             run(full_cmd)
 
+    @overload
+    def stats(
+        self,
+        containers: Optional[Union[ValidContainer, Iterable[ValidContainer]]] = ...,
+        all: bool = ...,
+        stream: Literal[False] = ...,
+        history: Optional[ContainerStatsHistory] = ...,
+    ) -> List[ContainerStats]: ...
+
+    @overload
+    def stats(
+        self,
+        containers: Optional[Union[ValidContainer, Iterable[ValidContainer]]] = ...,
+        all: bool = ...,
+        stream: Literal[True] = ...,
+        history: Optional[ContainerStatsHistory] = ...,
+    ) -> Iterator[ContainerStats]: ...
+
     def stats(
         self,
         containers: Optional[Union[ValidContainer, Iterable[ValidContainer]]] = None,
         all: bool = False,
-    ) -> List[ContainerStats]:
+        stream: bool = False,
+        history: Optional[ContainerStatsHistory] = None,
+    ) -> Union[List[ContainerStats], Iterator[ContainerStats]]:
         """Get containers resource usage statistics
 
         Alias: `docker.stats(...)`
@@ -2031,31 +2452,79 @@ class ContainerCLI(DockerCLICaller):
 
         The data unit is the byte.
 
+        With `stream=True`, a single `docker stats` process is kept open and
+        the stats of each container are yielded every time the daemon refreshes
+        them (about every second). Pass a `ContainerStatsHistory` to keep the
+        last samples of each container and compute averages or percentiles:
+
+        ```python
+        from python_on_whales import docker, ContainerStatsHistory
+
+        history = ContainerStatsHistory(size=60)
+        for stats in docker.stats(stream=True, history=history):
+            series = history[stats.container_id]
+            print(stats.container_name, series.mean("cpu_percentage"))
+            print(series.percentile("memory_used", 95))
+        ```
+
         Parameters:
             all: Get the stats of all containers, not just running ones.
             containers: One or a list of containers.
+            stream: If `True`, return an infinite iterator of
+                `python_on_whales.ContainerStats` instead of a single snapshot.
+            history: A `python_on_whales.ContainerStatsHistory` to which
+                every sample is added.
 
         # Returns
-            A `List[python_on_whales.ContainerStats]`.
+            A `List[python_on_whales.ContainerStats]`, or an iterator of
+            `python_on_whales.ContainerStats` if `stream=True`.
         """
         containers_list = to_list(containers) if containers else []
         if len(containers_list) == 0 and containers is not None and not all:
-            return []
+            return iter([]) if stream else []
 
         full_cmd = self.docker_cmd + [
             "container",
             "stats",
             "--format",
             "{{json .}}",
-            "--no-stream",
             "--no-trunc",
         ]
+        full_cmd.add_flag("--no-stream", not stream)
         full_cmd.add_flag("--all", all)
         if containers:
             full_cmd.extend(containers_list)
 
+        if stream:
+            return self._stream_stats(full_cmd, history)
         stats_output = run(full_cmd)
-        return [ContainerStats(json.loads(x)) for x in stats_output.splitlines()]
+        all_stats = []
+        for line in stats_output.splitlines():
+            json_dict = json.loads(line)
+            if _has_stats(json_dict):
+                all_stats.append(ContainerStats(json_dict))
+        if history is not None:
+            for stats in all_stats:
+                history.add(stats)
+        return all_stats
+
+    def _stream_stats(
+        self, full_cmd: List[Any], history: Optional[ContainerStatsHistory]
+    ) -> Iterator[ContainerStats]:
+        for stream_origin, line in stream_stdout_and_stderr(full_cmd):
+            if stream_origin != "stdout":
+                continue
+            # each frame starts by clearing the terminal
+            line = _ANSI_ESCAPE_SEQUENCE.sub(b"", line).strip()
+            if line == b"":
+                continue
+            json_dict = json.loads(line)
+            if not _has_stats(json_dict):
+                continue
+            stats = ContainerStats(json_dict)
+            if history is not None:
+                history.add(stats)
+            yield stats
 
     def stop(
         self,
@@ -2081,6 +2550,23 @@ class ContainerCLI(DockerCLICaller):
         if containers == []:
             # nothing to do
             return
+        engine_api = self.client_config.get_engine_api()
+        if engine_api is not None:
+            if isinstance(time, timedelta):
+                time = int(time.total_seconds())
+            if len(containers) == 1:
+                engine_api.stop_container(str(containers[0]), time)
+                return
+            # each request waits until its container is stopped, they are sent
+            # concurrently like the CLI does.
+            with ThreadPoolExecutor(min(len(containers), 16)) as executor:
+                futures = [
+                    executor.submit(engine_api.stop_container, str(x), time)
+                    for x in containers
+                ]
+            for future in futures:
+                future.result()
+            return
         full_cmd = self.docker_cmd + ["container", "stop"]
         full_cmd.add_simple_arg("--time", format_time_arg(time))
         full_cmd.extend(containers)
@@ -2246,36 +2732,405 @@ class ContainerCLI(DockerCLICaller):
         else:
             return int(run(full_cmd))
 
+    def wait_until(
+        self,
+        containers: Union[ValidContainer, Iterable[ValidContainer]],
+        state: Literal["running", "healthy", "exited"],
+        timeout: Union[None, float, timedelta] = None,
+    ) -> None:
+        """Block until one or more containers reach a state.
+
+        The containers are inspected once, with a single command, then the
+        changes of state are received from `docker system events`, through the
+        event bus of the client. So waiting for many containers doesn't poll
+        the daemon.
+
+        ```python
+        from python_on_whales import docker
+
+        containers = [docker.run("my_image", detach=True) for _ in range(200)]
+        docker.container.wait_until(containers, "healthy", timeout=60)
+        ```
+
+        Parameters:
+            containers: One or a list of containers to wait for.
+            state: `"running"`, `"healthy"` or `"exited"`. A container which is
+                removed is also considered as `"exited"`.
+            timeout: The maximum time to wait, in seconds or as a `timedelta`.
+                The default is to wait forever.
+
+        # Raises
+            `TimeoutError` if some containers didn't reach the state in time.
+            `RuntimeError` if waiting for `"running"` or `"healthy"` and a container
+                exited without being restarted, or was removed.
+            `ValueError` if waiting for `"healthy"` and a container has no healthcheck.
+            `python_on_whales.exceptions.NoSuchContainer` if a container does not exist.
+        """
+        if state not in _WAIT_UNTIL_ACTIONS:
+            raise ValueError(
+                f"state must be one of {list(_WAIT_UNTIL_ACTIONS)}, not '{state}'"
+            )
+        containers = to_list(containers)
+        if len(containers) == 0:
+            return
+        if isinstance(timeout, timedelta):
+            timeout = timeout.total_seconds()
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        actions = _WAIT_UNTIL_ACTIONS[state]
+        if state != "exited":
+            # to stop waiting for the containers which can't reach the state anymore
+            actions = actions + ["die", "destroy"]
+        # we subscribe before inspecting, so that no change is missed in between.
+        with self.client_config.get_event_bus().subscribe(
+            type="container", action=actions, policy="block"
+        ) as events:
+            pending = set()
+            for json_object in inspect_json(
+                self.client_config,
+                "container",
+                [str(x) for x in containers],
+                fields=_WAIT_UNTIL_FIELDS,
+            ):
+                container_name = removeprefix(json_object["Name"], "/")
+                container_state = ContainerState.model_validate(json_object["State"])
+                if state == "healthy" and container_state.health is None:
+                    raise ValueError(
+                        f"The container {container_name} has no healthcheck."
+                    )
+                if not _has_state(container_state, state):
+                    if state != "exited":
+                        _raise_if_stopped(container_name, container_state, state)
+                    pending.add(json_object["Id"])
+
+            while pending:
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"The containers {sorted(pending)} are not {state} "
+                            f"after {timeout} seconds."
+                        )
+                event = events.get(timeout=remaining)
+                if event is None or event.actor is None:
+                    continue
+                if event.actor.id not in pending:
+                    continue
+                if state != "exited" and event.action == "destroy":
+                    raise RuntimeError(
+                        f"The container {event.actor.id} was removed before "
+                        f"being {state}."
+                    )
+                if state != "exited" and event.action == "die":
+                    # the daemon sets the state before sending the event, so
+                    # we know if the container is restarting.
+                    try:
+                        (json_object,) = inspect_json(
+                            self.client_config,
+                            "container",
+                            [event.actor.id],
+                            fields=_WAIT_UNTIL_FIELDS,
+                        )
+                    except NoSuchContainer:
+                        # e.g. started with `--rm`, the destroy event follows
+                        raise RuntimeError(
+                            f"The container {event.actor.id} was removed before "
+                            f"being {state}."
+                        ) from None
+                    _raise_if_stopped(
+                        removeprefix(json_object["Name"], "/"),
+                        ContainerState.model_validate(json_object["State"]),
+                        state,
+                    )
+                    continue
+                if _event_reaches_state(event):
+                    pending.discard(event.actor.id)
+
+
+# the events telling that a container reached a state
+_WAIT_UNTIL_ACTIONS = {
+    "running": ["start"],
+    # podman doesn't put the status in the action, but in the attributes
+    "healthy": ["health_status: healthy", "health_status"],
+    "exited": ["die", "destroy"],
+}
+# the fields of the inspect results needed by `wait_until`
+_WAIT_UNTIL_FIELDS = ["Id", "Name", "State"]
+
+
+def _event_reaches_state(event: DockerEvent) -> bool:
+    if event.actor is None:
+        return False
+    if event.action == "health_status":
+        attributes = event.actor.attributes or {}
+        return attributes.get("health_status") == "healthy"
+    return True
+
+
+def _raise_if_stopped(
+    container_name: str, container_state: ContainerState, state: str
+) -> None:
+    if container_state.status in ("exited", "dead") and not container_state.restarting:
+        raise RuntimeError(
+            f"The container {container_name} exited and isn't restarting, "
+            f"it won't be {state}."
+        )
+
+
+def _has_state(container_state: ContainerState, state: str) -> bool:
+    if state == "running":
+        return bool(container_state.running)
+    if state == "healthy":
+        return container_state.health.status == "healthy"
+    return container_state.status in ("exited", "dead")
+
+
+class ContainerLogLine(NamedTuple):
+    """A line of the logs of a container, see `docker.container.logs_many`."""
+
+    container_id: str
+    source: str
+    timestamp: datetime
+    line: bytes
+
+
+def _has_stats(json_dict: Dict[str, Any]) -> bool:
+    # docker prints "--" instead of the values for a container which stopped
+    return json_dict["CPUPerc"] != "--" and "--" not in json_dict["MemUsage"]
+
 
 class ContainerStats:
+    __slots__ = (
+        "block_read",
+        "block_write",
+        "cpu_percentage",
+        "container",
+        "container_id",
+        "memory_percentage",
+        "memory_used",
+        "memory_limit",
+        "container_name",
+        "net_upload",
+        "net_download",
+    )
+
     def __init__(self, json_dict: Dict[str, Any]):
         """Takes a json_dict with container stats from the CLI and
         parses it.
         """
-        self.block_read: int = custom_parse_object_as(
-            pydantic.ByteSize, json_dict["BlockIO"].split("/")[0]
-        )
-        self.block_write: int = custom_parse_object_as(
-            pydantic.ByteSize, json_dict["BlockIO"].split("/")[1]
-        )
-        self.cpu_percentage: float = float(json_dict["CPUPerc"][:-1])
+        self.block_read: int
+        self.block_write: int
+        self.block_read, self.block_write = parse_byte_size_pair(json_dict["BlockIO"])
+        self.cpu_percentage: float = parse_percentage(json_dict["CPUPerc"])
         self.container: str = json_dict["Container"]
         self.container_id: str = json_dict["ID"]
-        self.memory_percentage: float = float(json_dict["MemPerc"][:-1])
-        self.memory_used: int = custom_parse_object_as(
-            pydantic.ByteSize, json_dict["MemUsage"].split("/")[0]
-        )
-        self.memory_limit: int = custom_parse_object_as(
-            pydantic.ByteSize, json_dict["MemUsage"].split("/")[1]
+        self.memory_percentage: float = parse_percentage(json_dict["MemPerc"])
+        self.memory_used: int
+        self.memory_limit: int
+        self.memory_used, self.memory_limit = parse_byte_size_pair(
+            json_dict["MemUsage"]
         )
         self.container_name: str = json_dict["Name"]
-        self.net_upload: int = custom_parse_object_as(
-            pydantic.ByteSize, json_dict["NetIO"].split("/")[0]
+        self.net_upload: int
+        self.net_download: int
+        self.net_upload, self.net_download = parse_byte_size_pair(json_dict["NetIO"])
+
+    def __repr__(self):
+        attr = ", ".join(f"{key}={getattr(self, key)}" for key in self.__slots__)
+        return f"<{self.__class__} object, attributes are {attr}>"
+
+
+class ContainerSummary:
+    """A row of `docker container list`, see `ContainerCLI.list(details="summary")`.
+
+    It only has what the CLI prints, no inspect is done. `to_container()`
+    returns the full `Container`.
+    """
+
+    __slots__ = (
+        "client_config",
+        "id",
+        "names",
+        "image",
+        "command",
+        "created_at",
+        "running_for",
+        "ports",
+        "state",
+        "status",
+        "size",
+        "labels",
+        "mounts",
+        "networks",
+        "local_volumes",
+    )
+
+    def __init__(self, client_config: ClientConfig, json_dict: Dict[str, Any]):
+        """Takes a json_dict of `docker container list --format '{{json .}}'`
+        and parses it.
+        """
+        self.client_config = client_config
+        self.id: str = json_dict["ID"]
+        self.names: List[str] = _split_column(json_dict.get("Names"))
+        self.image: str = json_dict.get("Image")
+        # the CLI puts the command between quotes
+        self.command: str = json_dict.get("Command", "").strip('"')
+        self.created_at: datetime = parse_go_time(json_dict["CreatedAt"])
+        self.running_for: str = json_dict.get("RunningFor")
+        self.ports: List[str] = _split_column(json_dict.get("Ports"))
+        self.state: str = json_dict.get("State")
+        self.status: str = json_dict.get("Status")
+        # only computed with `--size`, like "10B (virtual 77.9MB)"
+        size = json_dict.get("Size")
+        self.size: Optional[int] = (
+            parse_byte_size(size.partition("(")[0]) if size else None
+        )
+        self.labels: Dict[str, str] = dict(
+            x.partition("=")[::2] for x in _split_column(json_dict.get("Labels"))
         )
-        self.net_download: int = custom_parse_object_as(
-            pydantic.ByteSize, json_dict["NetIO"].split("/")[1]
+        self.mounts: List[str] = _split_column(json_dict.get("Mounts"))
+        self.networks: List[str] = _split_column(json_dict.get("Networks"))
+        local_volumes = json_dict.get("LocalVolumes")
+        self.local_volumes: Optional[int] = (
+            int(local_volumes) if local_volumes else None
         )
 
+    def to_container(self) -> Container:
+        """Returns the container, which is inspected when its attributes are read."""
+        return Container(self.client_config, self.id, is_immutable_id=True)
+
     def __repr__(self):
-        attr = ", ".join(f"{key}={value}" for key, value in self.__dict__.items())
+        attr = ", ".join(f"{key}={getattr(self, key)}" for key in self.__slots__[1:])
         return f"<{self.__class__} object, attributes are {attr}>"
+
+
+def _split_column(value: Optional[str]) -> List[str]:
+    if not value:
+        return []
+    return [x.strip() for x in value.split(",")]
+
+
+_ANSI_ESCAPE_SEQUENCE = re.compile(rb"\x1b\[[0-9;?]*[A-Za-z]")
+
+STATS_METRICS = (
+    "cpu_percentage",
+    "memory_used",
+    "memory_limit",
+    "memory_percentage",
+    "net_upload",
+    "net_download",
+    "block_read",
+    "block_write",
+)
+
+
+class ContainerStatsSeries:
+    """The last `size` stats samples of a container.
+
+    The samples are stored in fixed-size arrays of floats, one per metric
+    (see `STATS_METRICS`), which are overwritten in a circular way. No
+    `ContainerStats` object is kept.
+    """
+
+    def __init__(self, size: int):
+        if size <= 0:
+            raise ValueError(f"The size must be strictly positive, got {size}.")
+        self.size = size
+        self._timestamps = array("d", [0.0]) * size
+        self._metrics = {x: array("d", [0.0]) * size for x in STATS_METRICS}
+        self._next_index = 0
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(self, stats: ContainerStats, timestamp: Optional[float] = None):
+        if timestamp is None:
+            timestamp = time.time()
+        index = self._next_index
+        self._timestamps[index] = timestamp
+        for metric, values in self._metrics.items():
+            values[index] = getattr(stats, metric)
+        self._next_index = (index + 1) % self.size
+        self._length = min(self._length + 1, self.size)
+
+    def _window(self, values: array, window: Optional[int]) -> List[float]:
+        length = self._length if window is None else min(window, self._length)
+        start = (self._next_index - length) % self.size
+        if start + length <= self.size:
+            return values[start : start + length].tolist()
+        return (values[start:] + values[: self._next_index]).tolist()
+
+    def timestamps(self, window: Optional[int] = None) -> List[float]:
+        """The timestamps of the samples, from the oldest to the most recent.
+
+        Parameters:
+            window: Only return the last `window` samples.
+        """
+        return self._window(self._timestamps, window)
+
+    def values(self, metric: str, window: Optional[int] = None) -> List[float]:
+        """The values of a metric, from the oldest to the most recent.
+
+        Parameters:
+            metric: One of `STATS_METRICS`, for example `"cpu_percentage"`.
+            window: Only return the last `window` samples.
+        """
+        return self._window(self._metrics[metric], window)
+
+    def mean(self, metric: str, window: Optional[int] = None) -> float:
+        values = self.values(metric, window)
+        if len(values) == 0:
+            raise ValueError("No stats samples were recorded.")
+        return math.fsum(values) / len(values)
+
+    def percentile(
+        self, metric: str, percentile: float, window: Optional[int] = None
+    ) -> float:
+        """Returns the percentile (between 0 and 100) of the values of a metric.
+
+        Values are interpolated linearly between the closest ranks.
+        """
+        values = sorted(self.values(metric, window))
+        if len(values) == 0:
+            raise ValueError("No stats samples were recorded.")
+        rank = (len(values) - 1) * percentile / 100
+        lower = math.floor(rank)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (rank - lower)
+
+
+class ContainerStatsHistory:
+    """Keeps the last `size` stats samples of each container.
+
+    Pass it to `docker.stats(stream=True, history=...)` and access the
+    `ContainerStatsSeries` of a container with `history[container_id]`.
+    """
+
+    def __init__(self, size: int = 60):
+        self.size = size
+        self._series: Dict[str, ContainerStatsSeries] = {}
+
+    def add(self, stats: ContainerStats, timestamp: Optional[float] = None) -> None:
+        series = self._series.get(stats.container_id)
+        if series is None:
+            series = ContainerStatsSeries(self.size)
+            self._series[stats.container_id] = series
+        series.append(stats, timestamp)
+
+    def __getitem__(self, container: ValidContainer) -> ContainerStatsSeries:
+        return self._series[str(container)]
+
+    def __contains__(self, container: ValidContainer) -> bool:
+        return str(container) in self._series
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._series)
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def discard(self, container: ValidContainer) -> None:
+        """Forgets the samples of a container, for example after it was removed."""
+        self._series.pop(str(container), None)
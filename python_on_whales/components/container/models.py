@@ -5,7 +5,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 import pydantic
 from typing_extensions import Annotated
 
-from python_on_whales.utils import DockerCamelModel
+from python_on_whales.utils import DockerCamelModel, LazyDockerCamelModel
 
 
 class ContainerHealthcheckResult(DockerCamelModel):
@@ -285,7 +285,7 @@ class ContainerGraphDriver(DockerCamelModel):
     data: Optional[Dict[str, Any]] = None
 
 
-class ContainerInspectResult(DockerCamelModel):
+class ContainerInspectResult(LazyDockerCamelModel):
     id: Optional[str] = None
     created: Optional[datetime] = None
     path: Optional[str] = None
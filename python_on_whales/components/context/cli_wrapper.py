@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union, overload
@@ -15,7 +14,7 @@ from python_on_whales.components.context.models import (
     ContextInspectResult,
     ContextStorage,
 )
-from python_on_whales.utils import run, to_list
+from python_on_whales.utils import run, split_json_array, to_list
 
 
 class Context(ReloadableObjectFromJson):
@@ -37,12 +36,15 @@ class Context(ReloadableObjectFromJson):
         full_cmd = self.docker_cmd + ["context", "inspect"]
         if reference is not None:
             full_cmd.append(reference)
-        json_str = run(full_cmd)
-        return json.loads(json_str)[0]
+        json_array = run(full_cmd, decode=False)
+        return split_json_array(json_array)[0]
 
     def _parse_json_object(self, json_object: Dict[str, Any]):
         return ContextInspectResult(**json_object)
 
+    def _parse_json_text(self, json_text: Union[str, bytes]) -> ContextInspectResult:
+        return ContextInspectResult.model_validate_json(json_text)
+
     def _get_inspect_result(self) -> ContextInspectResult:
         """Only there to allow tools to know the return type"""
         return super()._get_inspect_result()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import json
+import threading
 import warnings
 from collections import OrderedDict
 from concurrent.futures.thread import ThreadPoolExecutor
@@ -9,9 +9,11 @@ from multiprocessing.pool import ThreadPool
 from pathlib import Path
 from queue import Empty as EmptyQueue
 from queue import Queue
-from subprocess import PIPE, Popen
+from subprocess import PIPE
 from typing import (
     Any,
+    Callable,
+    Dict,
     Iterable,
     Iterator,
     List,
@@ -26,22 +28,36 @@ from typing import (
 from typing_extensions import TypeAlias
 
 import python_on_whales.components.buildx.cli_wrapper
+import python_on_whales.components.container.cli_wrapper
 from python_on_whales.client_config import (
     ClientConfig,
     DockerCLICaller,
     ReloadableObjectFromJson,
+    bulk_inspect_json,
+    bulk_reload,
+    inspect_json,
 )
-from python_on_whales.components.container.cli_wrapper import (
-    ContainerCLI,
-    ContainerConfig,
-)
+from python_on_whales.columns import Columns, model_columns
 from python_on_whales.components.image.models import (
     ImageGraphDriver,
     ImageInspectResult,
     ImageRootFS,
 )
 from python_on_whales.exceptions import DockerException, NoSuchImage
-from python_on_whales.utils import ValidPath, run, stream_stdout_and_stderr, to_list
+from python_on_whales.utils import (
+    DEFAULT_CHUNK_SIZE,
+    ValidPath,
+    parse_byte_size,
+    parse_go_time,
+    parse_json_lines,
+    pipe_commands,
+    popen,
+    run,
+    split_json_array,
+    stream_stdout_and_stderr,
+    stream_stdout_in_chunks,
+    to_list,
+)
 
 ImageListFilter: TypeAlias = Union[
     Tuple[Literal["id"], str],
@@ -72,12 +88,29 @@ class Image(ReloadableObjectFromJson):
         self.remove(force=True)
 
     def _fetch_inspect_result_json(self, reference):
-        json_str = run(self.docker_cmd + ["image", "inspect", reference])
-        return json.loads(json_str)[0]
+        engine_api = self.client_config.get_engine_api()
+        if engine_api is not None:
+            return engine_api.inspect("image", reference)
+        json_array = run(
+            self.docker_cmd + ["image", "inspect", reference], decode=False
+        )
+        return split_json_array(json_array)[0]
+
+    def _fetch_inspect_results_json(self, references):
+        engine_api = self.client_config.get_engine_api()
+        if engine_api is not None:
+            return engine_api.inspect_many("image", references)
+        json_array = run(
+            self.docker_cmd + ["image", "inspect", *references], decode=False
+        )
+        return split_json_array(json_array)
 
     def _parse_json_object(self, json_object: Mapping[str, Any]) -> ImageInspectResult:
         return ImageInspectResult(**json_object)
 
+    def _parse_json_text(self, json_text: Union[str, bytes]) -> ImageInspectResult:
+        return ImageInspectResult.model_validate_json(json_text)
+
     def _get_inspect_result(self) -> ImageInspectResult:
         """Only there to allow tools to know the return type"""
         return super()._get_inspect_result()
@@ -113,7 +146,7 @@ class Image(ReloadableObjectFromJson):
     @property
     def container_config(
         self,
-    ) -> ContainerConfig:
+    ) -> python_on_whales.components.container.cli_wrapper.ContainerConfig:
         return self._get_inspect_result().container_config
 
     @property
@@ -127,7 +160,7 @@ class Image(ReloadableObjectFromJson):
     @property
     def config(
         self,
-    ) -> ContainerConfig:
+    ) -> python_on_whales.components.container.cli_wrapper.ContainerConfig:
         return self._get_inspect_result().config
 
     @property
@@ -177,13 +210,15 @@ class Image(ReloadableObjectFromJson):
         """
         ImageCLI(self.client_config).remove(self, force, prune)
 
-    def save(self, output: Optional[ValidPath] = None) -> Optional[Iterator[bytes]]:
+    def save(
+        self, output: Optional[ValidPath] = None, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Optional[Iterator[bytes]]:
         """Saves this Docker image in a tar.
 
         See the [`docker.image.save`](../sub-commands/image.md#python_on_whales.components.image.cli_wrapper.ImageCLI.save) command for
         information about the arguments.
         """
-        return ImageCLI(self.client_config).save(self, output)
+        return ImageCLI(self.client_config).save(self, output, chunk_size)
 
     def tag(self, new_tag: str) -> None:
         """Add a tag to a Docker image.
@@ -236,6 +271,57 @@ class Image(ReloadableObjectFromJson):
 ValidImage = Union[str, Image]
 
 
+class ImageSummary:
+    """A row of `docker image list`, see `ImageCLI.list(details="summary")`.
+
+    It only has what the CLI prints, no inspect is done. `to_image()`
+    returns the full `Image`.
+    """
+
+    __slots__ = (
+        "client_config",
+        "id",
+        "repository",
+        "tag",
+        "digest",
+        "created_at",
+        "created_since",
+        "size",
+        "containers",
+    )
+
+    def __init__(self, client_config: ClientConfig, json_dict: Dict[str, Any]):
+        """Takes a json_dict of `docker image list --format '{{json .}}'`
+        and parses it.
+        """
+        self.client_config = client_config
+        self.id: str = json_dict["ID"]
+        self.repository: Optional[str] = _none_if_missing(json_dict.get("Repository"))
+        self.tag: Optional[str] = _none_if_missing(json_dict.get("Tag"))
+        self.digest: Optional[str] = _none_if_missing(json_dict.get("Digest"))
+        self.created_at: datetime = parse_go_time(json_dict["CreatedAt"])
+        self.created_since: str = json_dict.get("CreatedSince")
+        self.size: int = parse_byte_size(json_dict["Size"])
+        containers = _none_if_missing(json_dict.get("Containers"))
+        self.containers: Optional[int] = (
+            int(containers) if containers is not None else None
+        )
+
+    def to_image(self) -> Image:
+        """Returns the image, which is inspected when its attributes are read."""
+        return Image(self.client_config, self.id, is_immutable_id=True)
+
+    def __repr__(self):
+        attr = ", ".join(f"{key}={getattr(self, key)}" for key in self.__slots__[1:])
+        return f"<{self.__class__} object, attributes are {attr}>"
+
+
+def _none_if_missing(value: Optional[str]) -> Optional[str]:
+    if value in ("", "<none>", "N/A"):
+        return None
+    return value
+
+
 class ImageCLI(DockerCLICaller):
     def __init__(self, client_config: ClientConfig):
         super().__init__(client_config)
@@ -363,17 +449,57 @@ class ImageCLI(DockerCLICaller):
     @overload
     def inspect(self, x: Iterable[str]) -> List[Image]: ...
 
-    def inspect(self, x: Union[str, Iterable[str]]) -> Union[Image, List[Image]]:
+    @overload
+    def inspect(self, x: str, *, raw: Literal[True]) -> Dict[str, Any]: ...
+
+    @overload
+    def inspect(
+        self, x: Iterable[str], *, raw: Literal[True]
+    ) -> List[Dict[str, Any]]: ...
+
+    @overload
+    def inspect(self, x: str, *, fields: List[str]) -> Dict[str, Any]: ...
+
+    @overload
+    def inspect(
+        self, x: Iterable[str], *, fields: List[str]
+    ) -> List[Dict[str, Any]]: ...
+
+    def inspect(
+        self,
+        x: Union[str, Iterable[str]],
+        *,
+        raw: bool = False,
+        fields: Optional[List[str]] = None,
+    ) -> Union[Image, List[Image], Dict[str, Any], List[Dict[str, Any]]]:
         """Creates a `python_on_whales.Image` object.
 
+        Parameters:
+            x: An image name or ID, or a list of those.
+            raw: If `True`, returns the json inspect result as a dict, without
+                validating it. All the images are inspected with a single command.
+            fields: If set, returns a dict with only these fields of the inspect
+                result, like `["Config.Labels", "Size"]`. They're selected by
+                `docker image inspect --format`. All the images are inspected
+                with a single command.
+
         # Returns
             `python_on_whales.Image`, or `List[python_on_whales.Image]` if the input
-            was a list of strings.
+            was a list of strings. A dict, or a list of dicts, if `raw` or
+            `fields` is used.
 
         # Raises
             `python_on_whales.exceptions.NoSuchImage` if one of the images does not exists.
 
         """
+        if raw and fields is not None:
+            raise ValueError("`raw` and `fields` can't be used together.")
+        if raw or fields is not None:
+            json_objects = inspect_json(
+                self.client_config, "image", [str(y) for y in to_list(x)], fields
+            )
+            return json_objects[0] if isinstance(x, str) else json_objects
+
         if isinstance(x, str):
             return Image(self.client_config, x)
         else:
@@ -439,10 +565,9 @@ class ImageCLI(DockerCLICaller):
         return all_tags
 
     def _load_from_generator(self, full_cmd: List[str], input: Iterator[bytes]):
-        p = Popen(full_cmd, stdin=PIPE, stdout=PIPE)
+        p = popen(full_cmd, stdin=PIPE, stdout=PIPE)
         for buffer_bytes in input:
             p.stdin.write(buffer_bytes)
-            p.stdin.flush()
         p.stdin.close()
         stdout = p.stdout.read()
         p.stdout.close()
@@ -451,20 +576,73 @@ class ImageCLI(DockerCLICaller):
             raise DockerException(full_cmd, exit_code)
         return stdout.decode().splitlines()
 
+    @overload
+    def list(
+        self,
+        repository_or_tag: Optional[str] = ...,
+        filters: Union[Iterable[ImageListFilter], Mapping[str, Any]] = ...,
+        all: bool = ...,
+        prefetch: bool = ...,
+        details: Literal["objects"] = ...,
+    ) -> List[Image]: ...
+
+    @overload
+    def list(
+        self,
+        repository_or_tag: Optional[str] = ...,
+        filters: Union[Iterable[ImageListFilter], Mapping[str, Any]] = ...,
+        all: bool = ...,
+        prefetch: bool = ...,
+        *,
+        details: Literal["summary"],
+    ) -> List[ImageSummary]: ...
+
+    @overload
+    def list(
+        self,
+        repository_or_tag: Optional[str] = ...,
+        filters: Union[Iterable[ImageListFilter], Mapping[str, Any]] = ...,
+        all: bool = ...,
+        prefetch: bool = ...,
+        *,
+        details: Literal["columns"],
+    ) -> Columns: ...
+
     def list(
         self,
         repository_or_tag: Optional[str] = None,
         filters: Union[Iterable[ImageListFilter], Mapping[str, Any]] = (),
         all: bool = False,
-    ) -> List[Image]:
+        prefetch: bool = False,
+        details: Literal["objects", "summary", "columns"] = "objects",
+    ):
         """Returns the list of Docker images present on the machine.
 
         Alias: `docker.images()`
 
         Note that each image may have multiple tags.
 
+        Parameters:
+            repository_or_tag: Only list the images of this repository or tag.
+            filters: Filters to apply when listing images.
+            all: Show all images (default hides intermediate images).
+            prefetch: If `True`, all the images are inspected with a single
+                command and the returned objects keep this inspect result until
+                `reload()` is called on them. Reading their attributes then
+                doesn't launch any process.
+            details: With `"summary"`, returns the rows of the `docker images`
+                table (repository, tag, size...) as
+                `python_on_whales.ImageSummary`, without inspecting the images.
+                Like in the table, an image with many tags has one row per tag.
+                Use `ImageSummary.to_image()` to get the full `Image`. With
+                `"columns"`, all the images are inspected with a single
+                command and a `python_on_whales.columns.Columns` table is
+                built from the json, without creating the models.
+
         # Returns
-            A `List[python_on_whales.Image]` object.
+            A `List[python_on_whales.Image]` object, a
+            `List[python_on_whales.ImageSummary]` if `details="summary"`,
+            or a `python_on_whales.columns.Columns` if `details="columns"`.
         """
         if isinstance(filters, Mapping):
             filters = filters.items()
@@ -474,23 +652,34 @@ class ImageCLI(DockerCLICaller):
                 f"filters={list(filters)}",
                 DeprecationWarning,
             )
-        full_cmd = self.docker_cmd + [
-            "image",
-            "list",
-            "--quiet",
-            "--no-trunc",
-        ]
+        if details != "objects" and prefetch:
+            raise ValueError(f"`prefetch` can't be used with details='{details}'")
+        full_cmd = self.docker_cmd + ["image", "list", "--no-trunc"]
+        if details == "summary":
+            full_cmd += ["--format", "{{json .}}"]
+        else:
+            full_cmd.append("--quiet")
         full_cmd.add_flag("--all", all)
         full_cmd.add_args_iterable("--filter", (f"{f[0]}={f[1]}" for f in filters))
 
         if repository_or_tag is not None:
             full_cmd.append(repository_or_tag)
 
+        if details == "summary":
+            return [
+                ImageSummary(self.client_config, x)
+                for x in parse_json_lines(run(full_cmd))
+            ]
         ids = run(full_cmd).splitlines()
         # the list of tags is bigger than the number of images. We uniquify
         ids = set(ids)
 
-        return [Image(self.client_config, x, is_immutable_id=True) for x in ids]
+        images = [Image(self.client_config, x, is_immutable_id=True) for x in ids]
+        if details == "columns":
+            return model_columns(ImageInspectResult, bulk_inspect_json(images))
+        if prefetch:
+            bulk_reload(images, pin=True)
+        return images
 
     def prune(
         self,
@@ -823,6 +1012,7 @@ class ImageCLI(DockerCLICaller):
         self,
         images: Union[ValidImage, Iterable[ValidImage]],
         output: Optional[ValidPath] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ) -> Optional[Iterator[bytes]]:
         """Save one or more images to a tar archive. Returns a stream if output is `None`
 
@@ -833,12 +1023,15 @@ class ImageCLI(DockerCLICaller):
             output: Path of the tar archive to produce. If `output` is None, a generator
                 of bytes is produced. It can be used to stream those bytes elsewhere,
                 to another Docker daemon for example.
+            chunk_size: When streaming, the size in bytes of the chunks yielded
+                (only the last one can be smaller). Default is 1 MiB.
 
         # Returns
             `Optional[Iterator[bytes]]`. If output is a path, nothing is returned.
 
         # Raises
             `python_on_whales.exceptions.NoSuchImage` if one of the images does not exist.
+            When streaming, it's raised when iterating.
 
         # Example
 
@@ -865,29 +1058,104 @@ class ImageCLI(DockerCLICaller):
         if len(images) == 0:
             raise ValueError("One or more images must be provided")
 
-        # Trigger an exception early if an image doesn't exist.
-        self.inspect(images)
-
         full_cmd = self.docker_cmd + ["image", "save"]
         full_cmd.add_simple_arg("--output", output)
         full_cmd.extend(images)
         if output is None:
             # we stream the bytes
-            return self._save_generator(full_cmd)
+            return self._save_stream(full_cmd, images, chunk_size)
         else:
-            run(full_cmd)
-
-    def _save_generator(self, full_cmd: List[Any]) -> Iterator[bytes]:
-        full_cmd = [str(x) for x in full_cmd]
-        p = Popen(full_cmd, stdout=PIPE, stderr=PIPE)
-        for line in p.stdout:
-            yield line
-        exit_code = p.wait(0.1)
-        if exit_code != 0:
-            stderr = p.stderr.read()
-            if "No such image" in stderr.decode():
-                raise NoSuchImage(full_cmd, exit_code, stderr=stderr)
-            raise DockerException(full_cmd, exit_code, stderr=stderr)
+            try:
+                run(full_cmd)
+            except NoSuchImage:
+                self._raise_no_such_image(images)
+                raise
+
+    def _save_stream(
+        self, full_cmd: List[str], images: List[ValidImage], chunk_size: int
+    ) -> Iterator[bytes]:
+        try:
+            yield from stream_stdout_in_chunks(full_cmd, chunk_size)
+        except NoSuchImage:
+            self._raise_no_such_image(images)
+            raise
+
+    def _raise_no_such_image(self, images: List[ValidImage]) -> None:
+        # With the classic image store, `docker save` only says "reference
+        # does not exist". The inspect tells which image is missing.
+        self.inspect(images)
+
+    def transfer(
+        self,
+        images: Union[ValidImage, Iterable[ValidImage]],
+        to: DockerCLICaller,
+        progress: Optional[Callable[[int], None]] = None,
+        parallel: int = 1,
+    ) -> List[str]:
+        """Copies images to another Docker daemon, like `docker save ... | docker load`.
+
+        The output of `docker image save` is connected to the input of
+        `docker image load` at the OS level, the bytes don't go through Python
+        (or, when `progress` is given, with `os.splice` where available).
+
+        ```python
+        from python_on_whales import DockerClient, docker
+
+        edge_node = DockerClient(host="ssh://my_user@186.167.32.84")
+        docker.image.transfer(
+            ["redis:7", "nginx:1.25"],
+            to=edge_node,
+            progress=lambda n: print(f"{n} bytes sent"),
+        )
+        ```
+
+        Parameters:
+            images: Single image or non-empty iterable of images to transfer.
+            to: The client of the daemon receiving the images, a
+                `python_on_whales.DockerClient` for example.
+            progress: Called with the total number of bytes transferred so far,
+                from the thread doing the transfer.
+            parallel: The number of images transferred at the same time. With
+                the default, `1`, all images are sent in a single archive,
+                so that the layers they share are sent only once.
+
+        # Returns
+            The list of the images loaded by the destination, as printed by
+            `docker image load` (tags, or IDs for untagged images).
+
+        # Raises
+            `python_on_whales.exceptions.NoSuchImage` if one of the images does not exist.
+        """
+        images = to_list(images)
+        if len(images) == 0:
+            raise ValueError("One or more images must be provided")
+
+        load_cmd = to.docker_cmd + ["image", "load"]
+        lock = threading.Lock()
+        total = 0
+
+        def count_bytes(count: int):
+            nonlocal total
+            with lock:
+                total += count
+                progress(total)
+
+        on_bytes = None if progress is None else count_bytes
+
+        def transfer_images(images_to_transfer: List[ValidImage]) -> List[str]:
+            save_cmd = self.docker_cmd + ["image", "save", *images_to_transfer]
+            stdout = pipe_commands(save_cmd, load_cmd, on_bytes)
+            return [
+                line.split(" ")[-1]
+                for line in stdout.splitlines()
+                if "Loaded image" in line
+            ]
+
+        if parallel <= 1 or len(images) == 1:
+            return transfer_images(images)
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+            results = executor.map(transfer_images, [[x] for x in images])
+            return [tag for tags in results for tag in tags]
 
     def tag(self, source_image: Union[Image, str], new_tag: str):
         """Adds a tag to a Docker image.
@@ -926,7 +1194,9 @@ class ImageCLI(DockerCLICaller):
         destination: ValidPath,
         pull: str = "missing",
     ):
-        with ContainerCLI(self.client_config).create(image, pull=pull) as tmp_container:
+        with python_on_whales.components.container.cli_wrapper.ContainerCLI(
+            self.client_config
+        ).create(image, pull=pull) as tmp_container:
             tmp_container.copy_from(path_in_image, destination)
 
     def copy_to(
@@ -937,8 +1207,8 @@ class ImageCLI(DockerCLICaller):
         new_tag: Optional[str] = None,
         pull: str = "missing",
     ) -> Image:
-        with ContainerCLI(self.client_config).create(
-            base_image, pull=pull
-        ) as tmp_container:
+        with python_on_whales.components.container.cli_wrapper.ContainerCLI(
+            self.client_config
+        ).create(base_image, pull=pull) as tmp_container:
             tmp_container.copy_to(local_path, path_in_image)
             return tmp_container.commit(tag=new_tag)
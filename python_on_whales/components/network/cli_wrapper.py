@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import warnings
 from datetime import datetime
 from typing import (
@@ -23,6 +22,7 @@ from python_on_whales.client_config import (
     ClientConfig,
     DockerCLICaller,
     ReloadableObjectFromJson,
+    bulk_reload,
 )
 from python_on_whales.components.network.models import (
     NetworkContainer,
@@ -30,7 +30,12 @@ from python_on_whales.components.network.models import (
     NetworkIPAM,
 )
 from python_on_whales.exceptions import NoSuchNetwork
-from python_on_whales.utils import format_mapping_for_cli, run, to_list
+from python_on_whales.utils import (
+    format_mapping_for_cli,
+    run,
+    split_json_array,
+    to_list,
+)
 
 NetworkListFilter: TypeAlias = Union[
     Tuple[Literal["driver"], str],
@@ -58,12 +63,29 @@ class Network(ReloadableObjectFromJson):
         self.remove()
 
     def _fetch_inspect_result_json(self, reference):
-        json_str = run(self.docker_cmd + ["network", "inspect", reference])
-        return json.loads(json_str)[0]
+        engine_api = self.client_config.get_engine_api()
+        if engine_api is not None:
+            return engine_api.inspect("network", reference)
+        json_array = run(
+            self.docker_cmd + ["network", "inspect", reference], decode=False
+        )
+        return split_json_array(json_array)[0]
+
+    def _fetch_inspect_results_json(self, references):
+        engine_api = self.client_config.get_engine_api()
+        if engine_api is not None:
+            return engine_api.inspect_many("network", references)
+        json_array = run(
+            self.docker_cmd + ["network", "inspect", *references], decode=False
+        )
+        return split_json_array(json_array)
 
     def _parse_json_object(self, json_object: Dict[str, Any]) -> NetworkInspectResult:
         return NetworkInspectResult(**json_object)
 
+    def _parse_json_text(self, json_text: Union[str, bytes]) -> NetworkInspectResult:
+        return NetworkInspectResult.model_validate_json(json_text)
+
     def _get_inspect_result(self) -> NetworkInspectResult:
         """Only there to allow tools to know the return type"""
         return super()._get_inspect_result()
@@ -287,12 +309,18 @@ class NetworkCLI(DockerCLICaller):
             return [Network(self.client_config, reference) for reference in x]
 
     def list(
-        self, filters: Union[Iterable[NetworkListFilter], Mapping[str, Any]] = ()
+        self,
+        filters: Union[Iterable[NetworkListFilter], Mapping[str, Any]] = (),
+        prefetch: bool = False,
     ) -> List[Network]:
         """List all the networks available.
 
         Parameters:
             filters: Filters to apply when listing networks.
+            prefetch: If `True`, all the networks are inspected with a single
+                command and the returned objects keep this inspect result until
+                `reload()` is called on them. Reading their attributes then
+                doesn't launch any process.
 
         # Returns
             List of `python_on_whales.Network`.
@@ -309,7 +337,12 @@ class NetworkCLI(DockerCLICaller):
         full_cmd.add_args_iterable("--filter", (f"{f[0]}={f[1]}" for f in filters))
 
         ids = run(full_cmd).splitlines()
-        return [Network(self.client_config, id_, is_immutable_id=True) for id_ in ids]
+        networks = [
+            Network(self.client_config, id_, is_immutable_id=True) for id_ in ids
+        ]
+        if prefetch:
+            bulk_reload(networks, pin=True)
+        return networks
 
     def prune(
         self, filters: Union[Iterable[NetworkListFilter], Mapping[str, Any]] = ()
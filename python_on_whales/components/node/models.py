@@ -4,7 +4,7 @@ from typing import Dict, List, Optional
 from pydantic import Field
 from typing_extensions import Annotated
 
-from python_on_whales.utils import DockerCamelModel
+from python_on_whales.utils import DockerCamelModel, LazyDockerCamelModel
 
 
 class NodeVersion(DockerCamelModel):
@@ -81,7 +81,7 @@ class NodeManagerStatus(DockerCamelModel):
     addr: Optional[str] = None
 
 
-class NodeInspectResult(DockerCamelModel):
+class NodeInspectResult(LazyDockerCamelModel):
     id: Annotated[Optional[str], Field(alias="ID")] = None
     version: Optional[NodeVersion] = None
     created_at: Optional[datetime] = None
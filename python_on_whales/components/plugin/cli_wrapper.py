@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import Any, Dict, List, Optional, Union, overload
 
 from python_on_whales.client_config import (
@@ -13,7 +12,7 @@ from python_on_whales.components.plugin.models import (
     PluginInspectResult,
     PluginSettings,
 )
-from python_on_whales.utils import ValidPath, run, to_list
+from python_on_whales.utils import ValidPath, run, split_json_array, to_list
 
 
 class Plugin(ReloadableObjectFromJson):
@@ -29,12 +28,17 @@ class Plugin(ReloadableObjectFromJson):
         self.remove(force=True)
 
     def _fetch_inspect_result_json(self, reference):
-        json_str = run(self.docker_cmd + ["plugin", "inspect", reference])
-        return json.loads(json_str)[0]
+        json_array = run(
+            self.docker_cmd + ["plugin", "inspect", reference], decode=False
+        )
+        return split_json_array(json_array)[0]
 
     def _parse_json_object(self, json_object: Dict[str, Any]) -> PluginInspectResult:
         return PluginInspectResult(**json_object)
 
+    def _parse_json_text(self, json_text: Union[str, bytes]) -> PluginInspectResult:
+        return PluginInspectResult.model_validate_json(json_text)
+
     def _get_inspect_result(self) -> PluginInspectResult:
         """Only there to allow tools to know the return type"""
         return super()._get_inspect_result()
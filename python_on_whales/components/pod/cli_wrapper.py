@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 from typing import (
     Any,
     Iterable,
+    Iterator,
     List,
     Literal,
     Mapping,
@@ -32,6 +33,7 @@ from python_on_whales.components.pod.models import (
 )
 from python_on_whales.components.volume.cli_wrapper import VolumeDefinition
 from python_on_whales.exceptions import NoSuchPod
+from python_on_whales.log_cursor import LogCursor, LogRecord, read_log_records
 from python_on_whales.utils import (
     ValidPath,
     ValidPortMapping,
@@ -39,6 +41,8 @@ from python_on_whales.utils import (
     format_signal_arg,
     format_time_arg,
     join_if_not_none,
+    parse_byte_size_pair,
+    parse_percentage,
     run,
     stream_stdout_and_stderr,
     to_list,
@@ -72,12 +76,14 @@ class Pod(ReloadableObjectFromJson):
         self.remove(force=True)
 
     def _fetch_inspect_result_json(self, reference):
-        json_str = run(self.docker_cmd + ["pod", "inspect", reference])
-        return json.loads(json_str)
+        return run(self.docker_cmd + ["pod", "inspect", reference], decode=False)
 
     def _parse_json_object(self, json_object: Mapping[str, Any]) -> PodInspectResult:
         return PodInspectResult(**json_object)
 
+    def _parse_json_text(self, json_text: Union[str, bytes]) -> PodInspectResult:
+        return PodInspectResult.model_validate_json(json_text)
+
     def _get_inspect_result(self) -> PodInspectResult:
         """Only there to allow tools to know the return type"""
         return super()._get_inspect_result()
@@ -591,7 +597,8 @@ class PodCLI(DockerCLICaller):
             if `stream=True`.
 
         # Raises
-            `python_on_whales.exceptions.NoSuchPod` if the container does not exist.
+            `python_on_whales.exceptions.NoSuchPod` if the pod does not exist.
+            With `stream=True`, it's raised when iterating.
 
         If you are a bit confused about `follow` and `stream`, here are some use cases.
 
@@ -601,9 +608,6 @@ class PodCLI(DockerCLICaller):
         in memory because they are too big, use `stream=True`.
         """
 
-        # first we verify that the pod exists and raise an exception if not.
-        self.inspect(pod)
-
         full_cmd = self.docker_cmd + ["pod", "logs"]
         full_cmd.add_simple_arg("--container", container)
         full_cmd.add_flag("--names", names)
@@ -621,6 +625,53 @@ class PodCLI(DockerCLICaller):
         else:
             return "".join(x[1].decode() for x in iterator)
 
+    def log_records(
+        self,
+        pod: ValidPod,
+        container: Optional[
+            python_on_whales.components.container.cli_wrapper.ValidContainer
+        ] = None,
+        *,
+        cursor: Optional[LogCursor] = None,
+        names: bool = False,
+        since: Union[None, datetime, timedelta] = None,
+        tail: Optional[int] = None,
+        until: Union[None, datetime, timedelta] = None,
+        follow: bool = False,
+    ) -> Iterator[LogRecord]:
+        """Returns the logs of a pod's containers as an iterator of parsed records.
+
+        Parameters:
+            pod: The pod to get the container logs of
+            container: Filter logs by container
+            cursor: A `python_on_whales.LogCursor`. It's advanced as the records
+                are read, and if it was already used, the logs are resumed
+                after the last record read, without duplicates.
+            names: Output container names instead of IDs in the logs
+            since: Use a datetime or timedelta to specify the lower
+                date limit for the logs. Ignored if the cursor was already used.
+            tail: Number of lines to show from the end of the logs (default all)
+            until: Use a datetime or a timedelta to specify the upper date
+                limit for the logs.
+            follow: Continue to stream the logs until the containers stop.
+
+        # Returns
+            An iterator of `python_on_whales.LogRecord`, which are named tuples
+            `(timestamp, source, line)`. When podman prefixes the lines with the
+            container id (or name), the prefix is kept at the start of `line`.
+
+        # Raises
+            `python_on_whales.exceptions.NoSuchPod` if the pod does not exist,
+            when iterating.
+        """
+        full_cmd = self.docker_cmd + ["pod", "logs"]
+        full_cmd.add_simple_arg("--container", container)
+        full_cmd.add_flag("--names", names)
+        full_cmd.add_simple_arg("--tail", tail)
+        full_cmd.add_simple_arg("--until", format_time_arg(until))
+        full_cmd.add_flag("--follow", follow)
+        return read_log_records(full_cmd, pod, cursor or LogCursor(), since)
+
     def pause(self, x: Union[ValidPod, Iterable[ValidPod]], /) -> None:
         """Pauses one or more pods
 
@@ -717,8 +768,6 @@ class PodCLI(DockerCLICaller):
         # Returns
             A `List[python_on_whales.PodStats]`.
         """
-        raise NotImplementedError  # TODO: implement PodStats class
-
         pods = to_list(x)
         if len(pods) == 0:
             return []
@@ -729,6 +778,7 @@ class PodCLI(DockerCLICaller):
             "{{json .}}",
             "--no-stream",
         ]
+        full_cmd.extend([str(p) for p in pods])
         stats_output = run(full_cmd)
         return [PodStats(json.loads(s)) for s in stats_output.splitlines()]
 
@@ -780,12 +830,47 @@ class PodCLI(DockerCLICaller):
 
 
 class PodStats:
+    __slots__ = (
+        "block_read",
+        "block_write",
+        "cpu_percentage",
+        "container_id",
+        "container_name",
+        "memory_percentage",
+        "memory_used",
+        "memory_limit",
+        "net_upload",
+        "net_download",
+        "pids",
+        "pod_id",
+    )
+
     def __init__(self, json_dict: Mapping[str, Any]):
         """Takes a json_dict with pod stats from the CLI and
         parses it.
+
+        There is one `PodStats` per container of the pod.
         """
-        # TODO: See ContainerStats class.
+        self.block_read: int
+        self.block_write: int
+        self.block_read, self.block_write = parse_byte_size_pair(json_dict["BlockIO"])
+        self.cpu_percentage: float = parse_percentage(json_dict["CPU"])
+        self.container_id: str = json_dict["CID"]
+        self.container_name: str = json_dict["Name"]
+        self.memory_percentage: float = parse_percentage(json_dict["Mem"])
+        self.memory_used: int
+        self.memory_limit: int
+        self.memory_used, self.memory_limit = parse_byte_size_pair(
+            json_dict.get("MemUsageBytes") or json_dict["MemUsage"]
+        )
+        self.net_upload: int
+        self.net_download: int
+        self.net_upload, self.net_download = parse_byte_size_pair(json_dict["NetIO"])
+        self.pids: Optional[int] = (
+            int(json_dict["PIDS"]) if json_dict["PIDS"].isdigit() else None
+        )
+        self.pod_id: str = json_dict["Pod"]
 
     def __repr__(self):
-        attr = ", ".join(f"{key}={value}" for key, value in self.__dict__.items())
+        attr = ", ".join(f"{key}={getattr(self, key)}" for key in self.__slots__)
         return f"<{self.__class__} object, attributes are {attr}>"
@@ -1,5 +1,4 @@
 import datetime as dt
-import json
 import warnings
 from typing import (
     Any,
@@ -21,7 +20,13 @@ from python_on_whales.client_config import (
     ReloadableObjectFromJson,
 )
 from python_on_whales.components.secret.models import SecretInspectResult, SecretSpec
-from python_on_whales.utils import ValidPath, format_mapping_for_cli, run, to_list
+from python_on_whales.utils import (
+    ValidPath,
+    format_mapping_for_cli,
+    run,
+    split_json_array,
+    to_list,
+)
 
 SecretListFilter: TypeAlias = Union[
     Tuple[Literal["id"], str],
@@ -44,12 +49,17 @@ class Secret(ReloadableObjectFromJson):
         self.remove()
 
     def _fetch_inspect_result_json(self, reference):
-        json_str = run(self.docker_cmd + ["secret", "inspect", reference])
-        return json.loads(json_str)[0]
+        json_array = run(
+            self.docker_cmd + ["secret", "inspect", reference], decode=False
+        )
+        return split_json_array(json_array)[0]
 
     def _parse_json_object(self, json_object: Dict[str, Any]) -> SecretInspectResult:
         return SecretInspectResult(**json_object)
 
+    def _parse_json_text(self, json_text: Union[str, bytes]) -> SecretInspectResult:
+        return SecretInspectResult.model_validate_json(json_text)
+
     def _get_inspect_result(self) -> SecretInspectResult:
         """Only there to allow tools to know the return type"""
         return super()._get_inspect_result()
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
 import warnings
 from datetime import datetime, timedelta
 from typing import (
     Any,
     Dict,
     Iterable,
+    Iterator,
     List,
     Literal,
     Mapping,
@@ -33,11 +33,13 @@ from python_on_whales.components.service.models import (
     ServiceVersion,
 )
 from python_on_whales.exceptions import NoSuchService
+from python_on_whales.log_cursor import LogCursor, LogRecord, read_log_records
 from python_on_whales.utils import (
     ValidPath,
     format_mapping_for_cli,
     format_time_arg,
     run,
+    split_json_array,
     stream_stdout_and_stderr,
     to_list,
 )
@@ -63,12 +65,17 @@ class Service(ReloadableObjectFromJson):
         self.remove()
 
     def _fetch_inspect_result_json(self, reference):
-        json_str = run(self.docker_cmd + ["service", "inspect", reference])
-        return json.loads(json_str)[0]
+        json_array = run(
+            self.docker_cmd + ["service", "inspect", reference], decode=False
+        )
+        return split_json_array(json_array)[0]
 
     def _parse_json_object(self, json_object: Dict[str, Any]) -> ServiceInspectResult:
         return ServiceInspectResult(**json_object)
 
+    def _parse_json_text(self, json_text: Union[str, bytes]) -> ServiceInspectResult:
+        return ServiceInspectResult.model_validate_json(json_text)
+
     def _get_inspect_result(self) -> ServiceInspectResult:
         """Only there to allow tools to know the return type"""
         return super()._get_inspect_result()
@@ -351,10 +358,8 @@ class ServiceCLI(DockerCLICaller):
 
         # Raises
             `python_on_whales.exceptions.NoSuchService` if the service does not exists.
+            With `stream=True`, it's raised when iterating.
         """
-        # first we verify that the service exists and raise an exception if not.
-        self.inspect(str(service))
-
         full_cmd = self.docker_cmd + ["service", "logs"]
         full_cmd.add_flag("--details", details)
         full_cmd.add_simple_arg("--since", format_time_arg(since))
@@ -373,6 +378,44 @@ class ServiceCLI(DockerCLICaller):
         else:
             return "".join(x[1].decode() for x in iterator)
 
+    def log_records(
+        self,
+        service: ValidService,
+        *,
+        cursor: Optional[LogCursor] = None,
+        since: Union[None, datetime, timedelta] = None,
+        tail: Optional[int] = None,
+        follow: bool = False,
+        raw: bool = False,
+    ) -> Iterator[LogRecord]:
+        """Returns the logs of a service as an iterator of parsed records.
+
+        Parameters:
+            service: The service to get the logs of
+            cursor: A `python_on_whales.LogCursor`. It's advanced as the records
+                are read, and if it was already used, the logs are resumed
+                after the last record read, without duplicates.
+            since: Use a datetime or timedelta to specify the lower
+                date limit for the logs. Ignored if the cursor was already used.
+            tail: Number of lines to show from the end of the logs (default all)
+            follow: Follow log output
+            raw: Do not neatly format logs. The line of the records
+                won't start with the task context.
+
+        # Returns
+            An iterator of `python_on_whales.LogRecord`, which are named tuples
+            `(timestamp, source, line)`.
+
+        # Raises
+            `python_on_whales.exceptions.NoSuchService` if the service does not
+            exist, when iterating.
+        """
+        full_cmd = self.docker_cmd + ["service", "logs"]
+        full_cmd.add_simple_arg("--tail", tail)
+        full_cmd.add_flag("--follow", follow)
+        full_cmd.add_flag("--raw", raw)
+        return read_log_records(full_cmd, service, cursor or LogCursor(), since)
+
     def list(
         self, filters: Union[Iterable[ServiceListFilter], Mapping[str, Any]] = ()
     ) -> List[Service]:
@@ -4,7 +4,7 @@ from typing import Any, Dict, List, Optional, Union
 from pydantic import Field
 from typing_extensions import Annotated
 
-from python_on_whales.utils import DockerCamelModel
+from python_on_whales.utils import DockerCamelModel, LazyDockerCamelModel
 
 
 class CPUMemoryQuotas(DockerCamelModel):
@@ -83,7 +83,7 @@ class ServiceUpdateStatus(DockerCamelModel):
     message: Optional[str] = None
 
 
-class ServiceInspectResult(DockerCamelModel):
+class ServiceInspectResult(LazyDockerCamelModel):
     id: Annotated[Optional[str], Field(alias="ID")] = None
     version: Optional[ServiceVersion] = None
     created_at: Optional[datetime] = None
@@ -1,13 +1,31 @@
 import datetime
 import json
-from typing import Dict, Iterator, Union
+import threading
+import time
+from collections import deque
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Union,
+    overload,
+)
 
-from python_on_whales.client_config import DockerCLICaller
+from python_on_whales import utils
+from python_on_whales.client_config import ClientConfig, DockerCLICaller
+from python_on_whales.columns import Columns, model_columns
 from python_on_whales.components.system.models import (
     DockerEvent,
     DockerItemsSummary,
     SystemInfo,
 )
+from python_on_whales.exceptions import DockerException
 from python_on_whales.utils import (
     format_mapping_for_cli,
     format_time_arg,
@@ -16,19 +34,24 @@ from python_on_whales.utils import (
 )
 
 
+def _parse_disk_free_lines(cli_stdout: str) -> Dict[str, Dict[str, str]]:
+    docker_items = {}
+    for line in cli_stdout.splitlines():
+        docker_items_dict = json.loads(line)
+        reclamable = docker_items_dict["Reclaimable"]
+        docker_items_dict["Reclaimable"] = reclamable.split(" ")[0]
+        if "%" in reclamable:
+            docker_items_dict["ReclaimablePercent"] = reclamable.split(" ")[1][1:-2]
+        else:
+            docker_items_dict["ReclaimablePercent"] = "100"
+
+        docker_items[docker_items_dict["Type"]] = docker_items_dict
+    return docker_items
+
+
 class DiskFreeResult:
     def __init__(self, cli_stdout: str):
-        docker_items = {}
-        for line in cli_stdout.splitlines():
-            docker_items_dict = json.loads(line)
-            reclamable = docker_items_dict["Reclaimable"]
-            docker_items_dict["Reclaimable"] = reclamable.split(" ")[0]
-            if "%" in reclamable:
-                docker_items_dict["ReclaimablePercent"] = reclamable.split(" ")[1][1:-2]
-            else:
-                docker_items_dict["ReclaimablePercent"] = "100"
-
-            docker_items[docker_items_dict["Type"]] = docker_items_dict
+        docker_items = _parse_disk_free_lines(cli_stdout)
 
         self.images: DockerItemsSummary
         self.images = DockerItemsSummary(**docker_items["Images"])
@@ -40,11 +63,306 @@ class DiskFreeResult:
         self.build_cache = DockerItemsSummary(**docker_items["Build Cache"])
 
 
+class EventStream(Iterator[DockerEvent]):
+    """The events printed by a `docker system events` command.
+
+    The command is started when the first event is requested. `close()`
+    kills it, even from another thread, and iterating then stops.
+    """
+
+    def __init__(self, full_cmd: List[str]):
+        self._full_cmd = full_cmd
+        self._lock = threading.Lock()
+        self._process = None
+        self._events: Optional[Iterator[DockerEvent]] = None
+        self.closed = False
+
+    def __next__(self) -> DockerEvent:
+        if self._events is None:
+            self._events = self._read_events()
+        return next(self._events)
+
+    def _read_events(self) -> Iterator[DockerEvent]:
+        with self._lock:
+            if self.closed:
+                return
+            process_stream = stream_stdout_and_stderr(self._full_cmd)
+            self._process = process_stream.process
+        try:
+            for stream_origin, stream_content in process_stream:
+                if stream_origin == "stdout":
+                    yield DockerEvent(**json.loads(stream_content))
+        except DockerException:
+            # the command fails when it's killed
+            if not self.closed:
+                raise
+
+    def close(self) -> None:
+        """Kills the command. The iteration stops after the events already read."""
+        with self._lock:
+            self.closed = True
+            if self._process is not None and self._process.poll() is None:
+                self._process.kill()
+
+
+class EventSubscription:
+    """The events of an `EventBus` matching some conditions.
+
+    Events are queued until they are read with `get()` or by iterating.
+    Iterating stops when the subscription is closed.
+    """
+
+    def __init__(
+        self,
+        bus: "EventBus",
+        predicate: Callable[[DockerEvent], bool],
+        maxsize: int,
+        policy: Literal["drop", "block"],
+        callback: Optional[Callable[[DockerEvent], None]],
+    ):
+        if policy not in ("drop", "block"):
+            raise ValueError(f"policy must be 'drop' or 'block', not '{policy}'")
+        self._bus = bus
+        self._predicate = predicate
+        self.maxsize = maxsize
+        self.policy = policy
+        self._callback = callback
+        self._events: Deque[DockerEvent] = deque()
+        self._condition = threading.Condition()
+        self.closed = False
+        # number of events dropped because the queue was full
+        self.dropped = 0
+
+    def _put(self, event: DockerEvent) -> None:
+        if not self._predicate(event):
+            return
+        if self._callback is not None:
+            self._callback(event)
+            return
+        with self._condition:
+            if len(self._events) >= self.maxsize:
+                if self.policy == "drop":
+                    self.dropped += 1
+                    return
+                self._condition.wait_for(
+                    lambda: len(self._events) < self.maxsize or self.closed
+                )
+            self._events.append(event)
+            self._condition.notify_all()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[DockerEvent]:
+        """Returns the next event, or `None` on timeout or if the subscription is closed."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._events or self.closed, timeout)
+            if not self._events:
+                return None
+            event = self._events.popleft()
+            self._condition.notify_all()
+            return event
+
+    def __iter__(self) -> Iterator[DockerEvent]:
+        while True:
+            event = self.get()
+            if event is None:
+                return
+            yield event
+
+    def close(self) -> None:
+        """Stops receiving events. The events already queued can still be read."""
+        self._bus._unsubscribe(self)
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+    def __enter__(self) -> "EventSubscription":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class EventBus:
+    """Shares a single `docker system events` process between many subscribers.
+
+    Each event is parsed once and dispatched to the subscriptions it matches.
+    A background thread reads the events while there are subscriptions. When
+    the command fails, it's started again with `--since` set to the time of
+    the last event, so no event is missed (unless the daemon restarted).
+
+    Use the one of a client with `docker.system.event_bus`:
+
+    ```python
+    from python_on_whales import docker
+
+    with docker.system.event_bus.subscribe(type="container", action="die") as events:
+        for event in events:
+            print(event.actor.id, "died")
+    ```
+    """
+
+    reconnect_delay = 1.0
+
+    def __init__(self, client_config: ClientConfig):
+        self.client_config = client_config
+        self._subscriptions: List[EventSubscription] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._events: Optional[Iterator[DockerEvent]] = None
+        # incremented each time the events command is (re)started
+        self.connection_id = 0
+        self.connected = False
+
+    def subscribe(
+        self,
+        type: Union[None, str, Iterable[str]] = None,
+        action: Union[None, str, Iterable[str]] = None,
+        labels: Optional[Mapping[str, Optional[str]]] = None,
+        predicate: Optional[Callable[[DockerEvent], bool]] = None,
+        maxsize: int = 1000,
+        policy: Literal["drop", "block"] = "drop",
+        callback: Optional[Callable[[DockerEvent], None]] = None,
+    ) -> EventSubscription:
+        """Returns a subscription to the events matching all the conditions given.
+
+        Parameters:
+            type: The type(s) of object, e.g. `"container"`, `"image"`, `"network"`.
+            action: The action(s), e.g. `"start"`, `"die"`, `"health_status: healthy"`.
+            labels: The labels that the actor must have. Use `None` as value
+                to only check that the label is present.
+            predicate: A function taking the event and returning a `bool`.
+            maxsize: Maximum number of events waiting in the queue of the subscription.
+            policy: What to do when the queue is full. `"drop"` drops the new event,
+                `"block"` waits until there is space, blocking the delivery to all
+                the other subscriptions.
+            callback: If provided, it's called with each event in the thread of
+                the bus instead of queuing the events. It must return quickly.
+
+        # Returns
+            A `python_on_whales.components.system.cli_wrapper.EventSubscription`.
+            Don't forget to close it.
+        """
+        types = None if type is None else set(utils.to_list(type))
+        actions = None if action is None else set(utils.to_list(action))
+        labels = dict(labels or {})
+
+        def matches(event: DockerEvent) -> bool:
+            if types is not None and event.type not in types:
+                return False
+            if actions is not None and event.action not in actions:
+                return False
+            if labels:
+                attributes = (event.actor and event.actor.attributes) or {}
+                for key, value in labels.items():
+                    if key not in attributes:
+                        return False
+                    if value is not None and attributes[key] != value:
+                        return False
+            return predicate is None or predicate(event)
+
+        subscription = EventSubscription(self, matches, maxsize, policy, callback)
+        with self._lock:
+            self._subscriptions.append(subscription)
+            if self._thread is None:
+                self.connection_id += 1
+                self.connected = True
+                # the daemon replays the events since one second before now, so
+                # nothing is missed while the command starts, even if the
+                # clocks of the client and the daemon differ a bit.
+                since = datetime.datetime.now() - datetime.timedelta(seconds=1)
+                self._thread = threading.Thread(
+                    target=self._follow_events,
+                    args=(since,),
+                    daemon=True,
+                )
+                self._thread.start()
+        return subscription
+
+    def _unsubscribe(self, subscription: EventSubscription) -> None:
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+            if self._subscriptions or self._thread is None:
+                return
+            self.connected = False
+            events = self._events
+        if isinstance(events, EventStream):
+            # the thread stops when the command is killed, instead of
+            # waiting for the next event.
+            events.close()
+
+    def _dispatch(self, event: DockerEvent) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            try:
+                subscription._put(event)
+            except Exception:
+                utils.LOGGER.exception("Error while dispatching a docker event")
+
+    def _stop_if_unused(self) -> bool:
+        with self._lock:
+            if self._subscriptions:
+                return False
+            self._thread = None
+            self._events = None
+            self.connected = False
+            return True
+
+    def _follow_events(self, since: datetime.datetime) -> None:
+        last_time_nano = None
+        while True:
+            try:
+                events = SystemCLI(self.client_config).events(since=since)
+                with self._lock:
+                    self._events = events
+                if self._stop_if_unused():
+                    return
+                for event in events:
+                    if (
+                        last_time_nano is not None
+                        and event.time_nano is not None
+                        and event.time_nano <= last_time_nano
+                    ):
+                        # replayed after a reconnection, already dispatched
+                        continue
+                    self._dispatch(event)
+                    if event.time_nano is not None:
+                        last_time_nano = event.time_nano
+                        since = _nanoseconds_to_datetime(event.time_nano)
+                    if self._stop_if_unused():
+                        return
+            except Exception:
+                utils.LOGGER.debug("Lost the docker events stream", exc_info=True)
+            with self._lock:
+                self.connected = False
+            if self._stop_if_unused():
+                return
+            time.sleep(self.reconnect_delay)
+            with self._lock:
+                self.connection_id += 1
+                self.connected = True
+
+
+def _nanoseconds_to_datetime(time_nano: int) -> datetime.datetime:
+    seconds, nanoseconds = divmod(time_nano, 10**9)
+    return datetime.datetime.fromtimestamp(
+        seconds, datetime.timezone.utc
+    ) + datetime.timedelta(microseconds=nanoseconds // 1000)
+
+
 class SystemCLI(DockerCLICaller):
-    def disk_free(self) -> DiskFreeResult:
+    @overload
+    def disk_free(self, details: Literal["objects"] = ...) -> DiskFreeResult: ...
+
+    @overload
+    def disk_free(self, details: Literal["columns"]) -> Columns: ...
+
+    def disk_free(self, details: Literal["objects", "columns"] = "objects"):
         """Give information about the disk usage of the Docker daemon.
 
-        Returns a `python_on_whales.DiskFreeResult` object.
+        Returns a `python_on_whales.DiskFreeResult` object. With
+        `details="columns"`, returns a `python_on_whales.columns.Columns`
+        table instead, with a row per type of object (in the `type` column).
 
         ```python
         from python_on_whales import docker
@@ -65,14 +383,27 @@ class SystemCLI(DockerCLICaller):
         """
 
         full_cmd = self.docker_cmd + ["system", "df", "--format", "{{json .}}"]
+        if details == "columns":
+            docker_items = list(_parse_disk_free_lines(run(full_cmd)).values())
+            columns = Columns(type=[x["Type"] for x in docker_items])
+            columns.update(model_columns(DockerItemsSummary, docker_items))
+            return columns
         return DiskFreeResult(run(full_cmd))
 
+    @property
+    def event_bus(self) -> EventBus:
+        """The `EventBus` of this client, sharing one `docker system events` process.
+
+        See `EventBus.subscribe`.
+        """
+        return self.client_config.get_event_bus()
+
     def events(
         self,
         since: Union[None, datetime.datetime, datetime.timedelta] = None,
         until: Union[None, datetime.datetime, datetime.timedelta] = None,
         filters: Dict[str, str] = {},
-    ) -> Iterator[DockerEvent]:
+    ) -> EventStream:
         """Return docker events information up to the current point in time.
 
         If `until` is not specified, then the iterator returned is infinite.
@@ -109,7 +440,8 @@ class SystemCLI(DockerCLICaller):
             filters: See the [Docker documentation page about filtering
                 ](https://docs.docker.com/engine/reference/commandline/events/#filtering).
         # Returns
-            A iterator which will yield DockerEvent objects from stdout/stderr
+            A iterator which will yield DockerEvent objects from stdout/stderr.
+            It's an `EventStream`, its `close()` method stops the command.
 
         [reference page for
         system events](https://docs.docker.com/engine/api/v1.40/#operation/SystemEvents)
@@ -125,10 +457,7 @@ class SystemCLI(DockerCLICaller):
         full_cmd.add_args_iterable_or_single(
             "--filter", format_mapping_for_cli(filters)
         )
-        iterator = stream_stdout_and_stderr(full_cmd)
-        for stream_origin, stream_content in iterator:
-            if stream_origin == "stdout":
-                yield DockerEvent(**json.loads(stream_content))
+        return EventStream(full_cmd)
 
     def info(self) -> SystemInfo:
         """Returns diverse information about the Docker client and daemon.
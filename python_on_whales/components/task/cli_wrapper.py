@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
@@ -17,7 +16,7 @@ from python_on_whales.components.task.models import (
     TaskSpec,
     TaskStatus,
 )
-from python_on_whales.utils import run
+from python_on_whales.utils import run, split_json_array
 
 
 class Task(ReloadableObjectFromJson):
@@ -27,12 +26,15 @@ class Task(ReloadableObjectFromJson):
         super().__init__(client_config, "id", reference, is_immutable_id)
 
     def _fetch_inspect_result_json(self, reference):
-        json_str = run(self.docker_cmd + ["inspect", reference])
-        return json.loads(json_str)[0]
+        json_array = run(self.docker_cmd + ["inspect", reference], decode=False)
+        return split_json_array(json_array)[0]
 
     def _parse_json_object(self, json_object: Dict[str, Any]) -> TaskInspectResult:
         return TaskInspectResult(**json_object)
 
+    def _parse_json_text(self, json_text: Union[str, bytes]) -> TaskInspectResult:
+        return TaskInspectResult.model_validate_json(json_text)
+
     def _get_inspect_result(self) -> TaskInspectResult:
         """Only there to allow tools to know the return type"""
         return super()._get_inspect_result()
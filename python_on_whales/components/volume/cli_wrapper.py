@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import os
 import tempfile
 import warnings
@@ -28,11 +27,12 @@ from python_on_whales.client_config import (
     ClientConfig,
     DockerCLICaller,
     ReloadableObjectFromJson,
+    bulk_reload,
 )
 from python_on_whales.components.volume.models import VolumeInspectResult
 from python_on_whales.exceptions import NoSuchVolume
 from python_on_whales.test_utils import random_name
-from python_on_whales.utils import ValidPath, run, to_list
+from python_on_whales.utils import ValidPath, run, split_json_array, to_list
 
 VolumeListFilter: TypeAlias = Union[
     Tuple[Literal["driver"], str],
@@ -60,10 +60,26 @@ class Volume(ReloadableObjectFromJson):
         self.remove()
 
     def _fetch_inspect_result_json(self, reference):
-        json_str = run(self.docker_cmd + ["volume", "inspect", reference])
-        return json.loads(json_str)[0]
+        engine_api = self.client_config.get_engine_api()
+        if engine_api is not None:
+            return engine_api.inspect("volume", reference)
+        json_array = run(
+            self.docker_cmd + ["volume", "inspect", reference], decode=False
+        )
+        return split_json_array(json_array)[0]
+
+    def _fetch_inspect_results_json(self, references):
+        engine_api = self.client_config.get_engine_api()
+        if engine_api is not None:
+            return engine_api.inspect_many("volume", references)
+        json_array = run(
+            self.docker_cmd + ["volume", "inspect", *references], decode=False
+        )
+        return split_json_array(json_array)
 
     def _parse_json_object(self, json_object: Dict[str, Any]):
+        # Not validated from the json text with `model_validate_json`: pydantic
+        # builds each `Path` twice in this case, which makes it slower.
         return VolumeInspectResult(**json_object)
 
     def _get_inspect_result(self) -> VolumeInspectResult:
@@ -198,7 +214,9 @@ class VolumeCLI(DockerCLICaller):
             return True
 
     def list(
-        self, filters: Union[Iterable[VolumeListFilter], Mapping[str, Any]] = ()
+        self,
+        filters: Union[Iterable[VolumeListFilter], Mapping[str, Any]] = (),
+        prefetch: bool = False,
     ) -> List[Volume]:
         """List volumes
 
@@ -206,6 +224,10 @@ class VolumeCLI(DockerCLICaller):
             filters: See the [Docker documentation page about filtering
                 ](https://docs.docker.com/engine/reference/commandline/volume_ls/#filtering).
                 An example `filters=[("dangling", "true"), ("driver", "local")]`.
+            prefetch: If `True`, all the volumes are inspected with a single
+                command and the returned objects keep this inspect result until
+                `reload()` is called on them. Reading their attributes then
+                doesn't launch any process.
 
         # Returns
             `List[python_on_whales.Volume]`
@@ -223,9 +245,12 @@ class VolumeCLI(DockerCLICaller):
 
         volumes_names = run(full_cmd).splitlines()
 
-        return [
+        volumes = [
             Volume(self.client_config, x, is_immutable_id=True) for x in volumes_names
         ]
+        if prefetch:
+            bulk_reload(volumes, pin=True)
+        return volumes
 
     def prune(
         self,
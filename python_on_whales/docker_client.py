@@ -1,34 +1,104 @@
+from __future__ import annotations
+
 import base64
+import importlib
 import json
 import warnings
-from typing import Dict, List, Literal, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    Generic,
+    List,
+    Literal,
+    Optional,
+    Type,
+    TypeVar,
+    overload,
+)
 
 import pydantic
 from typing_extensions import Annotated
 
 from python_on_whales.client_config import ClientConfig, DockerCLICaller
-from python_on_whales.components.buildx.cli_wrapper import BuildxCLI
-from python_on_whales.components.compose.cli_wrapper import ComposeCLI
-from python_on_whales.components.config.cli_wrapper import ConfigCLI
-from python_on_whales.components.container.cli_wrapper import ContainerCLI
-from python_on_whales.components.context.cli_wrapper import ContextCLI
-from python_on_whales.components.image.cli_wrapper import ImageCLI
-from python_on_whales.components.manifest.cli_wrapper import ManifestCLI
-from python_on_whales.components.network.cli_wrapper import NetworkCLI
-from python_on_whales.components.node.cli_wrapper import NodeCLI
-from python_on_whales.components.plugin.cli_wrapper import PluginCLI
-from python_on_whales.components.pod.cli_wrapper import PodCLI
-from python_on_whales.components.secret.cli_wrapper import SecretCLI
-from python_on_whales.components.service.cli_wrapper import ServiceCLI
-from python_on_whales.components.stack.cli_wrapper import StackCLI
-from python_on_whales.components.swarm.cli_wrapper import SwarmCLI
-from python_on_whales.components.system.cli_wrapper import SystemCLI
-from python_on_whales.components.task.cli_wrapper import TaskCLI
-from python_on_whales.components.trust.cli_wrapper import TrustCLI
-from python_on_whales.components.volume.cli_wrapper import VolumeCLI
 
 from .utils import DockerCamelModel, ValidPath, run
 
+if TYPE_CHECKING:
+    from python_on_whales.components.buildx.cli_wrapper import BuildxCLI
+    from python_on_whales.components.compose.cli_wrapper import ComposeCLI
+    from python_on_whales.components.config.cli_wrapper import ConfigCLI
+    from python_on_whales.components.container.cli_wrapper import ContainerCLI
+    from python_on_whales.components.context.cli_wrapper import ContextCLI
+    from python_on_whales.components.image.cli_wrapper import ImageCLI
+    from python_on_whales.components.manifest.cli_wrapper import ManifestCLI
+    from python_on_whales.components.network.cli_wrapper import NetworkCLI
+    from python_on_whales.components.node.cli_wrapper import NodeCLI
+    from python_on_whales.components.plugin.cli_wrapper import PluginCLI
+    from python_on_whales.components.pod.cli_wrapper import PodCLI
+    from python_on_whales.components.secret.cli_wrapper import SecretCLI
+    from python_on_whales.components.service.cli_wrapper import ServiceCLI
+    from python_on_whales.components.stack.cli_wrapper import StackCLI
+    from python_on_whales.components.swarm.cli_wrapper import SwarmCLI
+    from python_on_whales.components.system.cli_wrapper import SystemCLI
+    from python_on_whales.components.task.cli_wrapper import TaskCLI
+    from python_on_whales.components.trust.cli_wrapper import TrustCLI
+    from python_on_whales.components.volume.cli_wrapper import VolumeCLI
+    from python_on_whales.inventory import Inventory
+
+_T = TypeVar("_T")
+
+
+class _LazyComponent(Generic[_T]):
+    """A component of the client (`docker.container`, `docker.image`...).
+
+    The module of the component is imported and the component is created the
+    first time it's used. It's then stored in the `__dict__` of the client,
+    so the next accesses are plain attribute lookups.
+    """
+
+    def __init__(self, module: str, class_name: str):
+        self.module = module
+        self.class_name = class_name
+        self.name = ""
+
+    def __set_name__(self, owner: Type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: Type) -> _LazyComponent[_T]: ...
+
+    @overload
+    def __get__(self, instance: DockerCLICaller, owner: Type) -> _T: ...
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        component_class = getattr(importlib.import_module(self.module), self.class_name)
+        component = component_class(instance.client_config)
+        instance.__dict__[self.name] = component
+        return component
+
+
+class _LazyAlias:
+    """A shortcut to a method of a component, e.g. `docker.run` -> `docker.container.run`."""
+
+    def __init__(self, component: str, method: str):
+        self.component = component
+        self.method = method
+        self.name = ""
+
+    def __set_name__(self, owner: Type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner) -> Any:
+        if instance is None:
+            return self
+        method = getattr(getattr(instance, self.component), self.method)
+        instance.__dict__[self.name] = method
+        return method
+
 
 class ClientVersion(DockerCamelModel):
     platform: Optional[Dict[str, str]] = None
@@ -150,8 +220,133 @@ class DockerClient(DockerCLICaller):
             Default is "unknown". If at some point, Python-on-whales has to choose
             a behavior and `client_type` is `"unknown"`, it will raise an exception and ask you to specify
             what kind of client you're working with. Valid values are `"docker"`, `"podman"`, "`nerdctl"` and `"unknown"`.
+        transport: How Python-on-whales talks to the daemon. The default, `"cli"`, calls the
+            client binary for every operation. With `"engine_api"`, inspecting containers, images,
+            networks and volumes, listing containers and stopping containers is done with HTTP
+            requests sent directly on the daemon's Unix socket (`/var/run/docker.sock` or the one
+            given with `host`/`DOCKER_HOST`), over a persistent connection. This avoids
+            launching a process for those calls. All other operations still use the CLI, and
+            if the daemon can't be reached on a local Unix socket (remote host, context, TLS...),
+            or if the client isn't docker (see `client_type`), everything falls back to the CLI.
+        cache_validity_period: How long, in seconds, the result of an inspect is reused when
+            reading attributes of an object (a container, an image...) before inspecting it again.
+            Default is 0.01 seconds. Use `float("inf")` to only inspect again when `reload()`
+            is called.
+        cache_validity_periods: Overrides `cache_validity_period` for some types of objects.
+            The keys are the class names. For example
+            `cache_validity_periods={"Image": float("inf"), "Container": 2}`.
+        event_driven_cache: If `True`, a background thread follows `docker system events`
+            and inspect results of containers, images, networks, volumes (and swarm objects)
+            are reused until an event concerning the object arrives, instead of expiring after
+            the cache validity period. This removes almost all inspect calls for programs reading
+            attributes very often. The events are requested starting from one second before the
+            subscription, so the clocks of the client and the daemon should roughly agree.
+            If the events stream is interrupted, the cache validity period is used until
+            it's back.
+        inspect_batch_window: If set, concurrent inspect calls made by multiple threads are
+            coalesced: threads asking for the same object at the same time share a single
+            inspect, and while objects of a type are being inspected, requests for other
+            objects of this type arriving within this many seconds are gathered into a single
+            `docker inspect a b c ...` command. A request arriving when nothing is being
+            inspected is sent at once. Default is `None` (every inspect launches its own command).
     """
 
+    buildx: _LazyComponent[BuildxCLI] = _LazyComponent(
+        "python_on_whales.components.buildx.cli_wrapper", "BuildxCLI"
+    )
+    compose: _LazyComponent[ComposeCLI] = _LazyComponent(
+        "python_on_whales.components.compose.cli_wrapper", "ComposeCLI"
+    )
+    config: _LazyComponent[ConfigCLI] = _LazyComponent(
+        "python_on_whales.components.config.cli_wrapper", "ConfigCLI"
+    )
+    container: _LazyComponent[ContainerCLI] = _LazyComponent(
+        "python_on_whales.components.container.cli_wrapper", "ContainerCLI"
+    )
+    context: _LazyComponent[ContextCLI] = _LazyComponent(
+        "python_on_whales.components.context.cli_wrapper", "ContextCLI"
+    )
+    image: _LazyComponent[ImageCLI] = _LazyComponent(
+        "python_on_whales.components.image.cli_wrapper", "ImageCLI"
+    )
+    manifest: _LazyComponent[ManifestCLI] = _LazyComponent(
+        "python_on_whales.components.manifest.cli_wrapper", "ManifestCLI"
+    )
+    network: _LazyComponent[NetworkCLI] = _LazyComponent(
+        "python_on_whales.components.network.cli_wrapper", "NetworkCLI"
+    )
+    node: _LazyComponent[NodeCLI] = _LazyComponent(
+        "python_on_whales.components.node.cli_wrapper", "NodeCLI"
+    )
+    plugin: _LazyComponent[PluginCLI] = _LazyComponent(
+        "python_on_whales.components.plugin.cli_wrapper", "PluginCLI"
+    )
+    pod: _LazyComponent[PodCLI] = _LazyComponent(
+        "python_on_whales.components.pod.cli_wrapper", "PodCLI"
+    )
+    secret: _LazyComponent[SecretCLI] = _LazyComponent(
+        "python_on_whales.components.secret.cli_wrapper", "SecretCLI"
+    )
+    service: _LazyComponent[ServiceCLI] = _LazyComponent(
+        "python_on_whales.components.service.cli_wrapper", "ServiceCLI"
+    )
+    stack: _LazyComponent[StackCLI] = _LazyComponent(
+        "python_on_whales.components.stack.cli_wrapper", "StackCLI"
+    )
+    swarm: _LazyComponent[SwarmCLI] = _LazyComponent(
+        "python_on_whales.components.swarm.cli_wrapper", "SwarmCLI"
+    )
+    system: _LazyComponent[SystemCLI] = _LazyComponent(
+        "python_on_whales.components.system.cli_wrapper", "SystemCLI"
+    )
+    task: _LazyComponent[TaskCLI] = _LazyComponent(
+        "python_on_whales.components.task.cli_wrapper", "TaskCLI"
+    )
+    trust: _LazyComponent[TrustCLI] = _LazyComponent(
+        "python_on_whales.components.trust.cli_wrapper", "TrustCLI"
+    )
+    volume: _LazyComponent[VolumeCLI] = _LazyComponent(
+        "python_on_whales.components.volume.cli_wrapper", "VolumeCLI"
+    )
+
+    # aliases
+    attach = _LazyAlias("container", "attach")
+    build = _LazyAlias("buildx", "build")
+    legacy_build = _LazyAlias("image", "legacy_build")
+    commit = _LazyAlias("container", "commit")
+    copy = _LazyAlias("container", "copy")
+    create = _LazyAlias("container", "create")
+    diff = _LazyAlias("container", "diff")
+    events = None
+    execute = _LazyAlias("container", "execute")
+    export = _LazyAlias("container", "export")
+    images = _LazyAlias("image", "list")
+    import_ = _LazyAlias("image", "import_")
+    info = _LazyAlias("system", "info")
+    # self.inspect -> too hard to implement
+    kill = _LazyAlias("container", "kill")
+    load = _LazyAlias("image", "load")
+    logs = _LazyAlias("container", "logs")
+    pause = _LazyAlias("container", "pause")
+    ps = _LazyAlias("container", "list")
+    pull = _LazyAlias("image", "pull")
+    push = _LazyAlias("image", "push")
+    rename = _LazyAlias("container", "rename")
+    restart = _LazyAlias("container", "restart")
+    remove = _LazyAlias("container", "remove")
+    # self.rmi -> doesn't make much sense since it would be docker.remove_image
+    run = _LazyAlias("container", "run")
+    save = _LazyAlias("image", "save")
+    # self.search -> Is anybody going to use it in python?
+    start = _LazyAlias("container", "start")
+    stats = _LazyAlias("container", "stats")
+    stop = _LazyAlias("container", "stop")
+    tag = _LazyAlias("image", "tag")
+    top = _LazyAlias("container", "stop")
+    unpause = _LazyAlias("container", "unpause")
+    update = _LazyAlias("container", "update")
+    wait = _LazyAlias("container", "wait")
+
     def __init__(
         self,
         config: Optional[ValidPath] = None,
@@ -175,6 +370,11 @@ class DockerClient(DockerCLICaller):
         client_binary: str = "docker",
         client_call: List[str] = ["docker"],
         client_type: Literal["docker", "podman", "nerdctl", "unknown"] = "unknown",
+        transport: Literal["cli", "engine_api"] = "cli",
+        cache_validity_period: Optional[float] = None,
+        cache_validity_periods: Dict[str, float] = {},
+        event_driven_cache: bool = False,
+        inspect_batch_window: Optional[float] = None,
     ):
         if client_binary != "docker":
             warnings.warn(
@@ -204,66 +404,61 @@ class DockerClient(DockerCLICaller):
                 compose_compatibility=compose_compatibility,
                 client_call=client_call,
                 client_type=client_type,
+                transport=transport,
+                cache_validity_period=cache_validity_period,
+                cache_validity_periods=cache_validity_periods,
+                event_driven_cache=event_driven_cache,
+                inspect_batch_window=inspect_batch_window,
             )
         super().__init__(client_config)
 
-        self.buildx = BuildxCLI(self.client_config)
-        self.compose = ComposeCLI(self.client_config)
-        self.config = ConfigCLI(self.client_config)
-        self.container = ContainerCLI(self.client_config)
-        self.context = ContextCLI(self.client_config)
-        self.image = ImageCLI(self.client_config)
-        self.manifest = ManifestCLI(self.client_config)
-        self.network = NetworkCLI(self.client_config)
-        self.node = NodeCLI(self.client_config)
-        self.plugin = PluginCLI(self.client_config)
-        self.pod = PodCLI(self.client_config)
-        self.secret = SecretCLI(self.client_config)
-        self.service = ServiceCLI(self.client_config)
-        self.stack = StackCLI(self.client_config)
-        self.swarm = SwarmCLI(self.client_config)
-        self.system = SystemCLI(self.client_config)
-        self.task = TaskCLI(self.client_config)
-        self.trust = TrustCLI(self.client_config)
-        self.volume = VolumeCLI(self.client_config)
-
-        # aliases
-        self.attach = self.container.attach
-        self.build = self.buildx.build
-        self.legacy_build = self.image.legacy_build
-        self.commit = self.container.commit
-        self.copy = self.container.copy
-        self.create = self.container.create
-        self.diff = self.container.diff
-        self.events = None
-        self.execute = self.container.execute
-        self.export = self.container.export
-        self.images = self.image.list
-        self.import_ = self.image.import_
-        self.info = self.system.info
-        # self.inspect -> too hard to implement
-        self.kill = self.container.kill
-        self.load = self.image.load
-        self.logs = self.container.logs
-        self.pause = self.container.pause
-        self.ps = self.container.list
-        self.pull = self.image.pull
-        self.push = self.image.push
-        self.rename = self.container.rename
-        self.restart = self.container.restart
-        self.remove = self.container.remove
-        # self.rmi -> doesn't make much sense since it would be docker.remove_image
-        self.run = self.container.run
-        self.save = self.image.save
-        # self.search -> Is anybody going to use it in python?
-        self.start = self.container.start
-        self.stats = self.container.stats
-        self.stop = self.container.stop
-        self.tag = self.image.tag
-        self.top = self.container.stop
-        self.unpause = self.container.unpause
-        self.update = self.container.update
-        self.wait = self.container.wait
+    def frozen_snapshot(self) -> ContextManager[None]:
+        """Context manager where each object is inspected at most once.
+
+        Inside the `with` block, the attributes of containers, images, volumes...
+        are read from the first inspect result obtained in the block, whatever the
+        cache validity period. It's useful when reading many attributes of many
+        objects, for example to make a report.
+
+        ```python
+        from python_on_whales import docker
+
+        with docker.frozen_snapshot():
+            for container in docker.ps(prefetch=True):
+                print(container.name, container.state.status, container.config.image)
+        ```
+
+        Calling `reload()` on an object still inspects it again. The snapshot only
+        applies to the current thread (or asyncio task), the others keep the usual
+        cache validity period.
+        """
+        return self.client_config.frozen_snapshot()
+
+    def inventory(self) -> "Inventory":
+        """Returns an in-memory index of the containers, images, networks and volumes.
+
+        All the objects are loaded at once, then kept up to date with the
+        events of the daemon. Queries are answered without launching a process,
+        unless some objects changed since the last query, in which case only
+        those are inspected again.
+
+        ```python
+        from python_on_whales import docker
+
+        with docker.inventory() as inventory:
+            workers = inventory.containers(label="role=worker", network="backend")
+            to_remove = inventory.unused_images()
+        ```
+
+        # Returns
+            A `python_on_whales.inventory.Inventory`. Call `close()` on it, or
+            use it as a context manager, to stop following the events.
+        """
+        from python_on_whales.inventory import Inventory
+
+        inventory = Inventory(self.client_config)
+        inventory.load()
+        return inventory
 
     def version(self) -> Version:
         """
@@ -0,0 +1,172 @@
+"""Minimal HTTP/1.1 client for the Docker Engine API over a Unix socket.
+
+This is an optional transport. Python-on-whales talks to the daemon through
+the docker CLI by default, which costs a process launch per call. For the
+calls that are on the hot path of most programs (inspect, list, stop), this
+module allows to talk to the daemon directly on its Unix socket, reusing
+one keep-alive connection per thread. Everything else still goes through
+the CLI.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import os
+import socket
+import threading
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
+from urllib.parse import quote, urlencode
+
+from python_on_whales.exceptions import DockerException
+from python_on_whales.utils import get_docker_exception_type, removeprefix
+
+DEFAULT_UNIX_SOCKET = "/var/run/docker.sock"
+
+# path of the inspect endpoint for each kind of object
+INSPECT_PATHS = {
+    "container": "/containers/{}/json",
+    "image": "/images/{}/json",
+    "network": "/networks/{}",
+    "volume": "/volumes/{}",
+}
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: Optional[float] = None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+def get_unix_socket_path(host: Optional[str]) -> Optional[str]:
+    """Returns the socket path if `host` (or `DOCKER_HOST`) points to a Unix socket.
+
+    Returns `None` if the daemon is reached in another way (tcp, ssh, npipe...).
+    """
+    if host is None:
+        host = os.environ.get("DOCKER_HOST")
+    if host is None or host == "":
+        return DEFAULT_UNIX_SOCKET
+    if host.startswith("unix://"):
+        return removeprefix(host, "unix://")
+    return None
+
+
+class EngineAPIClient:
+    """Sends requests to the Docker Engine API on a Unix socket.
+
+    Connections are kept alive and reused. Since `http.client` connections
+    are not thread-safe, each thread gets its own connection.
+    """
+
+    def __init__(self, socket_path: str, timeout: Optional[float] = None):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _get_connection(self) -> UnixHTTPConnection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = UnixHTTPConnection(self.socket_path, timeout=self.timeout)
+            self._local.connection = connection
+        return connection
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def _send(self, method: str, url: str, body: Optional[bytes]) -> Tuple[int, bytes]:
+        headers = {"Host": "docker"}
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+        connection = self._get_connection()
+        try:
+            connection.request(method, url, body=body, headers=headers)
+            response = connection.getresponse()
+            return response.status, response.read()
+        except Exception:
+            # the connection is in an unknown state, we don't reuse it.
+            self.close()
+            raise
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Mapping[str, Any]] = None,
+        body: Any = None,
+    ) -> bytes:
+        """Sends a request and returns the body of the response as bytes.
+
+        # Raises
+            A subclass of `python_on_whales.exceptions.DockerException`,
+            chosen from the error message of the daemon, if the status
+            code is 400 or above.
+        """
+        url = path
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        if params:
+            url += "?" + urlencode(params)
+        encoded_body = None if body is None else json.dumps(body).encode()
+
+        try:
+            status, content = self._send(method, url, encoded_body)
+        except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+            # the daemon closed an idle keep-alive connection, we try once more
+            # with a brand new connection.
+            status, content = self._send(method, url, encoded_body)
+
+        if status >= 400:
+            try:
+                message = json.loads(content)["message"].encode()
+            except (ValueError, KeyError, TypeError):
+                message = content
+            exception_type = get_docker_exception_type(message)
+            raise exception_type(
+                command_launched=[method, url], return_code=status, stderr=message
+            )
+        return content
+
+    def inspect(self, kind: str, reference: str) -> bytes:
+        path = INSPECT_PATHS[kind].format(quote(reference, safe="/:@"))
+        return self.request("GET", path)
+
+    def inspect_many(self, kind: str, references: Iterable[str]) -> List[bytes]:
+        """Inspects multiple objects, the ones that don't exist are skipped.
+
+        Returns the json of each inspect result, not decoded.
+        """
+        results = []
+        for reference in references:
+            try:
+                results.append(self.inspect(kind, reference))
+            except DockerException as err:
+                if err.return_code != 404:
+                    raise
+        return results
+
+    def list_containers(
+        self, all: bool = False, filters: Iterable[Tuple[str, Any]] = ()
+    ) -> list:
+        filters_dict = {}
+        for key, value in filters:
+            filters_dict.setdefault(key, []).append(str(value))
+        params = {}
+        if all:
+            params["all"] = "1"
+        if filters_dict:
+            params["filters"] = json.dumps(filters_dict)
+        return json.loads(self.request("GET", "/containers/json", params=params))
+
+    def stop_container(self, reference: str, time: Optional[int] = None) -> None:
+        path = f"/containers/{quote(reference, safe='')}/stop"
+        self.request("POST", path, params={"t": time})
@@ -0,0 +1,377 @@
+"""In-memory index of the containers, images, networks and volumes of a daemon.
+
+An `Inventory` inspects all the objects once, with one bulk inspect per type,
+then keeps them up to date with `docker system events`. Only the objects
+concerned by an event are inspected again, lazily, before the next query.
+Queries are dictionary lookups and don't launch any process when nothing
+changed.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from python_on_whales.client_config import (
+    ClientConfig,
+    DockerCLICaller,
+    ReloadableObjectFromJson,
+    bulk_reload,
+)
+from python_on_whales.components.container.cli_wrapper import Container, ContainerCLI
+from python_on_whales.components.image.cli_wrapper import Image, ImageCLI
+from python_on_whales.components.network.cli_wrapper import Network, NetworkCLI
+from python_on_whales.components.system.cli_wrapper import EventSubscription
+from python_on_whales.components.system.models import DockerEvent
+from python_on_whales.components.volume.cli_wrapper import Volume, VolumeCLI
+from python_on_whales.utils import removeprefix
+
+OBJECT_TYPES = ("container", "image", "network", "volume")
+
+# container events which don't change the inspect result
+IGNORED_CONTAINER_ACTIONS = {
+    "attach",
+    "commit",
+    "copy",
+    "detach",
+    "exec_create",
+    "exec_detach",
+    "exec_die",
+    "exec_start",
+    "export",
+    "resize",
+    "top",
+}
+
+
+class _Index:
+    """Maps keys to sets of ids, and remembers the keys of each id to update it."""
+
+    def __init__(self):
+        self._ids: Dict[object, Set[str]] = {}
+        self._keys: Dict[str, List[object]] = {}
+
+    def set(self, object_id: str, keys: Iterable[object]) -> None:
+        self.remove(object_id)
+        keys = list({x for x in keys if x is not None})
+        self._keys[object_id] = keys
+        for key in keys:
+            self._ids.setdefault(key, set()).add(object_id)
+
+    def remove(self, object_id: str) -> None:
+        for key in self._keys.pop(object_id, []):
+            ids = self._ids[key]
+            ids.discard(object_id)
+            if not ids:
+                del self._ids[key]
+
+    def get(self, key: object) -> Set[str]:
+        return self._ids.get(key, set())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._ids
+
+
+def _label_keys(labels: Optional[Dict[str, str]]) -> List[Tuple[str, Optional[str]]]:
+    labels = labels or {}
+    return list(labels.items()) + [(k, None) for k in labels]
+
+
+def _parse_label(label: str) -> Tuple[str, Optional[str]]:
+    key, equal, value = label.partition("=")
+    return key, (value if equal else None)
+
+
+class Inventory(DockerCLICaller):
+    """Index of the containers, images, networks and volumes, kept up to date.
+
+    Use `docker.inventory()` to create one. The objects returned have
+    their inspect result pinned (see `bulk_reload`), reading their attributes
+    doesn't launch a process. They are replaced by new objects when they
+    change.
+
+    ```python
+    from python_on_whales import docker
+
+    inventory = docker.inventory()
+    inventory.containers(label="com.example.role=worker", network="backend")
+    inventory.unused_images()
+    inventory.close()
+    ```
+    """
+
+    def __init__(self, client_config: ClientConfig):
+        super().__init__(client_config)
+        self._lock = threading.RLock()
+        self._objects: Dict[str, Dict[str, ReloadableObjectFromJson]] = {
+            object_type: {} for object_type in OBJECT_TYPES
+        }
+        self._indexes: Dict[Tuple[str, str], _Index] = {}
+        # ids to inspect again, by type, filled by the events
+        self._pending_lock = threading.Lock()
+        self._pending: Dict[str, Set[str]] = {x: set() for x in OBJECT_TYPES}
+        self._pending_full_reload: Set[str] = set()
+        self._subscription: Optional[EventSubscription] = None
+        self._connection_id: Optional[int] = None
+
+    def load(self) -> None:
+        """Subscribes to the events, then loads all the objects."""
+        event_bus = self.client_config.get_event_bus()
+        self._subscription = event_bus.subscribe(
+            type=OBJECT_TYPES, callback=self._handle_event
+        )
+        self._connection_id = event_bus.connection_id
+        with self._lock:
+            for object_type in OBJECT_TYPES:
+                self._full_reload(object_type)
+
+    def close(self) -> None:
+        """Stops following the events. The inventory isn't updated anymore."""
+        if self._subscription is not None:
+            self._subscription.close()
+            self._subscription = None
+
+    def __enter__(self) -> Inventory:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def containers(
+        self,
+        *,
+        label: Optional[str] = None,
+        name: Optional[str] = None,
+        image: Optional[str] = None,
+        network: Optional[str] = None,
+        volume: Optional[str] = None,
+    ) -> List[Container]:
+        """Returns the containers (running or not) matching all the conditions given.
+
+        Parameters:
+            label: `"key"` or `"key=value"`.
+            name: The name of the container.
+            image: An image id or a tag, e.g. `"redis:7"`.
+            network: A network name or id.
+            volume: The name of a volume mounted in the container.
+        """
+        with self._lock:
+            self._refresh()
+            conditions = []
+            if label is not None:
+                conditions.append(
+                    self._index("container", "label").get(_parse_label(label))
+                )
+            if name is not None:
+                conditions.append(self._index("container", "name").get(name))
+            if image is not None:
+                image_ids = {image} | self._index("image", "tag").get(image)
+                by_image = self._index("container", "image")
+                conditions.append(set().union(*(by_image.get(x) for x in image_ids)))
+            if network is not None:
+                conditions.append(self._index("container", "network").get(network))
+            if volume is not None:
+                conditions.append(self._index("container", "volume").get(volume))
+            return self._select("container", conditions)
+
+    def images(
+        self, *, label: Optional[str] = None, tag: Optional[str] = None
+    ) -> List[Image]:
+        """Returns the images matching all the conditions given.
+
+        Parameters:
+            label: `"key"` or `"key=value"`.
+            tag: A tag, e.g. `"redis:7"`.
+        """
+        with self._lock:
+            self._refresh()
+            conditions = []
+            if label is not None:
+                conditions.append(
+                    self._index("image", "label").get(_parse_label(label))
+                )
+            if tag is not None:
+                conditions.append(self._index("image", "tag").get(tag))
+            return self._select("image", conditions)
+
+    def unused_images(self) -> List[Image]:
+        """Returns the images which are not used by any container."""
+        with self._lock:
+            self._refresh()
+            used = self._index("container", "image")
+            return [
+                x
+                for image_id, x in self._objects["image"].items()
+                if image_id not in used
+            ]
+
+    def networks(
+        self, *, label: Optional[str] = None, name: Optional[str] = None
+    ) -> List[Network]:
+        """Returns the networks matching all the conditions given."""
+        with self._lock:
+            self._refresh()
+            conditions = []
+            if label is not None:
+                conditions.append(
+                    self._index("network", "label").get(_parse_label(label))
+                )
+            if name is not None:
+                conditions.append(self._index("network", "name").get(name))
+            return self._select("network", conditions)
+
+    def volumes(self, *, label: Optional[str] = None) -> List[Volume]:
+        """Returns the volumes matching all the conditions given."""
+        with self._lock:
+            self._refresh()
+            conditions = []
+            if label is not None:
+                conditions.append(
+                    self._index("volume", "label").get(_parse_label(label))
+                )
+            return self._select("volume", conditions)
+
+    def unused_volumes(self) -> List[Volume]:
+        """Returns the volumes which are not mounted in any container."""
+        with self._lock:
+            self._refresh()
+            used = self._index("container", "volume")
+            return [
+                x for name, x in self._objects["volume"].items() if name not in used
+            ]
+
+    def _index(self, object_type: str, key: str) -> _Index:
+        return self._indexes.setdefault((object_type, key), _Index())
+
+    def _select(self, object_type: str, conditions: List[Set[str]]) -> list:
+        objects = self._objects[object_type]
+        if not conditions:
+            return list(objects.values())
+        ids = set.intersection(*conditions)
+        return [objects[x] for x in ids if x in objects]
+
+    def _handle_event(self, event: DockerEvent) -> None:
+        # called in the thread of the event bus, it must be quick.
+        actor_id = event.actor.id if event.actor is not None else None
+        attributes = (event.actor.attributes if event.actor is not None else None) or {}
+        with self._pending_lock:
+            if event.type == "container" and event.action in IGNORED_CONTAINER_ACTIONS:
+                return
+            if actor_id is None or (
+                event.type == "image" and not actor_id.startswith("sha256:")
+            ):
+                # e.g. `image pull` gives the name of the image, not its id.
+                self._pending_full_reload.add(event.type)
+            else:
+                self._pending[event.type].add(actor_id)
+            if "container" in attributes and event.type in ("network", "volume"):
+                self._pending["container"].add(attributes["container"])
+
+    def _refresh(self) -> None:
+        """Applies the changes received since the last query."""
+        event_bus = self.client_config.get_event_bus()
+        with self._pending_lock:
+            pending = self._pending
+            self._pending = {x: set() for x in OBJECT_TYPES}
+            full_reload = self._pending_full_reload
+            self._pending_full_reload = set()
+            if event_bus.connection_id != self._connection_id:
+                # some events may have been missed while reconnecting
+                self._connection_id = event_bus.connection_id
+                full_reload = set(OBJECT_TYPES)
+        try:
+            for object_type in OBJECT_TYPES:
+                if object_type in full_reload:
+                    self._full_reload(object_type)
+                elif pending[object_type]:
+                    self._reload(object_type, pending[object_type])
+        except BaseException:
+            # the changes are applied again at the next query
+            with self._pending_lock:
+                for object_type in OBJECT_TYPES:
+                    self._pending[object_type] |= pending[object_type]
+                self._pending_full_reload |= full_reload
+            raise
+
+    def _full_reload(self, object_type: str) -> None:
+        cli = _CLI_TYPES[object_type](self.client_config)
+        if object_type == "container":
+            objects = cli.list(all=True, prefetch=True)
+        else:
+            objects = cli.list(prefetch=True)
+        for object_id in list(self._objects[object_type]):
+            self._remove(object_type, object_id)
+        for docker_object in objects:
+            self._add(object_type, docker_object)
+
+    def _reload(self, object_type: str, ids: Set[str]) -> None:
+        object_class = _OBJECT_CLASSES[object_type]
+        objects = [
+            object_class(self.client_config, x, is_immutable_id=True) for x in ids
+        ]
+        bulk_reload(objects, pin=True)
+        for docker_object in objects:
+            object_id = docker_object._get_immutable_id()
+            self._remove(object_type, object_id)
+            if docker_object._inspect_result is not None:
+                self._add(object_type, docker_object)
+
+    def _remove(self, object_type: str, object_id: str) -> None:
+        self._objects[object_type].pop(object_id, None)
+        for (indexed_type, _), index in self._indexes.items():
+            if indexed_type == object_type:
+                index.remove(object_id)
+
+    def _add(self, object_type: str, docker_object: ReloadableObjectFromJson) -> None:
+        object_id = docker_object._get_immutable_id()
+        self._objects[object_type][object_id] = docker_object
+        inspect_result = docker_object._inspect_result
+        if object_type == "container":
+            config = inspect_result.config
+            networks = (inspect_result.network_settings.networks or {}).items()
+            self._index("container", "label").set(
+                object_id, _label_keys(config.labels if config else None)
+            )
+            self._index("container", "name").set(
+                object_id, [removeprefix(inspect_result.name or "", "/")]
+            )
+            self._index("container", "image").set(
+                object_id, [inspect_result.image, config.image if config else None]
+            )
+            self._index("container", "network").set(
+                object_id,
+                [name for name, _ in networks] + [x.network_id for _, x in networks],
+            )
+            self._index("container", "volume").set(
+                object_id,
+                [x.name for x in inspect_result.mounts or [] if x.type == "volume"],
+            )
+        elif object_type == "image":
+            config = inspect_result.config
+            self._index("image", "label").set(
+                object_id, _label_keys(config.labels if config else None)
+            )
+            self._index("image", "tag").set(object_id, inspect_result.repo_tags or [])
+        elif object_type == "network":
+            self._index("network", "label").set(
+                object_id, _label_keys(inspect_result.labels)
+            )
+            self._index("network", "name").set(object_id, [inspect_result.name])
+        else:
+            self._index("volume", "label").set(
+                object_id, _label_keys(inspect_result.labels)
+            )
+
+
+_CLI_TYPES: Dict[str, Type[DockerCLICaller]] = {
+    "container": ContainerCLI,
+    "image": ImageCLI,
+    "network": NetworkCLI,
+    "volume": VolumeCLI,
+}
+_OBJECT_CLASSES: Dict[str, Type[ReloadableObjectFromJson]] = {
+    "container": Container,
+    "image": Image,
+    "network": Network,
+    "volume": Volume,
+}
@@ -0,0 +1,194 @@
+"""Structured and resumable reading of the logs of containers, services and pods.
+
+The logs are read with `--timestamps`, and each line is parsed into a
+`LogRecord`. A `LogCursor` remembers the position of the last record read,
+it can be saved to disk and used to resume reading after a restart without
+reading the same lines twice.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from python_on_whales.utils import (
+    ValidPath,
+    format_time_arg,
+    parse_rfc3339_nano_with_ns,
+    stream_stdout_and_stderr,
+)
+
+
+class LogRecord(NamedTuple):
+    timestamp: datetime
+    source: str
+    line: bytes
+
+
+class _SourcePosition(NamedTuple):
+    timestamp_ns: int
+    # hash of the line -> number of times it was read at timestamp_ns
+    last_records: Dict[str, int]
+
+
+class LogCursor:
+    """Position in the logs, updated as the records are read.
+
+    The timestamps of the Docker daemon have nanoseconds, but `--since` is
+    used with a precision of one second when resuming. The records of the
+    last second are read again and the ones that were already read are
+    skipped. To do that, the cursor keeps, for stdout and stderr, the
+    timestamp of the last record (in nanoseconds since the epoch) and a hash
+    of the records that have this exact timestamp. stdout and stderr are
+    tracked separately because they are read from two pipes, so their
+    records don't arrive in the order of their timestamps. `--since` is the
+    second of the oldest position, and a source with no record read yet is
+    read from there without skipping anything.
+
+    ```python
+    from python_on_whales import LogCursor, docker
+
+    cursor = LogCursor.load("/var/lib/shipper/my_container.json")
+    for record in docker.container.log_records("my_container", cursor=cursor):
+        ship(record)
+        cursor.save("/var/lib/shipper/my_container.json")
+    ```
+    """
+
+    def __init__(self, positions: Optional[Dict[str, _SourcePosition]] = None):
+        # source -> position of the last record read on this source
+        self.positions: Dict[str, _SourcePosition] = {}
+        for source, position in (positions or {}).items():
+            self.positions[source] = _SourcePosition(
+                position.timestamp_ns, dict(position.last_records)
+            )
+
+    @property
+    def since(self) -> Optional[datetime]:
+        """The value of `--since` to use to resume reading the logs."""
+        if not self.positions:
+            return None
+        timestamp_ns = min(x.timestamp_ns for x in self.positions.values())
+        return datetime.fromtimestamp(timestamp_ns // 10**9, timezone.utc)
+
+    def advance(self, timestamp_ns: int, source: str, line: bytes) -> None:
+        position = self.positions.get(source)
+        if position is None or position.timestamp_ns != timestamp_ns:
+            position = _SourcePosition(timestamp_ns, {})
+            self.positions[source] = position
+        record_hash = _hash_line(line)
+        position.last_records[record_hash] = (
+            position.last_records.get(record_hash, 0) + 1
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            source: {
+                "timestamp_ns": position.timestamp_ns,
+                "last_records": position.last_records,
+            }
+            for source, position in self.positions.items()
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> LogCursor:
+        return cls(
+            {
+                source: _SourcePosition(x["timestamp_ns"], x["last_records"])
+                for source, x in data.items()
+            }
+        )
+
+    def save(self, path: ValidPath) -> None:
+        """Writes the cursor to a JSON file.
+
+        The file is replaced atomically, so a crash while saving leaves
+        the previous cursor intact.
+        """
+        path = Path(path)
+        temporary_path = path.with_name(path.name + ".tmp")
+        temporary_path.write_text(json.dumps(self.to_dict()))
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path: ValidPath) -> LogCursor:
+        """Reads a cursor written by `save`.
+
+        If the file doesn't exist, a cursor at the start of the logs is returned.
+        """
+        path = Path(path)
+        if not path.exists():
+            return cls()
+        return cls.from_dict(json.loads(path.read_text()))
+
+    def __repr__(self) -> str:
+        return f"LogCursor(since={self.since!r})"
+
+
+def _hash_line(line: bytes) -> str:
+    return hashlib.blake2b(line, digest_size=8).hexdigest()
+
+
+def read_log_records(
+    full_cmd: List,
+    target: str,
+    cursor: LogCursor,
+    since: Union[None, datetime, timedelta] = None,
+) -> Iterator[LogRecord]:
+    """Runs a logs command on `target` and yields the lines parsed as `LogRecord`.
+
+    `--timestamps` and `--since` are added to the command here. `since` is
+    only used if the cursor is at the start of the logs. The cursor is
+    advanced for each record, just before it is yielded.
+
+    The lines of `podman pod logs` start with the container, then the
+    timestamp. In this case, the record line is `<container> <message>`.
+    """
+    full_cmd = full_cmd + ["--timestamps"]
+    if cursor.since is not None:
+        since = cursor.since
+    if since is not None:
+        full_cmd += ["--since", format_time_arg(since)]
+    full_cmd.append(target)
+    # records to skip at the boundary, for each source
+    resumed_positions = LogCursor(cursor.positions).positions
+
+    for source, line in stream_stdout_and_stderr(full_cmd):
+        try:
+            message, parsed_timestamp, timestamp_ns = _split_timestamp(line)
+        except ValueError:
+            # not a log line, but an error message of the CLI. If the command
+            # fails, it's in the exception raised at the end.
+            continue
+
+        resumed_position = resumed_positions.get(source)
+        if resumed_position is not None:
+            if timestamp_ns < resumed_position.timestamp_ns:
+                continue
+            if timestamp_ns == resumed_position.timestamp_ns:
+                record_hash = _hash_line(message)
+                skipped = resumed_position.last_records.get(record_hash, 0)
+                if skipped > 0:
+                    resumed_position.last_records[record_hash] = skipped - 1
+                    continue
+            else:
+                # we are past the boundary, nothing more to skip
+                del resumed_positions[source]
+
+        cursor.advance(timestamp_ns, source, message)
+        yield LogRecord(parsed_timestamp, source, message)
+
+
+def _split_timestamp(line: bytes) -> Tuple[bytes, datetime, int]:
+    timestamp, _, message = line.partition(b" ")
+    try:
+        return (message, *parse_rfc3339_nano_with_ns(timestamp.decode()))
+    except ValueError:
+        prefix = timestamp
+        timestamp, _, message = message.partition(b" ")
+        parsed_timestamp, timestamp_ns = parse_rfc3339_nano_with_ns(timestamp.decode())
+        return prefix + b" " + message, parsed_timestamp, timestamp_ns
@@ -0,0 +1,475 @@
+"""Launches the docker commands from a small helper process.
+
+Before Python 3.10, starting a process with `subprocess` always forks the
+Python interpreter, and the time it takes grows with the memory used by the
+parent, because its page tables must be copied. Newer versions use `vfork`
+when they can, but still fork in some cases. The spawn server is a tiny
+helper process, started once while the parent is still small. Each command
+is then sent to the helper over a Unix socket, with the file descriptors to
+use as its stdin, stdout and stderr, and the helper launches it with
+`os.posix_spawn`. The parent reads the pipes as usual, the exit code is sent
+back by the helper. `benchmarks/spawn.py` compares both methods.
+
+```python
+from python_on_whales import spawn_server
+
+spawn_server.start_spawn_server()
+```
+
+Once started, every command launched by python-on-whales in this process
+goes through the helper. Not available on Windows.
+"""
+
+from __future__ import annotations
+
+import array
+import json
+import os
+import select
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import IO, Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+_HEADER = struct.Struct("!I")
+_MAX_FDS = 253
+
+# The signals ignored by the helper are restored in the commands it launches,
+# like `subprocess` does with `restore_signals=True`.
+_DEFAULT_SIGNALS = tuple(
+    getattr(signal, name)
+    for name in ("SIGINT", "SIGPIPE", "SIGXFSZ")
+    if hasattr(signal, name)
+)
+
+_File = Union[None, int, IO[Any]]
+
+
+def _send_message(
+    sock: socket.socket, message: Dict[str, Any], fds: Sequence[int] = ()
+) -> None:
+    payload = json.dumps(message).encode()
+    ancillary = []
+    if fds:
+        ancillary = [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", fds))]
+    # the file descriptors are attached to the header, which is small enough
+    # to always be sent at once.
+    sock.sendmsg([_HEADER.pack(len(payload))], ancillary)
+    sock.sendall(payload)
+
+
+def _receive_message(
+    sock: socket.socket,
+) -> Optional[Tuple[Dict[str, Any], List[int]]]:
+    """Returns `None` if the other end of the socket was closed."""
+    fds = array.array("i")
+    header, ancillary, _, _ = sock.recvmsg(
+        _HEADER.size,
+        socket.CMSG_SPACE(_MAX_FDS * fds.itemsize),
+        getattr(socket, "MSG_CMSG_CLOEXEC", 0),
+    )
+    for level, kind, data in ancillary:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(data[: len(data) - (len(data) % fds.itemsize)])
+    for fd in fds:
+        # without MSG_CMSG_CLOEXEC, they would be inherited by the next commands
+        os.set_inheritable(fd, False)
+    if header == b"":
+        return None
+    header += _receive_exactly(sock, _HEADER.size - len(header))
+    (size,) = _HEADER.unpack(header)
+    return json.loads(_receive_exactly(sock, size)), list(fds)
+
+
+def _receive_exactly(sock: socket.socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if chunk == b"":
+            raise EOFError("The connection with the spawn server was closed")
+        data += chunk
+    return data
+
+
+# ------------------------------------------------------------------------------
+# The helper process
+
+
+def serve(control_socket: socket.socket) -> None:
+    """Launches the commands received on `control_socket` until it's closed.
+
+    The commands are launched from this thread only, so that no other
+    command can inherit the file descriptors received for one command.
+    """
+    with control_socket:
+        while True:
+            message = _receive_message(control_socket)
+            if message is None:
+                # the parent exited or stopped the server
+                return
+            request, fds = message
+            _spawn(request, fds)
+
+
+def _spawn(request: Dict[str, Any], fds: List[int]) -> None:
+    reply_socket = socket.socket(fileno=fds[0])
+    child_fds = fds[1:]
+    try:
+        pid = os.posix_spawnp(
+            request["args"][0],
+            request["args"],
+            request["env"],
+            file_actions=_get_file_actions(child_fds, request["fd_numbers"]),
+            setsigdef=_DEFAULT_SIGNALS,
+        )
+    except OSError as err:
+        with reply_socket:
+            _send_message(
+                reply_socket,
+                {"errno": err.errno, "error": err.strerror, "filename": err.filename},
+            )
+        return
+    finally:
+        for fd in child_fds:
+            os.close(fd)
+    _send_message(reply_socket, {"pid": pid})
+    threading.Thread(
+        target=_wait_and_reply, args=(pid, reply_socket), daemon=True
+    ).start()
+
+
+def _get_file_actions(fds: List[int], fd_numbers: List[int]) -> List[tuple]:
+    # The file descriptors are first moved above all the numbers used, so
+    # that moving one to its number can't overwrite another one.
+    base = max(fds + fd_numbers) + 1
+    actions = []
+    for i, fd in enumerate(fds):
+        actions.append((os.POSIX_SPAWN_DUP2, fd, base + i))
+    for i, fd_number in enumerate(fd_numbers):
+        actions.append((os.POSIX_SPAWN_DUP2, base + i, fd_number))
+    for i in range(len(fds)):
+        actions.append((os.POSIX_SPAWN_CLOSE, base + i))
+    return actions
+
+
+def _wait_and_reply(pid: int, reply_socket: socket.socket) -> None:
+    _, status = os.waitpid(pid, 0)
+    if os.WIFSIGNALED(status):
+        returncode = -os.WTERMSIG(status)
+    else:
+        returncode = os.WEXITSTATUS(status)
+    with reply_socket:
+        try:
+            _send_message(reply_socket, {"returncode": returncode})
+        except OSError:
+            # nobody is waiting for this process anymore
+            pass
+
+
+# ------------------------------------------------------------------------------
+# The parent process
+
+
+class SpawnedProcess:
+    """A command launched by the spawn server.
+
+    It has the part of the `subprocess.Popen` interface used by
+    python-on-whales.
+    """
+
+    def __init__(
+        self,
+        args: List[str],
+        pid: int,
+        reply_socket: socket.socket,
+        stdin: Optional[IO[bytes]],
+        stdout: Optional[IO[bytes]],
+        stderr: Optional[IO[bytes]],
+    ):
+        self.args = args
+        self.pid = pid
+        self.stdin = stdin
+        self.stdout = stdout
+        self.stderr = stderr
+        self.returncode: Optional[int] = None
+        self._reply_socket = reply_socket
+        self._lock = threading.Lock()
+
+    def poll(self) -> Optional[int]:
+        return self._wait(0)
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        returncode = self._wait(timeout)
+        if returncode is None:
+            raise subprocess.TimeoutExpired(self.args, timeout)
+        return returncode
+
+    def _wait(self, timeout: Optional[float]) -> Optional[int]:
+        with self._lock:
+            if self.returncode is not None:
+                return self.returncode
+            # the reply is small, once it started to arrive, we can block
+            readable, _, _ = select.select([self._reply_socket], [], [], timeout)
+            if not readable:
+                return None
+            message = _receive_message(self._reply_socket)
+            self._reply_socket.close()
+            if message is None:
+                raise ChildProcessError(
+                    f"The spawn server exited before the end of {self.args}"
+                )
+            self.returncode = message[0]["returncode"]
+            return self.returncode
+
+    def send_signal(self, sig: int) -> None:
+        if self.poll() is None:
+            try:
+                os.kill(self.pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self) -> None:
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        self.send_signal(signal.SIGKILL)
+
+    def communicate(
+        self, input: Optional[bytes] = None
+    ) -> Tuple[Optional[bytes], Optional[bytes]]:
+        outputs: Dict[str, bytes] = {}
+        readers = {"stdout": self.stdout, "stderr": self.stderr}
+        threads = [
+            threading.Thread(
+                target=lambda k, f: outputs.__setitem__(k, f.read()),
+                args=(name, pipe),
+                daemon=True,
+            )
+            for name, pipe in readers.items()
+            if pipe is not None
+        ]
+        for thread in threads:
+            thread.start()
+        if self.stdin is not None:
+            try:
+                if input:
+                    self.stdin.write(input)
+                self.stdin.close()
+            except BrokenPipeError:
+                pass
+        for thread in threads:
+            thread.join()
+        for pipe in readers.values():
+            if pipe is not None:
+                pipe.close()
+        self.wait()
+        return outputs.get("stdout"), outputs.get("stderr")
+
+
+class SpawnServer:
+    """The connection with the helper process launching the commands.
+
+    Use `start_spawn_server()` rather than creating it directly.
+    """
+
+    def __init__(self):
+        parent_socket, helper_socket = socket.socketpair()
+        env = dict(os.environ)
+        # the helper must be able to import this module, even when
+        # python-on-whales isn't installed
+        env["PYTHONPATH"] = os.pathsep.join(
+            [str(Path(__file__).parents[1])]
+            + [x for x in [os.environ.get("PYTHONPATH")] if x]
+        )
+        with helper_socket:
+            self._process = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "python_on_whales.spawn_server",
+                    str(helper_socket.fileno()),
+                ],
+                stdin=subprocess.DEVNULL,
+                pass_fds=[helper_socket.fileno()],
+                env=env,
+            )
+        self._socket = parent_socket
+        self._lock = threading.Lock()
+        self.owner_pid = os.getpid()
+
+    def popen(
+        self,
+        args: List[Any],
+        stdin: _File = None,
+        stdout: _File = None,
+        stderr: _File = None,
+        env: Optional[Mapping[str, str]] = None,
+        pass_fds: Sequence[int] = (),
+    ) -> SpawnedProcess:
+        """Launches a command, like `subprocess.Popen`.
+
+        `stdin`, `stdout` and `stderr` can be `None` (the ones of this
+        process), `subprocess.PIPE`, `subprocess.DEVNULL`, a file
+        descriptor or a file object.
+        """
+        args = [str(x) for x in args]
+        child_fds: List[int] = []
+        parent_files: List[Optional[IO[bytes]]] = []
+        to_close: List[int] = []
+        try:
+            for fd_number, file in enumerate([stdin, stdout, stderr]):
+                child_fd, parent_file = _get_child_fd(fd_number, file, to_close)
+                child_fds.append(child_fd)
+                parent_files.append(parent_file)
+            reply_socket = self._send_request(args, env, child_fds, pass_fds)
+        except BaseException:
+            for parent_file in parent_files:
+                if parent_file is not None:
+                    parent_file.close()
+            raise
+        finally:
+            for fd in to_close:
+                os.close(fd)
+
+        reply = _receive_message(reply_socket)
+        if reply is None or "pid" not in reply[0]:
+            reply_socket.close()
+            for parent_file in parent_files:
+                if parent_file is not None:
+                    parent_file.close()
+            if reply is None:
+                raise ChildProcessError("The spawn server exited")
+            raise OSError(reply[0]["errno"], reply[0]["error"], reply[0]["filename"])
+        return SpawnedProcess(args, reply[0]["pid"], reply_socket, *parent_files)
+
+    def run(
+        self,
+        args: List[Any],
+        input: Optional[bytes] = None,
+        stdout: _File = None,
+        stderr: _File = None,
+        env: Optional[Mapping[str, str]] = None,
+        pass_fds: Sequence[int] = (),
+    ) -> subprocess.CompletedProcess:
+        """Runs a command until the end, like `subprocess.run`."""
+        process = self.popen(
+            args,
+            stdin=subprocess.PIPE if input is not None else None,
+            stdout=stdout,
+            stderr=stderr,
+            env=env,
+            pass_fds=pass_fds,
+        )
+        process_stdout, process_stderr = process.communicate(input)
+        return subprocess.CompletedProcess(
+            process.args, process.returncode, process_stdout, process_stderr
+        )
+
+    def _send_request(
+        self,
+        args: List[str],
+        env: Optional[Mapping[str, str]],
+        child_fds: List[int],
+        pass_fds: Sequence[int],
+    ) -> socket.socket:
+        pass_fds = list(pass_fds)
+        if len(pass_fds) + 4 > _MAX_FDS:
+            raise ValueError(f"At most {_MAX_FDS - 4} file descriptors can be passed")
+        request = {
+            "args": args,
+            # the helper has a copy of the environment from when it started
+            "env": dict(os.environ if env is None else env),
+            "fd_numbers": [0, 1, 2] + pass_fds,
+        }
+        reply_socket, helper_reply_socket = socket.socketpair()
+        with helper_reply_socket:
+            with self._lock:
+                _send_message(
+                    self._socket,
+                    request,
+                    [helper_reply_socket.fileno()] + child_fds + pass_fds,
+                )
+        return reply_socket
+
+    def close(self) -> None:
+        """Stops the helper. The commands still running are not stopped."""
+        self._socket.close()
+        self._process.wait()
+
+
+def _get_child_fd(
+    fd_number: int, file: _File, to_close: List[int]
+) -> Tuple[int, Optional[IO[bytes]]]:
+    """Returns the file descriptor to give to the command, and the file of the parent.
+
+    The file descriptors to close once sent are added to `to_close`.
+    """
+    if file is None:
+        try:
+            os.fstat(fd_number)
+        except OSError:
+            # closed in this process, the command can't inherit it
+            file = subprocess.DEVNULL
+        else:
+            return fd_number, None
+    if file == subprocess.DEVNULL:
+        fd = os.open(os.devnull, os.O_RDWR)
+        to_close.append(fd)
+        return fd, None
+    if file == subprocess.PIPE:
+        read_fd, write_fd = os.pipe()
+        if fd_number == 0:
+            to_close.append(read_fd)
+            return read_fd, open(write_fd, "wb")
+        to_close.append(write_fd)
+        return write_fd, open(read_fd, "rb")
+    if isinstance(file, int):
+        return file, None
+    return file.fileno(), None
+
+
+_SPAWN_SERVER: Optional[SpawnServer] = None
+_SPAWN_SERVER_LOCK = threading.Lock()
+
+
+def start_spawn_server() -> SpawnServer:
+    """Starts the helper launching the commands of python-on-whales.
+
+    Call it early, while the memory used by this process is still low. Does
+    nothing if it's already started.
+    """
+    global _SPAWN_SERVER
+    if sys.platform == "win32":
+        raise NotImplementedError("The spawn server is not available on Windows")
+    with _SPAWN_SERVER_LOCK:
+        if _SPAWN_SERVER is None:
+            _SPAWN_SERVER = SpawnServer()
+        return _SPAWN_SERVER
+
+
+def stop_spawn_server() -> None:
+    """Stops the helper, the commands are launched by this process again."""
+    global _SPAWN_SERVER
+    with _SPAWN_SERVER_LOCK:
+        if _SPAWN_SERVER is not None:
+            _SPAWN_SERVER.close()
+            _SPAWN_SERVER = None
+
+
+def get_spawn_server() -> Optional[SpawnServer]:
+    """Returns the spawn server, or `None` if the commands must be launched directly."""
+    spawn_server = _SPAWN_SERVER
+    if spawn_server is None or spawn_server.owner_pid != os.getpid():
+        # a forked child can't share the connection of its parent
+        return None
+    return spawn_server
+
+
+if __name__ == "__main__":
+    # ctrl+c is for the commands, the helper stops with its parent.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    serve(socket.socket(fileno=int(sys.argv[1])))
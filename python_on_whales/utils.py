@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import functools
+import json
 import logging
 import os
+import re
+import selectors
 import shlex
 import signal
 import subprocess
 import sys
+import typing
 from datetime import datetime, timedelta
 from pathlib import Path
 from queue import Queue
@@ -13,7 +18,10 @@ from subprocess import PIPE, Popen
 from threading import Thread
 from typing import (
     IO,
+    TYPE_CHECKING,
     Any,
+    AsyncIterator,
+    Callable,
     Dict,
     Iterable,
     Iterator,
@@ -22,6 +30,7 @@ from typing import (
     Optional,
     Sequence,
     Tuple,
+    Type,
     Union,
     overload,
 )
@@ -39,6 +48,10 @@ from python_on_whales.exceptions import (
     NoSuchVolume,
     NotASwarmManager,
 )
+from python_on_whales.spawn_server import get_spawn_server
+
+if TYPE_CHECKING:
+    import asyncio
 
 PROJECT_ROOT = Path(__file__).parents[1]
 
@@ -49,6 +62,63 @@ def custom_parse_object_as(type_, obj: Any):
     return pydantic.TypeAdapter(type_).validate_python(obj)
 
 
+# Same units and rules as `pydantic.ByteSize`, which we can't use on hot paths
+# because building a `TypeAdapter` is slow.
+_BYTE_UNITS = {
+    "b": 1,
+    "kb": 10**3,
+    "mb": 10**6,
+    "gb": 10**9,
+    "tb": 10**12,
+    "pb": 10**15,
+    "eb": 10**18,
+    "kib": 2**10,
+    "mib": 2**20,
+    "gib": 2**30,
+    "tib": 2**40,
+    "pib": 2**50,
+    "eib": 2**60,
+    "bit": 1 / 8,
+    "kbit": 10**3 / 8,
+    "mbit": 10**6 / 8,
+    "gbit": 10**9 / 8,
+    "tbit": 10**12 / 8,
+    "pbit": 10**15 / 8,
+    "ebit": 10**18 / 8,
+    "kibit": 2**10 / 8,
+    "mibit": 2**20 / 8,
+    "gibit": 2**30 / 8,
+    "tibit": 2**40 / 8,
+    "pibit": 2**50 / 8,
+    "eibit": 2**60 / 8,
+}
+_BYTE_UNITS.update({k[0]: v for k, v in _BYTE_UNITS.items() if "i" not in k})
+_BYTE_SIZE_RE = re.compile(r"^\s*(\d*\.?\d+)\s*(\w+)?")
+
+
+def parse_byte_size(value: str) -> pydantic.ByteSize:
+    """Parses a size like `"1.41MiB"` or `"962B"` as `pydantic.ByteSize` would."""
+    match = _BYTE_SIZE_RE.match(value)
+    if match is None:
+        raise ValueError(f"Could not parse the byte size '{value}'")
+    scalar, unit = match.groups()
+    try:
+        multiplier = _BYTE_UNITS[unit.lower()] if unit is not None else 1
+    except KeyError:
+        raise ValueError(f"Could not interpret the byte unit of '{value}'") from None
+    return pydantic.ByteSize(int(float(scalar) * multiplier))
+
+
+def parse_byte_size_pair(value: str) -> Tuple[pydantic.ByteSize, pydantic.ByteSize]:
+    """Parses the `"used / total"` sizes given by `docker stats`."""
+    left, _, right = value.partition("/")
+    return parse_byte_size(left), parse_byte_size(right)
+
+
+def parse_percentage(value: str) -> float:
+    return float(value.rstrip().rstrip("%"))
+
+
 def title_if_necessary(string: str):
     if string.isupper():
         return string
@@ -104,14 +174,149 @@ class DockerCamelModel(pydantic.BaseModel):
     )
 
 
+class LazyDockerCamelModel(DockerCamelModel):
+    """A `DockerCamelModel` validating its sub-models on first access.
+
+    The json of the fields which are models themselves, like `host_config`,
+    is kept as it is. It's validated and memoized the first time the
+    attribute is read. Comparing, copying, printing or dumping the model
+    validates everything first, so it behaves like a regular model.
+
+    A validation error in a sub-model is raised when reading it, as a
+    `python_on_whales.client_config.ParsingError`, like the errors of the
+    other fields.
+    """
+
+    _pending_sub_models: Dict[str, Any] = pydantic.PrivateAttr(default_factory=dict)
+
+    @pydantic.model_validator(mode="wrap")
+    @classmethod
+    def _defer_sub_models(cls, data: Any, handler: Callable[[Any], Any]) -> Any:
+        if not isinstance(data, dict):
+            return handler(data)
+        data = dict(data)
+        pending = {}
+        for field_name, (alias, _) in _get_sub_models(cls).items():
+            for key in (alias, field_name):
+                if data.get(key) is not None:
+                    pending[field_name] = data.pop(key)
+                    break
+        model = handler(data)
+        for field_name in pending:
+            # the default value, `None`, would be found before `__getattr__`
+            del model.__dict__[field_name]
+        model.__pydantic_fields_set__.update(pending)
+        # faster than going through `__setattr__` and `__getattr__`
+        model.__pydantic_private__["_pending_sub_models"] = pending
+        return model
+
+    def __getattr__(self, name: str) -> Any:
+        if name[0] != "_" and self.__pydantic_private__ is not None:
+            pending = self.__pydantic_private__["_pending_sub_models"]
+            json_object = pending.get(name)
+            if json_object is not None:
+                alias, sub_model = _get_sub_models(type(self))[name]
+                try:
+                    value = sub_model.model_validate(json_object)
+                except pydantic.ValidationError as err:
+                    from python_on_whales.client_config import (
+                        parsing_error_with_report,
+                    )
+
+                    raise parsing_error_with_report({alias: json_object}) from err
+                self.__dict__[name] = value
+                pending.pop(name, None)
+                return value
+            if name in self.__dict__:
+                # validated by another thread in the meantime
+                return self.__dict__[name]
+        return super().__getattr__(name)
+
+    def _validate_pending_sub_models(self) -> None:
+        pending = self.__pydantic_private__["_pending_sub_models"]
+        for name in list(pending):
+            if name in self.__dict__:
+                # assigned by the user
+                pending.pop(name, None)
+            else:
+                getattr(self, name)
+        # pydantic serializes the sub-models without calling their methods
+        for name in _get_sub_models(type(self)):
+            value = self.__dict__.get(name)
+            if isinstance(value, LazyDockerCamelModel):
+                value._validate_pending_sub_models()
+
+    def __eq__(self, other: Any) -> bool:
+        self._validate_pending_sub_models()
+        if isinstance(other, LazyDockerCamelModel):
+            other._validate_pending_sub_models()
+        return super().__eq__(other)
+
+    def __iter__(self):
+        self._validate_pending_sub_models()
+        return super().__iter__()
+
+    def __repr_args__(self):
+        self._validate_pending_sub_models()
+        return super().__repr_args__()
+
+    def __copy__(self):
+        self._validate_pending_sub_models()
+        return super().__copy__()
+
+    def __deepcopy__(self, memo=None):
+        self._validate_pending_sub_models()
+        return super().__deepcopy__(memo)
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        self._validate_pending_sub_models()
+        return super().__getstate__()
+
+    def model_dump(self, **kwargs) -> Dict[str, Any]:
+        self._validate_pending_sub_models()
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs) -> str:
+        self._validate_pending_sub_models()
+        return super().model_dump_json(**kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_sub_models(
+    model_class: Type[pydantic.BaseModel],
+) -> Dict[str, Tuple[str, Type[pydantic.BaseModel]]]:
+    """Returns the json key and the model of the fields which are models."""
+    result = {}
+    for field_name, field in model_class.model_fields.items():
+        annotation = field.annotation
+        if typing.get_origin(annotation) is Union:
+            arguments = [x for x in typing.get_args(annotation) if x is not type(None)]
+            if len(arguments) == 1:
+                annotation = arguments[0]
+        if (
+            isinstance(annotation, type)
+            and issubclass(annotation, pydantic.BaseModel)
+            and not field.is_required()
+        ):
+            alias = field.alias or to_docker_camel(field_name)
+            result[field_name] = (alias, annotation)
+    return result
+
+
 def get_docker_exception_type(output: Optional[bytes]) -> type[DockerException]:
     if not output:
         return DockerException
     decoded = output.decode().lower()
-    if "no such image" in decoded or "image not known" in decoded:
+    if (
+        "no such image" in decoded
+        or "image not known" in decoded
+        or "reference does not exist" in decoded
+    ):
         return NoSuchImage
-    if "no such service" in decoded or (
-        "service" in decoded and "not found" in decoded
+    if (
+        "no such service" in decoded
+        or "no such task or service" in decoded
+        or ("service" in decoded and "not found" in decoded)
     ):
         return NoSuchService
     if "no such container" in decoded:
@@ -137,6 +342,7 @@ def run(
     env: Dict[str, str] = ...,
     tty: bool = ...,
     pass_fds: Sequence[int] = ...,
+    decode: Literal[True] = ...,
 ) -> Tuple[str, str]: ...
 
 
@@ -150,9 +356,25 @@ def run(
     env: Dict[str, str] = ...,
     tty: bool = ...,
     pass_fds: Sequence[int] = ...,
+    decode: Literal[True] = ...,
 ) -> str: ...
 
 
+@overload
+def run(
+    args: List[Any],
+    capture_stdout: bool = ...,
+    capture_stderr: bool = ...,
+    input: bytes = ...,
+    return_stderr: Literal[False] = ...,
+    env: Dict[str, str] = ...,
+    tty: bool = ...,
+    pass_fds: Sequence[int] = ...,
+    *,
+    decode: Literal[False],
+) -> bytes: ...
+
+
 def run(
     args: List[Any],
     capture_stdout: bool = True,
@@ -162,12 +384,10 @@ def run(
     env: Dict[str, str] = {},
     tty: bool = False,
     pass_fds: Sequence[int] = (),
-) -> Union[str, Tuple[str, str]]:
+    decode: bool = True,
+) -> Union[str, bytes, Tuple[str, str]]:
     args = [str(x) for x in args]
-    subprocess_env = dict(os.environ)
-    subprocess_env.update(env)
-    if args[1] == "buildx":
-        subprocess_env["DOCKER_CLI_EXPERIMENTAL"] = "enabled"
+    subprocess_env = _get_subprocess_env(args, env)
     if tty:
         stdout_dest = sys.stdout
     elif capture_stdout:
@@ -183,10 +403,11 @@ def run(
     if os.environ.get("PYTHON_ON_WHALES_DEBUG", "0") == "1":
         print("------------------------------")
         print("command: " + " ".join(args))
-        print(f"Env: {subprocess_env}")
+        print(f"Env: {dict(os.environ) if subprocess_env is None else subprocess_env}")
         print("------------------------------")
     LOGGER.debug("Running command: %s", shlex.join(args))
-    completed_process = subprocess.run(
+    spawn_server = get_spawn_server()
+    completed_process = (subprocess if spawn_server is None else spawn_server).run(
         args,
         input=input,
         stdout=stdout_dest,
@@ -204,6 +425,9 @@ def run(
             completed_process.stderr,
         )
 
+    if not decode:
+        # the stdout as it was printed, for parsers reading bytes
+        return completed_process.stdout or b""
     if return_stderr:
         return (
             post_process_stream(completed_process.stdout),
@@ -222,6 +446,36 @@ def post_process_stream(stream: Optional[bytes]) -> str:
     return stream
 
 
+def split_json_array(json_array: Union[str, bytes]) -> List[bytes]:
+    """Splits the json array printed by `docker <type> inspect` into its elements.
+
+    The elements are returned as json, not decoded. Pydantic can validate
+    them with `model_validate_json` without building python dicts first,
+    which is faster.
+    """
+    if isinstance(json_array, str):
+        json_array = json_array.encode()
+    stripped = json_array.strip()
+    if stripped == b"[]":
+        return []
+    # The CLI indents its output. A newline in a json string is escaped, so a
+    # comma, a newline and the indentation of the first element followed by
+    # `{` can only be found between two elements.
+    start = stripped.find(b"{")
+    indent = stripped[1:start]
+    if not (
+        start > 2
+        and indent.startswith(b"\n")
+        and indent[1:].strip(b" ") == b""
+        and stripped.endswith(indent + b"}\n]")
+    ):
+        return [json.dumps(x).encode() for x in json.loads(json_array)]
+    # each element keeps its trailing newline and indentation, json parsers
+    # ignore them.
+    first_element, *other_elements = stripped[start:-2].split(b"," + indent + b"{")
+    return [first_element] + [b"{" + x for x in other_elements]
+
+
 ValidPath = Union[str, Path]
 ValidPortMapping = Union[
     Tuple[Union[str, int]],
@@ -269,35 +523,59 @@ class ProcessStream(Iterable[Tuple[str, bytes]]):
     """Wrapper around a streaming subprocess that also exposes stdin.
 
     Iterating over a ``ProcessStream`` yields ``(source, line)`` tuples.
+    ``process`` can be used to kill the subprocess from another thread.
     """
 
     def __init__(
         self,
         iterator: Iterable[Tuple[str, bytes]],
         stdin: Optional[IO[bytes]] = None,
+        process: Optional[Popen] = None,
     ) -> None:
         self.iterator: Iterable[Tuple[str, bytes]] = iterator
         self.stdin: Optional[IO[bytes]] = stdin
+        self.process: Optional[Popen] = process
 
     def __iter__(self) -> Iterator[Tuple[str, bytes]]:
         return iter(self.iterator)
 
 
+def popen(args: List[str], **kwargs) -> Popen:
+    """Same as `subprocess.Popen`, but uses the spawn server if it was started.
+
+    Only the `stdin`, `stdout`, `stderr`, `env` and `pass_fds` arguments
+    are supported.
+    """
+    spawn_server = get_spawn_server()
+    if spawn_server is None:
+        return Popen(args, **kwargs)
+    return spawn_server.popen(args, **kwargs)
+
+
+# Pipes can't be used with selectors on Windows, we use a thread per pipe there.
+_USE_SELECTORS = sys.platform != "win32"
+
+
 def _start_process(
     full_cmd: list,
     env: Dict[str, str] = None,
     pass_fds: Sequence[int] = (),
     pipe_stdin: bool = False,
-) -> Tuple[Popen, Queue]:
-    """Start a subprocess and wire up reader threads for stdout/stderr."""
-    if env is None:
+) -> Tuple[Popen, Optional[Queue]]:
+    """Start a subprocess, and reader threads for stdout/stderr if needed.
+
+    The pipes are read with a selector while the caller iterates, except on
+    Windows and when stdin is piped: the caller may write to stdin before
+    iterating, the process would then block on a full stdout pipe.
+    """
+    if not env:
         subprocess_env = None
     else:
         subprocess_env = dict(os.environ)
         subprocess_env.update(env)
 
     full_cmd = list(map(str, full_cmd))
-    process = Popen(
+    process = popen(
         full_cmd,
         stdin=PIPE if pipe_stdin else None,
         stdout=PIPE,
@@ -305,6 +583,8 @@ def _start_process(
         env=subprocess_env,
         pass_fds=pass_fds,
     )
+    if _USE_SELECTORS and not pipe_stdin:
+        return process, None
     q: Queue = Queue()
     # we use deamon threads to avoid hanging if the user uses ctrl+c
     th = Thread(target=reader, args=[process.stdout, "stdout", q])
@@ -316,16 +596,96 @@ def _start_process(
     return process, q
 
 
+class PipesLinesReader:
+    """Reads the lines of many pipes from the current thread, with a selector.
+
+    Pipes can be added at any time. Not available on Windows.
+    """
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+
+    def add(self, pipe: IO[bytes], key: Any) -> None:
+        os.set_blocking(pipe.fileno(), False)
+        # the data is the key and the incomplete line read so far
+        self._selector.register(pipe.fileno(), selectors.EVENT_READ, [key, b""])
+
+    def __len__(self) -> int:
+        return len(self._selector.get_map())
+
+    def read(
+        self, timeout: Optional[float] = None
+    ) -> List[Tuple[Any, Optional[bytes]]]:
+        """Waits for data and returns the `(key, line)` tuples available.
+
+        Lines keep their trailing newline, except maybe the last line of a pipe.
+        When a pipe reaches end of file, it's removed and `(key, None)` is
+        returned. Returns an empty list after `timeout` seconds without data.
+        """
+        result = []
+        for selector_key, _ in self._selector.select(timeout):
+            state = selector_key.data
+            try:
+                data = os.read(selector_key.fd, 65536)
+            except BlockingIOError:
+                continue
+            if data == b"":
+                self._selector.unregister(selector_key.fd)
+                if state[1] != b"":
+                    result.append((state[0], state[1]))
+                result.append((state[0], None))
+                continue
+            *lines, state[1] = (state[1] + data).split(b"\n")
+            result.extend((state[0], line + b"\n") for line in lines)
+        return result
+
+    def close(self) -> None:
+        self._selector.close()
+
+
+def iter_pipes_lines(pipes: Mapping[IO[bytes], Any]) -> Iterator[Tuple[Any, bytes]]:
+    """Reads many pipes at once from the current thread, with a selector.
+
+    Yields `(key, line)` tuples as soon as lines are available, `key` being the
+    value associated with the pipe in `pipes`. Lines keep their trailing
+    newline, except maybe the last line of a pipe. Ends when all pipes
+    reached end of file. Not available on Windows.
+    """
+    reader = PipesLinesReader()
+    try:
+        for pipe, key in pipes.items():
+            reader.add(pipe, key)
+        while len(reader) > 0:
+            for key, line in reader.read():
+                if line is not None:
+                    yield key, line
+    finally:
+        reader.close()
+
+
 def _iter_process(
-    process: Popen, q: Queue, full_cmd: list
+    process: Popen, q: Optional[Queue], full_cmd: list
 ) -> Iterable[Tuple[str, bytes]]:
     """Iterate stdout/stderr from a non-interactive process."""
     full_stderr = b""
-    for _ in range(2):
-        for source, line in iter(q.get, None):
-            yield source, line
-            if source == "stderr":
-                full_stderr += line
+    if q is None:
+        try:
+            pipes = {process.stdout: "stdout", process.stderr: "stderr"}
+            for source, line in iter_pipes_lines(pipes):
+                yield source, line
+                if source == "stderr":
+                    full_stderr += line
+        finally:
+            # if the iteration stops early, the process gets a broken pipe
+            # when it writes again, like in a shell pipeline.
+            process.stdout.close()
+            process.stderr.close()
+    else:
+        for _ in range(2):
+            for source, line in iter(q.get, None):
+                yield source, line
+                if source == "stderr":
+                    full_stderr += line
 
     exit_code = process.wait()
     if exit_code != 0:
@@ -350,7 +710,322 @@ def stream_stdout_and_stderr(
     """
     process, q = _start_process(full_cmd, env, pass_fds, pipe_stdin)
     full_cmd = list(map(str, full_cmd))
-    return ProcessStream(_iter_process(process, q, full_cmd), process.stdin)
+    return ProcessStream(_iter_process(process, q, full_cmd), process.stdin, process)
+
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+def stream_stdout_in_chunks(
+    full_cmd: list, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Runs a command and yields its binary stdout in chunks of `chunk_size` bytes.
+
+    Only the last chunk can be smaller. The bytes are read with `readinto`
+    in a single reusable buffer, each chunk yielded is a copy of it.
+    If the iteration stops early, the process is killed.
+    """
+    full_cmd = [str(x) for x in full_cmd]
+    process = popen(full_cmd, stdout=PIPE, stderr=PIPE)
+    # stderr is read in the background, so that the process can't block
+    # on a full stderr pipe.
+    stderr_chunks = []
+    stderr_reader = Thread(
+        target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True
+    )
+    stderr_reader.start()
+    buffer = memoryview(bytearray(chunk_size))
+    finished = False
+    try:
+        while True:
+            size = _read_into(process.stdout, buffer)
+            if size > 0:
+                yield bytes(buffer[:size])
+            if size < chunk_size:
+                break
+        finished = True
+    finally:
+        if not finished:
+            process.kill()
+        process.stdout.close()
+        exit_code = process.wait()
+        stderr_reader.join()
+        process.stderr.close()
+
+    if exit_code != 0:
+        stderr = b"".join(stderr_chunks)
+        exception_type = get_docker_exception_type(stderr)
+        raise exception_type(
+            command_launched=full_cmd, return_code=exit_code, stderr=stderr
+        )
+
+
+def _read_into(file: IO[bytes], buffer: memoryview) -> int:
+    """Fills the buffer, unless the end of the file is reached first."""
+    size = 0
+    while size < len(buffer):
+        read = file.readinto(buffer[size:])
+        if not read:
+            break
+        size += read
+    return size
+
+
+def pipe_commands(
+    source_cmd: list,
+    destination_cmd: list,
+    on_bytes: Optional[Callable[[int], None]] = None,
+) -> str:
+    """Runs `source_cmd | destination_cmd` and returns the stdout of the destination.
+
+    If `on_bytes` is `None`, the stdout of the source is directly the stdin of
+    the destination, the bytes never go through Python. Otherwise they're
+    moved with `os.splice` when available (Linux, Python 3.10+), or copied in
+    chunks, and `on_bytes` is called with the number of bytes moved at each step.
+    """
+    source_cmd = [str(x) for x in source_cmd]
+    destination_cmd = [str(x) for x in destination_cmd]
+    source = popen(source_cmd, stdout=PIPE, stderr=PIPE)
+    try:
+        destination = popen(
+            destination_cmd,
+            stdin=source.stdout if on_bytes is None else PIPE,
+            stdout=PIPE,
+            stderr=PIPE,
+        )
+    except BaseException:
+        source.kill()
+        source.wait()
+        raise
+    if on_bytes is None:
+        # only the destination must read it, otherwise the source would never
+        # get a broken pipe if the destination exits early.
+        source.stdout.close()
+
+    readers = {
+        "source_stderr": source.stderr,
+        "destination_stdout": destination.stdout,
+        "destination_stderr": destination.stderr,
+    }
+    outputs: Dict[str, bytes] = {}
+    threads = [
+        Thread(target=lambda k, f: outputs.__setitem__(k, f.read()), args=item)
+        for item in readers.items()
+    ]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+
+    if on_bytes is not None:
+        try:
+            _copy_between_pipes(source.stdout, destination.stdin, on_bytes)
+            destination.stdin.close()
+        except BrokenPipeError:
+            # the destination exited, its error is raised below.
+            pass
+        finally:
+            source.stdout.close()
+
+    destination_exit_code = destination.wait()
+    if destination_exit_code != 0 and source.poll() is None:
+        source.kill()
+    source_exit_code = source.wait()
+    for thread in threads:
+        thread.join()
+    for pipe in readers.values():
+        pipe.close()
+    if on_bytes is not None and not destination.stdin.closed:
+        try:
+            destination.stdin.close()
+        except BrokenPipeError:
+            pass
+
+    # when the destination fails, the source usually fails too because of the
+    # broken pipe, the error of the destination is then the interesting one.
+    source_broken_pipe = source_exit_code < 0 or (
+        b"broken pipe" in outputs["source_stderr"].lower()
+    )
+    if source_exit_code != 0 and not (
+        destination_exit_code != 0 and source_broken_pipe
+    ):
+        stderr = outputs["source_stderr"]
+        raise get_docker_exception_type(stderr)(
+            command_launched=source_cmd, return_code=source_exit_code, stderr=stderr
+        )
+    if destination_exit_code != 0:
+        stderr = outputs["destination_stderr"]
+        raise get_docker_exception_type(stderr)(
+            destination_cmd,
+            destination_exit_code,
+            outputs["destination_stdout"],
+            stderr,
+        )
+    return post_process_stream(outputs["destination_stdout"])
+
+
+def _copy_between_pipes(
+    source: IO[bytes], destination: IO[bytes], on_bytes: Callable[[int], None]
+) -> None:
+    splice = getattr(os, "splice", None)
+    if splice is not None:
+        while True:
+            moved = splice(source.fileno(), destination.fileno(), DEFAULT_CHUNK_SIZE)
+            if moved == 0:
+                return
+            on_bytes(moved)
+    buffer = memoryview(bytearray(DEFAULT_CHUNK_SIZE))
+    while True:
+        size = source.readinto(buffer)
+        if not size:
+            return
+        destination.write(buffer[:size])
+        on_bytes(size)
+
+
+def _get_subprocess_env(
+    args: List[str], env: Dict[str, str]
+) -> Optional[Dict[str, str]]:
+    """Returns the environment of the subprocess, `None` meaning the one of Python.
+
+    `os.environ` is only copied when some variables must be changed.
+    """
+    if len(args) > 1 and args[1] == "buildx":
+        env = {**env, "DOCKER_CLI_EXPERIMENTAL": "enabled"}
+    if not env:
+        return None
+    subprocess_env = dict(os.environ)
+    subprocess_env.update(env)
+    return subprocess_env
+
+
+async def run_async(
+    args: List[Any],
+    input: Optional[bytes] = None,
+    env: Dict[str, str] = {},
+    capture_stdout: bool = True,
+    capture_stderr: bool = True,
+) -> str:
+    """Same as `run` but with `asyncio.create_subprocess_exec`."""
+    import asyncio
+
+    args = [str(x) for x in args]
+    LOGGER.debug("Running command: %s", shlex.join(args))
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdin=PIPE if input is not None else None,
+        stdout=PIPE if capture_stdout else None,
+        stderr=PIPE if capture_stderr else None,
+        env=_get_subprocess_env(args, env),
+    )
+    stdout, stderr = await process.communicate(input)
+    if process.returncode != 0:
+        exception_type = get_docker_exception_type(stderr)
+        raise exception_type(args, process.returncode, stdout, stderr)
+    return post_process_stream(stdout)
+
+
+class AsyncProcessStream(AsyncIterator[Tuple[str, bytes]]):
+    """Async version of `ProcessStream`.
+
+    Iterating over an ``AsyncProcessStream`` with ``async for`` yields
+    ``(source, line)`` tuples. ``stdin`` is an `asyncio.StreamWriter` when
+    the process was started with ``pipe_stdin=True``.
+    """
+
+    def __init__(
+        self,
+        iterator: AsyncIterator[Tuple[str, bytes]],
+        stdin: Optional[asyncio.StreamWriter] = None,
+    ) -> None:
+        self.iterator = iterator
+        self.stdin = stdin
+
+    def __aiter__(self) -> AsyncIterator[Tuple[str, bytes]]:
+        return self
+
+    async def __anext__(self) -> Tuple[str, bytes]:
+        return await self.iterator.__anext__()
+
+
+async def _read_lines_async(
+    stream: asyncio.StreamReader, name: str, queue: asyncio.Queue
+) -> None:
+    # We don't use StreamReader.readline() because it fails on lines longer
+    # than the buffer limit, which can happen with logs.
+    try:
+        pending = b""
+        while True:
+            chunk = await stream.read(65536)
+            if not chunk:
+                break
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            for line in lines:
+                await queue.put((name, line + b"\n"))
+        if pending:
+            await queue.put((name, pending))
+    finally:
+        await queue.put(None)
+
+
+async def _iter_process_async(
+    process: asyncio.subprocess.Process, full_cmd: List[str]
+) -> AsyncIterator[Tuple[str, bytes]]:
+    import asyncio
+
+    queue: asyncio.Queue = asyncio.Queue()
+    readers = [
+        asyncio.ensure_future(_read_lines_async(process.stdout, "stdout", queue)),
+        asyncio.ensure_future(_read_lines_async(process.stderr, "stderr", queue)),
+    ]
+    full_stderr = b""
+    try:
+        for _ in range(2):
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                source, line = item
+                if source == "stderr":
+                    full_stderr += line
+                yield source, line
+        exit_code = await process.wait()
+    finally:
+        if process.returncode is None:
+            # the caller stopped iterating before the end.
+            process.kill()
+            await process.wait()
+        for reader_task in readers:
+            reader_task.cancel()
+
+    if exit_code != 0:
+        exception_type = get_docker_exception_type(full_stderr)
+        raise exception_type(
+            command_launched=full_cmd, return_code=exit_code, stderr=full_stderr
+        )
+
+
+async def stream_stdout_and_stderr_async(
+    full_cmd: list,
+    env: Dict[str, str] = None,
+    pipe_stdin: bool = False,
+) -> AsyncProcessStream:
+    """Async version of `stream_stdout_and_stderr`.
+
+    The lines of stdout and stderr are read by the event loop, no thread is
+    started.
+    """
+    import asyncio
+
+    full_cmd = list(map(str, full_cmd))
+    process = await asyncio.create_subprocess_exec(
+        *full_cmd,
+        stdin=PIPE if pipe_stdin else None,
+        stdout=PIPE,
+        stderr=PIPE,
+        env=None if env is None else _get_subprocess_env(full_cmd, env),
+    )
+    return AsyncProcessStream(_iter_process_async(process, full_cmd), process.stdin)
 
 
 def format_mapping_for_cli(mapping: Mapping[str, str], separator="="):
@@ -382,6 +1057,109 @@ def read_env_files(env_files: List[Path]) -> Dict[str, str]:
     return result_dict
 
 
+_RFC3339_NANO_RE = re.compile(
+    r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:\d{2})"
+)
+
+
+def parse_rfc3339_nano(value: str) -> datetime:
+    """Parses the timestamps of the Docker daemon, like `2024-05-01T12:00:00.123456789Z`.
+
+    Python datetimes only have microseconds, the other digits are dropped.
+    """
+    match = _RFC3339_NANO_RE.fullmatch(value)
+    if match is None:
+        raise ValueError(f"Invalid RFC 3339 timestamp: '{value}'")
+    base, fraction, timezone = match.groups()
+    microseconds = (fraction or "")[:6].ljust(6, "0")
+    if timezone == "Z":
+        timezone = "+00:00"
+    return datetime.fromisoformat(f"{base}.{microseconds}{timezone}")
+
+
+def parse_rfc3339_nano_with_ns(value: str) -> Tuple[datetime, int]:
+    """Same as `parse_rfc3339_nano`, but also returns the nanoseconds since the epoch.
+
+    The nanoseconds keep all the digits of the timestamp.
+    """
+    parsed = parse_rfc3339_nano(value)
+    fraction = _RFC3339_NANO_RE.fullmatch(value).group(2) or ""
+    seconds = int(parsed.replace(microsecond=0).timestamp())
+    return parsed, seconds * 10**9 + int(fraction[:9].ljust(9, "0"))
+
+
+_GO_TIME_RE = re.compile(
+    r"(\d{4}-\d{2}-\d{2}) (\d{2}:\d{2}:\d{2})(?:\.(\d+))? ([+-]\d{2})(\d{2})"
+)
+
+
+def parse_go_time(value: str) -> datetime:
+    """Parses the timestamps printed by the CLI, like `2024-05-01 12:00:00 +0200 CEST`.
+
+    This is the default format of Go, used by the `CreatedAt` column of
+    `docker ps` and `docker image ls`.
+    """
+    match = _GO_TIME_RE.match(value)
+    if match is None:
+        raise ValueError(f"Invalid timestamp: '{value}'")
+    date, time_of_day, fraction, hours, minutes = match.groups()
+    microseconds = (fraction or "")[:6].ljust(6, "0")
+    return datetime.fromisoformat(
+        f"{date}T{time_of_day}.{microseconds}{hours}:{minutes}"
+    )
+
+
+def parse_json_lines(output: str) -> List[Any]:
+    """Parses the output of `--format '{{json .}}'`, one json object per line.
+
+    All the lines are parsed with a single call to `json.loads`.
+    """
+    if output == "":
+        return []
+    # the newlines in the strings are escaped, only the separators are left
+    return json.loads("[" + output.replace("\n", ",") + "]")
+
+
+# a path in the json of an inspect result, like `State.Status`
+_INSPECT_FIELD_RE = re.compile(r"[A-Za-z_]\w*(\.[A-Za-z_]\w*)*")
+
+
+def _check_inspect_field(field: str) -> None:
+    if _INSPECT_FIELD_RE.fullmatch(field) is None:
+        raise ValueError(
+            f"'{field}' is not a valid field of an inspect result, "
+            f"it should look like 'State.Status' or 'Config.Labels'."
+        )
+
+
+def inspect_fields_template(fields: Sequence[str]) -> str:
+    """Returns the Go template printing some fields of an inspect result.
+
+    The fields are printed as a json object on a single line, with the
+    fields as keys, like `{"State.Status":"running"}`.
+    """
+    for field in fields:
+        _check_inspect_field(field)
+    return "{" + ",".join(f"{json.dumps(x)}:{{{{json .{x}}}}}" for x in fields) + "}"
+
+
+def select_inspect_fields(
+    json_object: Mapping[str, Any], fields: Sequence[str]
+) -> Dict[str, Any]:
+    """Same result as `inspect_fields_template`, from the full inspect result.
+
+    The missing fields are `None`.
+    """
+    result = {}
+    for field in fields:
+        _check_inspect_field(field)
+        value = json_object
+        for key in field.split("."):
+            value = value.get(key) if isinstance(value, dict) else None
+        result[field] = value
+    return result
+
+
 def format_time_arg(time_object):
     if time_object is None:
         return None
@@ -1,11 +1,14 @@
 import json
 import os
+import queue
 import signal
 import sys
 import tempfile
+import threading
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Literal, Union
 from unittest.mock import Mock, patch
 
@@ -13,11 +16,21 @@ import pytest
 
 import python_on_whales
 from python_on_whales import DockerClient, Image, docker
-from python_on_whales.components.container.cli_wrapper import ContainerStats
+from python_on_whales.client_config import ClientConfig, inspect_json
+from python_on_whales.components.container.cli_wrapper import (
+    ContainerCLI,
+    ContainerLogLine,
+    ContainerStats,
+    ContainerStatsHistory,
+    ContainerStatsSeries,
+    ContainerSummary,
+)
 from python_on_whales.components.container.models import (
     ContainerInspectResult,
     ContainerState,
 )
+from python_on_whales.components.system.cli_wrapper import SystemCLI
+from python_on_whales.components.system.models import DockerEvent
 from python_on_whales.exceptions import DockerException, NoSuchContainer
 from python_on_whales.test_utils import get_all_jsons, random_name
 
@@ -39,7 +52,7 @@ CMD python /file.py
 @pytest.mark.parametrize("json_file", get_all_jsons("containers"))
 def test_load_json(json_file):
     json_as_txt = json_file.read_text()
-    ContainerInspectResult(**json.loads(json_as_txt))
+    ContainerInspectResult(**json.loads(json_as_txt)).model_dump()
     # we could do more checks here if needed
 
 
@@ -636,6 +649,106 @@ def test_list_filters(ctr_client: DockerClient):
         container.kill()
 
 
+def test_list_summary(docker_client: DockerClient):
+    random_label_value = random_name()
+    with docker_client.run(
+        "busybox",
+        ["sleep", "infinity"],
+        remove=True,
+        detach=True,
+        labels=dict(dodo=random_label_value),
+    ) as container:
+        summaries = docker_client.container.list(
+            filters=[("label", f"dodo={random_label_value}")], details="summary"
+        )
+        assert len(summaries) == 1
+        assert summaries[0].id == container.id
+        assert summaries[0].names == [container.name]
+        assert summaries[0].image == "busybox"
+        assert summaries[0].state == "running"
+        assert summaries[0].labels["dodo"] == random_label_value
+        assert summaries[0].to_container() == container
+
+
+def test_inspect_raw_and_fields(docker_client: DockerClient):
+    with docker_client.run(
+        "busybox", ["sleep", "infinity"], detach=True, remove=True, labels={"a": "b"}
+    ) as container:
+        raw = docker_client.container.inspect(container.id, raw=True)
+        assert raw["Id"] == container.id
+        assert raw["State"]["Status"] == "running"
+
+        fields = docker_client.container.inspect(
+            [container.name], fields=["State.Status", "Config.Labels"]
+        )
+        assert fields == [{"State.Status": "running", "Config.Labels": {"a": "b"}}]
+
+
+@patch("python_on_whales.utils.run")
+def test_inspect_fields_uses_a_go_template(run_mock: Mock, mocker):
+    mocker.patch.object(
+        ClientConfig, "get_client_call_with_path", return_value=["docker"]
+    )
+    run_mock.return_value = (
+        '{"State.Status":"running","Name":"/a"}\n'
+        '{"State.Status":"exited","Name":"/b"}'
+    )
+    result = docker.container.inspect(["a", "b"], fields=["State.Status", "Name"])
+
+    assert result == [
+        {"State.Status": "running", "Name": "/a"},
+        {"State.Status": "exited", "Name": "/b"},
+    ]
+    run_mock.assert_called_once_with(
+        docker.client_config.docker_cmd
+        + [
+            "container",
+            "inspect",
+            "--format",
+            '{"State.Status":{{json .State.Status}},"Name":{{json .Name}}}',
+            "a",
+            "b",
+        ]
+    )
+    with pytest.raises(ValueError):
+        docker.container.inspect("a", fields=["State.Status}}{{.Dodo"])
+    with pytest.raises(ValueError):
+        docker.container.inspect("a", raw=True, fields=["Name"])
+
+
+def test_container_summary_parsing():
+    line = {
+        "Command": '"sleep infinity"',
+        "CreatedAt": "2024-05-01 12:00:00 +0200 CEST",
+        "ID": "a" * 64,
+        "Image": "busybox",
+        "Labels": "dodo=dada,other=",
+        "LocalVolumes": "1",
+        "Mounts": "1b2c,/tmp",
+        "Names": "my_container",
+        "Networks": "bridge,host",
+        "Ports": "0.0.0.0:80->80/tcp, :::80->80/tcp",
+        "RunningFor": "2 hours ago",
+        "Size": "12B (virtual 4.26MB)",
+        "State": "running",
+        "Status": "Up 2 hours",
+    }
+    summary = ContainerSummary(docker.client_config, line)
+    assert summary.command == "sleep infinity"
+    assert summary.created_at == datetime(
+        2024, 5, 1, 12, tzinfo=timezone(timedelta(hours=2))
+    )
+    assert summary.labels == {"dodo": "dada", "other": ""}
+    assert summary.local_volumes == 1
+    assert summary.mounts == ["1b2c", "/tmp"]
+    assert summary.names == ["my_container"]
+    assert summary.networks == ["bridge", "host"]
+    assert summary.ports == ["0.0.0.0:80->80/tcp", ":::80->80/tcp"]
+    assert summary.size == 12
+    assert summary.to_container()._get_immutable_id() == "a" * 64
+    assert "my_container" in repr(summary)
+
+
 def test_list_filters_old_signature(docker_client: DockerClient):
     """Test backwards compatibility of DockerClient.container.list()."""
     random_label_value = random_name()
@@ -746,6 +859,80 @@ def test_load_stats_json(json_file):
     assert stats.memory_used > 100
 
 
+def test_stats_stream_parses_frames_and_fills_history():
+    json_lines = [
+        json.dumps(json.loads(x.read_text())).encode() for x in get_all_jsons("stats")
+    ]
+    output = []
+    for _ in range(5):
+        # the docker CLI clears the terminal before each frame
+        output.append(("stdout", b"\x1b[2J\x1b[H" + json_lines[0] + b"\n"))
+        output.append(("stdout", json_lines[1] + b"\n"))
+    history = ContainerStatsHistory(size=3)
+    with patch(
+        "python_on_whales.components.container.cli_wrapper.stream_stdout_and_stderr",
+        return_value=iter(output),
+    ) as stream_mock, patch.object(
+        docker.client_config, "get_client_call_with_path", return_value=["docker"]
+    ):
+        all_stats = list(docker.stats(stream=True, history=history))
+
+    assert "--no-stream" not in stream_mock.call_args[0][0]
+    assert len(all_stats) == 10
+    first_id = json.loads(json_lines[0])["ID"]
+    assert all_stats[0].container_id == first_id
+    assert len(history) == 2
+    assert len(history[first_id]) == 3
+
+
+def test_stats_stream_skips_stopped_containers():
+    json_dict = json.loads(get_all_jsons("stats")[0].read_text())
+    stopped = dict(
+        json_dict,
+        BlockIO="--",
+        CPUPerc="--",
+        MemPerc="--",
+        MemUsage="-- / --",
+        NetIO="--",
+        PIDs="--",
+    )
+    output = [
+        ("stdout", json.dumps(json_dict).encode() + b"\n"),
+        ("stdout", b"\x1b[2J\x1b[H" + json.dumps(stopped).encode() + b"\n"),
+        ("stdout", b"\x1b[2J\x1b[H" + json.dumps(json_dict).encode() + b"\n"),
+    ]
+    history = ContainerStatsHistory()
+    with patch(
+        "python_on_whales.components.container.cli_wrapper.stream_stdout_and_stderr",
+        return_value=iter(output),
+    ), patch.object(
+        docker.client_config, "get_client_call_with_path", return_value=["docker"]
+    ):
+        all_stats = list(docker.stats(stream=True, history=history))
+
+    assert len(all_stats) == 2
+    assert len(history[json_dict["ID"]]) == 2
+
+
+def test_container_stats_series():
+    stats = ContainerStats(json.loads(get_all_jsons("stats")[0].read_text()))
+    series = ContainerStatsSeries(size=4)
+    for i in range(6):
+        stats.cpu_percentage = float(i)
+        series.append(stats, timestamp=100.0 + i)
+
+    assert len(series) == 4
+    assert series.values("cpu_percentage") == [2.0, 3.0, 4.0, 5.0]
+    assert series.timestamps(window=2) == [104.0, 105.0]
+    assert series.mean("cpu_percentage") == 3.5
+    assert series.mean("cpu_percentage", window=2) == 4.5
+    assert series.percentile("cpu_percentage", 50) == 3.5
+    assert series.percentile("cpu_percentage", 100) == 5.0
+    assert series.values("memory_used") == [stats.memory_used] * 4
+    with pytest.raises(ValueError):
+        ContainerStatsSeries(size=4).mean("cpu_percentage")
+
+
 @pytest.mark.parametrize(
     "ctr_client",
     ["docker", pytest.param("podman", marks=pytest.mark.xfail)],
@@ -917,6 +1104,247 @@ def test_export_file(ctr_client: DockerClient, tmp_path: Path):
     assert dest.stat().st_size > 10_000
 
 
+@pytest.mark.parametrize("ctr_client", ["docker", "podman"], indirect=True)
+def test_export_stream(ctr_client: DockerClient):
+    with ctr_client.run(
+        "busybox", ["sleep", "infinity"], detach=True, remove=True
+    ) as c:
+        chunks = list(c.export(chunk_size=64 * 1024))
+
+    assert all(len(x) == 64 * 1024 for x in chunks[:-1])
+    assert 0 < len(chunks[-1]) <= 64 * 1024
+    assert sum(len(x) for x in chunks) > 10_000
+
+
+FAKE_DOCKER_LOGS = """
+import json, sys, time
+
+LOGS = {
+    "aaa": [(0.0, "stdout", "01", "a1"), (0.05, "stderr", "03", "a3")],
+    "bbb": [(0.0, "stdout", "02", "b2"), (0.0, "stdout", "04", "b4")],
+    "ccc": [(0.0, "stdout", "05", "c5")],
+}
+if sys.argv[1:3] == ["system", "events"]:
+    print(json.dumps({"Type": "container", "Action": "start", "Actor": {"ID": "ccc"}}))
+    sys.stdout.flush()
+    time.sleep(60)
+if sys.argv[1:3] == ["container", "inspect"]:
+    for container in sys.argv[5:]:
+        if container not in LOGS:
+            sys.stderr.write(f"Error: No such container: {container}\\n")
+            sys.exit(1)
+        print(json.dumps({"Id": container}))
+    sys.exit(0)
+container = sys.argv[-1]
+if container not in LOGS:
+    sys.stderr.write(f"Error: No such container: {container}\\n")
+    sys.exit(1)
+for delay, source, second, line in LOGS[container]:
+    time.sleep(delay)
+    output = getattr(sys, source)
+    output.write(f"2024-01-01T00:00:{second}.123456789Z {line}\\n")
+    output.flush()
+if "--follow" in sys.argv:
+    time.sleep(60)
+"""
+
+
+@pytest.fixture
+def fake_logs_docker(tmp_path: Path):
+    script = tmp_path / "docker.py"
+    script.write_text(FAKE_DOCKER_LOGS)
+    return DockerClient(client_call=[sys.executable, str(script)])
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="not available on Windows")
+def test_logs_many_are_ordered_by_timestamp(fake_logs_docker: DockerClient):
+    lines = list(
+        fake_logs_docker.container.logs_many(["aaa", "bbb"], reorder_window=0.5)
+    )
+    assert [x.line for x in lines] == [b"a1\n", b"b2\n", b"a3\n", b"b4\n"]
+    assert lines[1] == ContainerLogLine(
+        "bbb",
+        "stdout",
+        datetime(2024, 1, 1, 0, 0, 2, 123456, tzinfo=timezone.utc),
+        b"b2\n",
+    )
+    assert lines[2].source == "stderr"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="not available on Windows")
+def test_logs_many_inspects_the_containers_at_once(fake_logs_docker: DockerClient):
+    with patch(
+        "python_on_whales.components.container.cli_wrapper.inspect_json",
+        wraps=inspect_json,
+    ) as inspect_mock:
+        list(fake_logs_docker.container.logs_many(["aaa", "bbb"]))
+    inspect_mock.assert_called_once_with(
+        fake_logs_docker.client_config, "container", ["aaa", "bbb"], fields=["Id"]
+    )
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="not available on Windows")
+def test_logs_many_no_such_container(fake_logs_docker: DockerClient):
+    with pytest.raises(NoSuchContainer):
+        list(fake_logs_docker.container.logs_many(["aaa", "dodo"]))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="not available on Windows")
+def test_logs_many_attach_new_containers(fake_logs_docker: DockerClient):
+    def fake_list(self, all=False, filters=()):
+        if ("id", "ccc") in filters:
+            return [SimpleNamespace(id="ccc")]
+        return [SimpleNamespace(id="bbb")]
+
+    with patch.object(ContainerCLI, "list", fake_list):
+        logs = fake_logs_docker.container.logs_many(
+            filters=[("label", "dodo")], follow=True, reorder_window=0.01
+        )
+        lines = [next(logs) for _ in range(3)]
+        logs.close()
+    assert sorted((x.container_id, x.line) for x in lines) == [
+        ("bbb", b"b2\n"),
+        ("bbb", b"b4\n"),
+        ("ccc", b"c5\n"),
+    ]
+
+
+def test_logs_no_such_container_uses_a_single_command(tmp_path: Path):
+    calls_file = tmp_path / "calls.txt"
+    script = tmp_path / "docker.py"
+    script.write_text(
+        "import sys\n"
+        f"open({str(calls_file)!r}, 'a').write(' '.join(sys.argv[1:]) + '\\n')\n"
+        "sys.stderr.write('Error: No such container: dodo\\n')\n"
+        "sys.exit(1)\n"
+    )
+    docker = DockerClient(client_call=[sys.executable, str(script)])
+    with pytest.raises(NoSuchContainer):
+        docker.container.logs("dodo")
+    with pytest.raises(NoSuchContainer):
+        list(docker.container.logs("dodo", stream=True))
+    assert calls_file.read_text().splitlines() == ["container logs dodo"] * 2
+
+
+def _fake_inspect_json(container_id: str, **state):
+    return {"Id": container_id, "Name": f"/{container_id}", "State": state}
+
+
+def _patch_inspect_json(mocker, containers: dict):
+    def fake_inspect_json(client_config, object_type, references, fields=None):
+        assert object_type == "container"
+        for reference in references:
+            if reference not in containers:
+                raise NoSuchContainer(["docker", "container", "inspect"], 1)
+        return [containers[x] for x in references]
+
+    return mocker.patch(
+        "python_on_whales.components.container.cli_wrapper.inspect_json",
+        side_effect=fake_inspect_json,
+    )
+
+
+def test_wait_until_uses_events(mocker):
+    events_queue = queue.Queue()
+    events_calls = []
+
+    def fake_events(self, since=None, until=None, filters={}):
+        events_calls.append(since)
+        yield from iter(events_queue.get, None)
+
+    mocker.patch.object(SystemCLI, "events", fake_events)
+    containers = {
+        "a": _fake_inspect_json("a", health={"status": "healthy"}),
+        "b": _fake_inspect_json("b", health={"status": "starting"}),
+        "c": _fake_inspect_json("c", health={"status": "starting"}),
+    }
+    inspect_mock = _patch_inspect_json(mocker, containers)
+    docker = DockerClient(client_call=["docker-binary-that-does-not-exist"])
+
+    def send_events():
+        for action, actor_id, attributes in [
+            ("health_status: healthy", "b", {}),
+            ("health_status", "c", {"health_status": "unhealthy"}),
+            ("die", "c", {}),
+            ("start", "c", {}),
+            ("health_status", "c", {"health_status": "healthy"}),
+        ]:
+            if action == "die":
+                containers[actor_id] = _fake_inspect_json(
+                    actor_id, status="restarting", restarting=True
+                )
+            events_queue.put(
+                DockerEvent(
+                    Type="container",
+                    Action=action,
+                    Actor={"ID": actor_id, "Attributes": attributes},
+                )
+            )
+
+    threading.Timer(0.1, send_events).start()
+    docker.container.wait_until(["a", "b", "c"], "healthy", timeout=10)
+    # a single inspect for all the containers, then the container which died
+    # is inspected to know if it's restarting
+    assert [x.args[2] for x in inspect_mock.call_args_list] == [["a", "b", "c"], ["c"]]
+    assert len(events_calls) == 1
+
+
+def test_wait_until_timeout(mocker):
+    mocker.patch.object(
+        SystemCLI, "events", lambda self, since=None: iter(queue.Queue().get, None)
+    )
+    containers = {
+        "a": _fake_inspect_json("a", running=True),
+        "b": _fake_inspect_json("b", status="created", running=False),
+        "c": _fake_inspect_json("c", status="exited", running=False),
+    }
+    _patch_inspect_json(mocker, containers)
+    docker = DockerClient(client_call=["docker-binary-that-does-not-exist"])
+    docker.container.wait_until(["a"], "running", timeout=1)
+    with pytest.raises(TimeoutError) as err:
+        docker.container.wait_until(["a", "b"], "running", timeout=0.2)
+    assert "['b']" in str(err.value)
+    with pytest.raises(ValueError):
+        docker.container.wait_until(["a"], "healthy", timeout=0.2)
+    # an exited container won't be running, no need to wait for the timeout
+    with pytest.raises(RuntimeError):
+        docker.container.wait_until(["a", "c"], "running")
+    with pytest.raises(NoSuchContainer):
+        docker.container.wait_until(["a", "dodo"], "running")
+
+
+@pytest.mark.parametrize(
+    "action,container_state",
+    [
+        ("die", {"status": "exited", "running": False}),
+        # the container was started with `--rm`, it's gone when inspected
+        ("die", None),
+        ("destroy", {"status": "removing", "running": False}),
+    ],
+)
+def test_wait_until_stops_when_a_container_stops(mocker, action, container_state):
+    events_queue = queue.Queue()
+    mocker.patch.object(
+        SystemCLI, "events", lambda self, since=None: iter(events_queue.get, None)
+    )
+    containers = {"a": _fake_inspect_json("a", status="created")}
+    _patch_inspect_json(mocker, containers)
+    docker = DockerClient(client_call=["docker-binary-that-does-not-exist"])
+
+    def stop_container():
+        if container_state is None:
+            del containers["a"]
+        else:
+            containers["a"] = _fake_inspect_json("a", **container_state)
+        events_queue.put(
+            DockerEvent(Type="container", Action=action, Actor={"ID": "a"})
+        )
+
+    threading.Timer(0.1, stop_container).start()
+    with pytest.raises(RuntimeError):
+        docker.container.wait_until(["a"], "running")
+
+
 @pytest.mark.parametrize("ctr_client", ["docker", "podman"], indirect=True)
 def test_exec_privilged_flag(ctr_client: DockerClient, mocker):
     fake_completed_process = mocker.MagicMock()
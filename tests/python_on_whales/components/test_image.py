@@ -1,5 +1,6 @@
 import contextlib
 import json
+import sys
 from pathlib import Path
 from typing import Generator
 from unittest.mock import ANY, MagicMock, Mock, patch
@@ -7,6 +8,8 @@ from unittest.mock import ANY, MagicMock, Mock, patch
 import pytest
 
 from python_on_whales import DockerClient, docker
+from python_on_whales.client_config import ClientConfig
+from python_on_whales.components.image.cli_wrapper import ImageSummary
 from python_on_whales.components.image.models import ImageInspectResult
 from python_on_whales.exceptions import DockerException, NoSuchImage
 from python_on_whales.test_utils import get_all_jsons, random_name
@@ -49,6 +52,26 @@ def test_save_load(ctr_client: DockerClient, tmp_path: Path):
     assert ctr_client.image.exists(image_name)
 
 
+@pytest.mark.parametrize("ctr_client", ["docker", "podman"], indirect=True)
+def test_transfer(ctr_client: DockerClient):
+    image_names = ["busybox:1", "hello-world:latest"]
+    for image_name in image_names:
+        ctr_client.image.pull(image_name, quiet=True)
+    progress = []
+    loaded = ctr_client.image.transfer(
+        image_names, to=ctr_client, progress=progress.append, parallel=2
+    )
+    assert len(loaded) == 2
+    assert progress == sorted(progress)
+    assert progress[-1] > 10_000
+
+
+@pytest.mark.parametrize("ctr_client", ["docker", "podman"], indirect=True)
+def test_transfer_no_such_image(ctr_client: DockerClient):
+    with pytest.raises(NoSuchImage):
+        ctr_client.image.transfer("dodo-does-not-exist:42", to=ctr_client)
+
+
 @pytest.mark.parametrize("ctr_client", ["docker", "podman"], indirect=True)
 def test_save_iterator_bytes(ctr_client: DockerClient):
     ctr_client.image.pull("busybox:1", quiet=True)
@@ -124,6 +147,38 @@ def test_list_filters(ctr_client: DockerClient):
     assert tags == {"hello-world:latest"}
 
 
+def test_list_summary(docker_client: DockerClient):
+    docker_client.pull("hello-world")
+    summaries = docker_client.image.list("hello-world", details="summary")
+    assert [(x.repository, x.tag) for x in summaries] == [("hello-world", "latest")]
+    assert summaries[0].size > 0
+    assert summaries[0].to_image() == docker_client.image.inspect("hello-world")
+
+
+def test_image_summary_parsing():
+    line = {
+        "Containers": "N/A",
+        "CreatedAt": "2023-05-02 18:29:28 +0000 UTC",
+        "CreatedSince": "12 months ago",
+        "Digest": "<none>",
+        "ID": "sha256:" + "b" * 64,
+        "Repository": "busybox",
+        "SharedSize": "N/A",
+        "Size": "4.26MB",
+        "Tag": "<none>",
+        "UniqueSize": "N/A",
+        "VirtualSize": "4.261MB",
+    }
+    summary = ImageSummary(docker.client_config, line)
+    assert summary.repository == "busybox"
+    assert summary.tag is None
+    assert summary.digest is None
+    assert summary.containers is None
+    assert summary.size == 4_260_000
+    assert summary.created_at.year == 2023
+    assert summary.to_image()._get_immutable_id() == "sha256:" + "b" * 64
+
+
 def test_list_filters_old_signature(docker_client: DockerClient):
     """Check backward compatibility of the DockerClient.image.list() API."""
     docker_client.pull(["hello-world", "busybox"])
@@ -460,6 +515,30 @@ def test_no_such_image_save_generator(ctr_client: DockerClient):
     assert f"No such image: {image_name_that_does_not_exists}" in str(err.value)
 
 
+def test_no_such_image_save_classic_image_store(mocker):
+    # `docker save` doesn't give the name of the missing image, `docker
+    # image inspect` does.
+    fake_docker = [
+        sys.executable,
+        "-c",
+        "import sys\n"
+        "if 'inspect' in sys.argv:\n"
+        "    sys.exit('Error: No such image: ' + sys.argv[-1])\n"
+        "sys.exit('Error response from daemon: reference does not exist')",
+    ]
+    mocker.patch.object(
+        ClientConfig, "get_client_call_with_path", return_value=fake_docker
+    )
+    with pytest.raises(NoSuchImage) as err:
+        docker.image.save("dueizhguizhfezaezagrthyh", output="/tmp/dada")
+    assert "No such image: dueizhguizhfezaezagrthyh" in str(err.value)
+
+    with pytest.raises(NoSuchImage) as err:
+        for _ in docker.image.save("dueizhguizhfezaezagrthyh"):
+            pass
+    assert "No such image: dueizhguizhfezaezagrthyh" in str(err.value)
+
+
 @pytest.mark.parametrize(
     "ctr_client",
     ["docker", pytest.param("podman", marks=pytest.mark.xfail)],
@@ -482,7 +561,7 @@ def test_exists(ctr_client: DockerClient):
     assert not ctr_client.image.exists("dudurghurozgiozpfezjigfoeioengizeonig")
 
 
-@patch("python_on_whales.components.image.cli_wrapper.ContainerCLI")
+@patch("python_on_whales.components.container.cli_wrapper.ContainerCLI")
 def test_copy_from_default_pull(container_mock: Mock):
     container_cli_mock = MagicMock()
     container_mock.return_value = container_cli_mock
@@ -496,7 +575,7 @@ def test_copy_from_default_pull(container_mock: Mock):
     container_cli_mock.create.assert_called_with(test_image_name, pull="missing")
 
 
-@patch("python_on_whales.components.image.cli_wrapper.ContainerCLI")
+@patch("python_on_whales.components.container.cli_wrapper.ContainerCLI")
 def test_copy_from_pull(container_mock: Mock):
     container_cli_mock = MagicMock()
     container_mock.return_value = container_cli_mock
@@ -514,7 +593,7 @@ def test_copy_from_pull(container_mock: Mock):
     container_cli_mock.create.assert_called_with(test_image_name, pull=test_pull_flag)
 
 
-@patch("python_on_whales.components.image.cli_wrapper.ContainerCLI")
+@patch("python_on_whales.components.container.cli_wrapper.ContainerCLI")
 def test_copy_to_default_pull(container_mock: Mock):
     container_cli_mock = MagicMock()
     container_mock.return_value = container_cli_mock
@@ -528,7 +607,7 @@ def test_copy_to_default_pull(container_mock: Mock):
     container_cli_mock.create.assert_called_with(test_image_name, pull="missing")
 
 
-@patch("python_on_whales.components.image.cli_wrapper.ContainerCLI")
+@patch("python_on_whales.components.container.cli_wrapper.ContainerCLI")
 def test_copy_to_pull(container_mock: Mock):
     container_cli_mock = MagicMock()
     container_mock.return_value = container_cli_mock
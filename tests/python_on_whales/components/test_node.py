@@ -11,6 +11,7 @@ from python_on_whales.test_utils import get_all_jsons
 def test_load_json(json_file):
     json_as_txt = json_file.read_text()
     a: NodeInspectResult = NodeInspectResult(**json.loads(json_as_txt))
+    a.model_dump()
     if json_file.name == "1.json":
         assert (
             a.description.resources.generic_resources[0].named_resource_spec.kind
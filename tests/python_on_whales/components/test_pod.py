@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 
 from python_on_whales import DockerClient
+from python_on_whales.components.pod.cli_wrapper import PodStats
 from python_on_whales.components.pod.models import PodInspectResult
 from python_on_whales.exceptions import NoSuchPod
 from python_on_whales.test_utils import get_all_jsons, random_name
@@ -18,6 +19,14 @@ def test_load_json(json_file: Path):
     # we could do more checks here if needed
 
 
+@pytest.mark.parametrize("json_file", get_all_jsons("pod_stats"))
+def test_load_stats_json(json_file: Path):
+    stats = PodStats(json.loads(json_file.read_text()))
+    assert stats.memory_used > 100
+    assert stats.memory_limit > stats.memory_used
+    assert stats.pids > 0
+
+
 def test_create_simple(podman_client: DockerClient):
     pod_name = random_name()
     with podman_client.pod.create(pod_name) as pod:
@@ -45,6 +54,15 @@ def test_start_simple(podman_client: DockerClient):
     assert not pod.exists()
 
 
+def test_stats(podman_client: DockerClient):
+    pod_name = random_name()
+    with podman_client.pod.create(pod_name) as pod:
+        pod.start()
+        all_stats = podman_client.pod.stats(pod)
+        assert len(all_stats) >= 1
+        assert all(x.pod_id in pod.id for x in all_stats)
+
+
 def test_stop_simple(podman_client: DockerClient):
     pod_name = random_name()
     with podman_client.pod.create(pod_name) as pod:
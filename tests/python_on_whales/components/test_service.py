@@ -1,10 +1,12 @@
 import json
+import sys
 import tempfile
 import time
 
 import pytest
 
-from python_on_whales import DockerClient
+from python_on_whales import DockerClient, docker
+from python_on_whales.client_config import ClientConfig
 from python_on_whales.components.service.models import ServiceInspectResult
 from python_on_whales.exceptions import NoSuchService, NotASwarmManager
 from python_on_whales.test_utils import get_all_jsons, random_name
@@ -13,7 +15,7 @@ from python_on_whales.test_utils import get_all_jsons, random_name
 @pytest.mark.parametrize("json_file", get_all_jsons("services"))
 def test_load_json(json_file):
     json_as_txt = json_file.read_text()
-    ServiceInspectResult(**json.loads(json_as_txt))
+    ServiceInspectResult(**json.loads(json_as_txt)).model_dump()
     # we could do more checks here if needed
 
 
@@ -183,6 +185,25 @@ def test_some_functions_no_such_service(docker_client: DockerClient, method: str
         getattr(docker_client.service, method)("DOODODGOIHURHURI")
 
 
+def test_logs_no_such_service(mocker):
+    fake_docker = [
+        sys.executable,
+        "-c",
+        "import sys; sys.exit('Error response from daemon: "
+        "no such task or service: DOODODGOIHURHURI')",
+    ]
+    mocker.patch.object(
+        ClientConfig, "get_client_call_with_path", return_value=fake_docker
+    )
+    with pytest.raises(NoSuchService):
+        docker.service.logs("DOODODGOIHURHURI")
+    with pytest.raises(NoSuchService):
+        for _ in docker.service.logs("DOODODGOIHURHURI", stream=True):
+            pass
+    with pytest.raises(NoSuchService):
+        list(docker.service.log_records("DOODODGOIHURHURI"))
+
+
 @pytest.mark.usefixtures("swarm_mode")
 def test_scale_no_such_service(docker_client: DockerClient):
     with pytest.raises(NoSuchService):
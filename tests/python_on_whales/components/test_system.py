@@ -1,12 +1,16 @@
 import json
+import queue
+import sys
 import time
-from datetime import date, datetime
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from time import sleep
 
 import pytest
 
 from python_on_whales import DockerClient
+from python_on_whales.client_config import ClientConfig
+from python_on_whales.components.system.cli_wrapper import SystemCLI
 from python_on_whales.components.system.models import DockerEvent, SystemInfo
 from python_on_whales.exceptions import DockerException
 from python_on_whales.test_utils import get_all_jsons, random_name
@@ -193,3 +197,110 @@ def test_prune_raises_exception_on_invalid_arguments(docker_client: DockerClient
     """
     with pytest.raises(DockerException):
         docker_client.system.prune(volumes=True, filters={"until": "1000000h"})
+
+
+class FakeEventsCommand:
+    def __init__(self):
+        self.events_queue = queue.Queue()
+        self.calls = []
+
+    def __call__(self, since=None, until=None, filters={}):
+        self.calls.append(since)
+        yield from iter(self.events_queue.get, None)
+
+    def send(self, event_type, action, actor_id, time_nano, attributes={}):
+        self.events_queue.put(
+            DockerEvent(
+                Type=event_type,
+                Action=action,
+                Actor={"ID": actor_id, "Attributes": attributes},
+                timeNano=time_nano,
+            )
+        )
+
+
+@pytest.fixture
+def fake_events(mocker) -> FakeEventsCommand:
+    fake_events = FakeEventsCommand()
+    mocker.patch.object(SystemCLI, "events", fake_events)
+    return fake_events
+
+
+def test_event_bus_single_command_for_all_subscribers(fake_events):
+    docker = DockerClient(client_call=["docker-binary-that-does-not-exist"])
+    event_bus = docker.system.event_bus
+    assert event_bus is docker.system.event_bus
+    all_events = event_bus.subscribe()
+    subscription_time = datetime.now()
+    dies = event_bus.subscribe(type="container", action="die")
+    labeled = event_bus.subscribe(labels={"com.example.app": "dodo"})
+
+    fake_events.send("container", "start", "a", 1)
+    fake_events.send("container", "die", "a", 2, {"com.example.app": "dodo"})
+    fake_events.send("network", "die", "b", 3)
+
+    assert [all_events.get(timeout=5).time_nano for _ in range(3)] == [1, 2, 3]
+    assert dies.get(timeout=5).time_nano == 2
+    assert labeled.get(timeout=5).time_nano == 2
+    assert dies.get(timeout=0.1) is None
+    assert labeled.get(timeout=0.1) is None
+    assert len(fake_events.calls) == 1
+    # the events are requested since a bit before the subscription
+    assert fake_events.calls[0] <= subscription_time - timedelta(seconds=1)
+
+    for subscription in (all_events, dies, labeled):
+        subscription.close()
+    assert all_events.get() is None
+    assert list(dies) == []
+
+
+def test_event_bus_drops_events_when_full(fake_events):
+    docker = DockerClient(client_call=["docker-binary-that-does-not-exist"])
+    with docker.system.event_bus.subscribe(maxsize=2) as subscription:
+        for i in range(5):
+            fake_events.send("container", "start", "a", i + 1)
+        with docker.system.event_bus.subscribe(action="stop") as stops:
+            fake_events.send("container", "stop", "a", 6)
+            assert stops.get(timeout=5).time_nano == 6
+        assert subscription.dropped == 4
+        assert [x.time_nano for x in [subscription.get(), subscription.get()]] == [1, 2]
+
+
+def test_event_bus_reconnects_since_the_last_event(fake_events):
+    docker = DockerClient(client_call=["docker-binary-that-does-not-exist"])
+    event_bus = docker.system.event_bus
+    event_bus.reconnect_delay = 0
+    with event_bus.subscribe() as subscription:
+        fake_events.send("container", "start", "a", 1_700_000_000_123_456_789)
+        assert subscription.get(timeout=5) is not None
+        connection_id = event_bus.connection_id
+        fake_events.events_queue.put(None)
+        # the same event is replayed by the daemon, then a new one
+        fake_events.send("container", "start", "a", 1_700_000_000_123_456_789)
+        fake_events.send("container", "die", "a", 1_700_000_001_000_000_000)
+        assert subscription.get(timeout=5).action == "die"
+
+    assert event_bus.connection_id == connection_id + 1
+    assert fake_events.calls[1] == datetime(
+        2023, 11, 14, 22, 13, 20, 123456, tzinfo=timezone.utc
+    )
+
+
+def test_event_bus_kills_the_command_when_the_last_subscription_is_closed(mocker):
+    # an events command which never prints anything
+    fake_docker = [sys.executable, "-c", "import time; time.sleep(60)"]
+    mocker.patch.object(
+        ClientConfig, "get_client_call_with_path", return_value=fake_docker
+    )
+    event_bus = DockerClient().system.event_bus
+    subscription = event_bus.subscribe()
+    thread = event_bus._thread
+    while event_bus._events is None or event_bus._events._process is None:
+        time.sleep(0.001)
+    process = event_bus._events._process
+
+    subscription.close()
+    assert not event_bus.connected
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert process.poll() is not None
@@ -0,0 +1,70 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from python_on_whales import AsyncDockerClient, DockerClient
+from python_on_whales.test_utils import get_all_jsons
+
+
+def test_methods_not_implemented_natively_run_in_executor():
+    async_docker = AsyncDockerClient(client_call=["docker-binary-that-does-not-exist"])
+    with patch.object(
+        async_docker.container._sync_cli, "diff", return_value={"/tmp": "A"}
+    ) as diff_mock:
+        assert asyncio.run(async_docker.container.diff("dodo")) == {"/tmp": "A"}
+    diff_mock.assert_called_once_with("dodo")
+
+
+def test_inspect_uses_a_single_command():
+    json_objects = [json.loads(x.read_text()) for x in get_all_jsons("containers")[:3]]
+    async_docker = AsyncDockerClient(client_call=["docker-binary-that-does-not-exist"])
+
+    async def fake_run_async(full_cmd, *args, **kwargs):
+        return json.dumps(json_objects)
+
+    with patch(
+        "python_on_whales.async_docker_client.run_async", fake_run_async
+    ), patch.object(async_docker.client_config, "get_client_call_with_path") as mock:
+        mock.return_value = ["docker"]
+        containers = asyncio.run(async_docker.container.inspect(["a", "b", "c"]))
+    assert [c.id for c in containers] == [x["Id"] for x in json_objects]
+    assert containers[0]._inspect_result is not None
+
+
+@pytest.mark.parametrize("ctr_client", ["docker", "podman"], indirect=True)
+def test_run_and_logs(ctr_client: DockerClient):
+    async_docker = AsyncDockerClient(client_config=ctr_client.client_config)
+
+    async def run_and_read_logs():
+        container = await async_docker.container.run(
+            "busybox", ["sh", "-c", "echo dodo && echo dada >&2"], detach=True
+        )
+        await async_docker.container.wait(container)
+        output = await async_docker.container.logs(container, stream=True)
+        lines = [x async for x in output]
+        await async_docker.container.remove(container)
+        return lines
+
+    lines = asyncio.run(run_and_read_logs())
+    assert ("stdout", b"dodo\n") in lines
+    assert ("stderr", b"dada\n") in lines
+
+
+@pytest.mark.parametrize("ctr_client", ["docker", "podman"], indirect=True)
+def test_execute_stream(ctr_client: DockerClient):
+    async_docker = AsyncDockerClient(client_config=ctr_client.client_config)
+
+    async def execute():
+        container = await async_docker.container.run(
+            "busybox", ["sleep", "infinity"], detach=True, remove=True
+        )
+        output = await async_docker.container.execute(
+            container, ["echo", "hello"], stream=True
+        )
+        lines = [x async for x in output]
+        await async_docker.container.kill(container)
+        return lines
+
+    assert asyncio.run(execute()) == [("stdout", b"hello\n")]
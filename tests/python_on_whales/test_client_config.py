@@ -1,4 +1,7 @@
 import json
+import queue
+import threading
+import time
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Iterator, Sequence, Tuple
@@ -6,7 +9,15 @@ from typing import Iterator, Sequence, Tuple
 import pytest
 
 from python_on_whales import DockerClient, docker
-from python_on_whales.client_config import ClientConfig, ParsingError
+from python_on_whales.client_config import ClientConfig, ParsingError, bulk_reload
+from python_on_whales.components.container.cli_wrapper import Container
+from python_on_whales.components.image.cli_wrapper import Image
+from python_on_whales.components.network.cli_wrapper import Network
+from python_on_whales.components.network.models import NetworkInspectResult
+from python_on_whales.components.system.cli_wrapper import SystemCLI
+from python_on_whales.components.system.models import DockerEvent
+from python_on_whales.exceptions import DockerException, NoSuchContainer
+from python_on_whales.test_utils import get_all_jsons
 from python_on_whales.utils import PROJECT_ROOT
 
 fake_json_message = {
@@ -41,6 +52,426 @@ def test_pretty_exception_message_and_report(mocker):
     assert Path(word).read_text() == json.dumps(fake_json_message, indent=2)
 
 
+def test_inspect_results_are_validated_from_the_json_bytes(mocker):
+    json_objects = [json.loads(x.read_text()) for x in get_all_jsons("networks")]
+    json_objects = list({x["Id"]: x for x in json_objects}.values())
+    # indented like the output of the CLI
+    json_array = (json.dumps(json_objects, indent=4) + "\n").encode()
+    mocker.patch.object(
+        ClientConfig, "get_client_call_with_path", return_value=["docker"]
+    )
+    run_mock = mocker.patch(
+        "python_on_whales.components.network.cli_wrapper.run",
+        return_value=json_array,
+    )
+    from_dict = mocker.spy(NetworkInspectResult, "__init__")
+
+    networks = [
+        Network(docker.client_config, x["Id"], is_immutable_id=True)
+        for x in json_objects
+    ]
+    bulk_reload(networks)
+    assert run_mock.call_args.kwargs["decode"] is False
+    assert from_dict.call_count == 0
+    for network, json_object in zip(networks, json_objects):
+        assert network._inspect_result == NetworkInspectResult(**json_object)
+
+
+def test_exception_report_of_json_text(mocker):
+    json_text = json.dumps([fake_json_message], indent=4).encode()
+    mocker.patch.object(
+        ClientConfig, "get_client_call_with_path", return_value=["docker"]
+    )
+    mocker.patch(
+        "python_on_whales.components.volume.cli_wrapper.run", return_value=json_text
+    )
+    with pytest.raises(ParsingError) as err:
+        docker.volume.inspect("random_volume")
+    json_file = next(x for x in str(err.value).split() if ".json" in x)
+    assert json.loads(Path(json_file).read_text()) == fake_json_message
+
+
+def _fake_container_cli(mocker, json_objects, inspect_error=None):
+    ids = "\n".join(x["Id"] for x in json_objects) + "\n"
+
+    def fake_run(full_cmd, *args, **kwargs):
+        if "list" in full_cmd:
+            return ids
+        if inspect_error is not None:
+            raise inspect_error
+        return json.dumps(json_objects)
+
+    mocker.patch.object(
+        ClientConfig, "get_client_call_with_path", return_value=["docker"]
+    )
+    return mocker.patch(
+        "python_on_whales.components.container.cli_wrapper.run",
+        side_effect=fake_run,
+    )
+
+
+def test_list_prefetch_inspects_all_containers_with_a_single_command(mocker):
+    json_objects = [json.loads(x.read_text()) for x in get_all_jsons("containers")]
+    run_mock = _fake_container_cli(mocker, json_objects)
+
+    containers = docker.container.list(prefetch=True)
+    assert run_mock.call_count == 2
+    inspect_cmd = run_mock.call_args_list[1][0][0]
+    assert inspect_cmd[-len(json_objects) :] == [x["Id"] for x in json_objects]
+
+    # the inspect results are pinned, reading attributes doesn't run anything.
+    for container, json_object in zip(containers, json_objects):
+        assert container.name == json_object["Name"].lstrip("/")
+        assert container.state.status == json_object["State"]["Status"]
+    assert run_mock.call_count == 2
+
+
+def test_list_prefetch_skips_containers_removed_in_the_meantime(mocker):
+    json_objects = [json.loads(x.read_text()) for x in get_all_jsons("containers")]
+    json_objects = list({x["Id"]: x for x in json_objects}.values())
+    still_there = json_objects[::2]
+    error = NoSuchContainer(
+        ["docker", "container", "inspect"],
+        1,
+        stdout=json.dumps(still_there).encode(),
+        stderr=b"Error: No such container: dodo",
+    )
+    run_mock = _fake_container_cli(mocker, json_objects, inspect_error=error)
+
+    containers = docker.container.list(prefetch=True)
+    assert run_mock.call_count == 2
+    for container in containers[::2]:
+        assert container._inspect_result is not None
+    for container in containers[1::2]:
+        assert container._inspect_result is None
+
+
+def test_list_prefetch_raises_other_errors(mocker):
+    json_objects = [json.loads(x.read_text()) for x in get_all_jsons("containers")]
+    error = DockerException(
+        ["docker", "container", "inspect"],
+        1,
+        stderr=b"permission denied while trying to connect to the Docker daemon",
+    )
+    _fake_container_cli(mocker, json_objects, inspect_error=error)
+    with pytest.raises(DockerException) as err:
+        docker.container.list(prefetch=True)
+    assert err.value is error
+
+
+def test_cache_validity_period_per_object_type(mocker):
+    container_json = json.loads(get_all_jsons("containers")[0].read_text())
+    image_json = json.loads(get_all_jsons("images")[0].read_text())
+    container_mock = mocker.patch.object(
+        Container, "_fetch_inspect_result_json", return_value=container_json
+    )
+    image_mock = mocker.patch.object(
+        Image, "_fetch_inspect_result_json", return_value=image_json
+    )
+    monotonic_mock = mocker.patch("time.monotonic", return_value=1000.0)
+    docker = DockerClient(
+        cache_validity_period=5, cache_validity_periods={"Image": float("inf")}
+    )
+    container = docker.container.inspect("dodo")
+    image = docker.image.inspect("dodo")
+
+    monotonic_mock.return_value = 1004.0
+    container.state
+    image.id
+    assert container_mock.call_count == 1
+    assert image_mock.call_count == 1
+
+    monotonic_mock.return_value = 100000.0
+    container.state
+    image.id
+    assert container_mock.call_count == 2
+    assert image_mock.call_count == 1
+
+
+def test_frozen_snapshot_inspects_each_object_once(mocker):
+    container_json = json.loads(get_all_jsons("containers")[0].read_text())
+    container_mock = mocker.patch.object(
+        Container, "_fetch_inspect_result_json", return_value=container_json
+    )
+    docker = DockerClient(cache_validity_period=0)
+    container = Container(docker.client_config, "dodo", is_immutable_id=True)
+    with docker.frozen_snapshot():
+        with docker.frozen_snapshot():
+            container.state
+        container.name
+        container.config
+    assert container_mock.call_count == 1
+
+    container.state
+    assert container_mock.call_count == 2
+
+
+def test_frozen_snapshot_is_per_thread(mocker):
+    container_json = json.loads(get_all_jsons("containers")[0].read_text())
+    container_mock = mocker.patch.object(
+        Container, "_fetch_inspect_result_json", return_value=container_json
+    )
+    docker = DockerClient(cache_validity_period=0)
+    container = Container(docker.client_config, "dodo", is_immutable_id=True)
+    in_snapshot = threading.Event()
+    snapshot_done = threading.Event()
+
+    def read_in_snapshot():
+        with docker.frozen_snapshot():
+            container.state
+            in_snapshot.set()
+            snapshot_done.wait(timeout=5)
+
+    thread = threading.Thread(target=read_in_snapshot)
+    thread.start()
+    in_snapshot.wait(timeout=5)
+    # this thread isn't in the snapshot, the inspect result expired
+    container.state
+    container.state
+    snapshot_done.set()
+    thread.join()
+    assert container_mock.call_count == 3
+
+
+def test_event_driven_cache_is_invalidated_by_events(mocker):
+    container_json = json.loads(get_all_jsons("containers")[0].read_text())
+    container_id = container_json["Id"]
+    fetch_mock = mocker.patch.object(
+        Container, "_fetch_inspect_result_json", return_value=container_json
+    )
+    events_queue = queue.Queue()
+
+    def fake_events(self, since=None, until=None, filters={}):
+        yield from iter(events_queue.get, None)
+
+    mocker.patch.object(SystemCLI, "events", fake_events)
+
+    def send_event(event_type, actor_id, attributes={}):
+        sequence = inspect_cache.sequence
+        events_queue.put(
+            DockerEvent(
+                Type=event_type,
+                Action="dodo",
+                Actor={"ID": actor_id, "Attributes": attributes},
+            )
+        )
+        while inspect_cache.sequence == sequence:
+            time.sleep(0.001)
+
+    docker = DockerClient(event_driven_cache=True, cache_validity_period=0)
+    inspect_cache = docker.client_config.get_inspect_cache()
+    container = Container(docker.client_config, container_id, is_immutable_id=True)
+    for _ in range(10):
+        container.state
+    assert fetch_mock.call_count == 1
+
+    send_event("container", "some-other-container")
+    container.state
+    assert fetch_mock.call_count == 1
+
+    send_event("container", container_id)
+    container.state
+    container.state
+    assert fetch_mock.call_count == 2
+
+    send_event("network", "some-network", {"container": container_id})
+    container.state
+    assert fetch_mock.call_count == 3
+
+    # after a reconnection, the results fetched before are stale
+    event_bus = docker.client_config.get_event_bus()
+    connection_id = event_bus.connection_id
+    event_bus.reconnect_delay = 0
+    events_queue.put(None)
+    while event_bus.connection_id == connection_id:
+        time.sleep(0.001)
+    container.state
+    assert fetch_mock.call_count == 4
+
+
+def test_event_driven_cache_invalidates_pinned_inspect_results(mocker):
+    container_json = json.loads(get_all_jsons("containers")[0].read_text())
+    container_id = container_json["Id"]
+    fetch_mock = mocker.patch.object(
+        Container, "_fetch_inspect_result_json", return_value=container_json
+    )
+    events_queue = queue.Queue()
+
+    def fake_events(self, since=None, until=None, filters={}):
+        yield from iter(events_queue.get, None)
+
+    mocker.patch.object(SystemCLI, "events", fake_events)
+
+    docker = DockerClient(event_driven_cache=True, cache_validity_period=0)
+    inspect_cache = docker.client_config.get_inspect_cache()
+    container = Container(docker.client_config, container_id, is_immutable_id=True)
+    container._set_inspect_result(
+        container._parse_json_object_or_report(container_json)
+    )
+    container._pinned_inspect_result = True
+    container.state
+    assert fetch_mock.call_count == 0
+
+    sequence = inspect_cache.sequence
+    events_queue.put(
+        DockerEvent(Type="container", Action="dodo", Actor={"ID": container_id})
+    )
+    while inspect_cache.sequence == sequence:
+        time.sleep(0.001)
+    container.state
+    container.state
+    assert fetch_mock.call_count == 1
+    events_queue.put(None)
+
+
+def _reload_concurrently(docker_objects):
+    barrier = threading.Barrier(len(docker_objects))
+    errors = []
+
+    def reload(docker_object):
+        barrier.wait()
+        try:
+            docker_object.reload()
+        except Exception as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=reload, args=(x,)) for x in docker_objects]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def test_inspect_broker_coalesces_concurrent_inspects(mocker):
+    json_objects = [json.loads(x.read_text()) for x in get_all_jsons("containers")]
+    json_objects = list({x["Id"]: x for x in json_objects}.values())[:5]
+    json_objects_by_id = {x["Id"]: x for x in json_objects}
+
+    def fetch_one(reference):
+        time.sleep(0.1)
+        return json_objects_by_id[reference]
+
+    single_mock = mocker.patch.object(
+        Container, "_fetch_inspect_result_json", side_effect=fetch_one
+    )
+    bulk_mock = mocker.patch.object(
+        Container,
+        "_fetch_inspect_results_json",
+        side_effect=lambda ids: [json_objects_by_id[x] for x in ids],
+    )
+    docker = DockerClient(inspect_batch_window=0.2)
+    containers = [
+        Container(docker.client_config, x["Id"], is_immutable_id=True)
+        for x in json_objects
+    ]
+    # each container is reloaded by 4 threads at the same time.
+    assert _reload_concurrently(containers * 4) == []
+
+    # the first inspect is sent at once, the others are gathered meanwhile.
+    single_mock.assert_called_once()
+    bulk_mock.assert_called_once()
+    assert sorted(single_mock.call_args[0] + tuple(bulk_mock.call_args[0][0])) == (
+        sorted(json_objects_by_id)
+    )
+    for container, json_object in zip(containers, json_objects):
+        assert container._inspect_result.id == json_object["Id"]
+
+
+def test_inspect_broker_sends_a_lone_inspect_at_once(mocker):
+    json_object = json.loads(get_all_jsons("containers")[0].read_text())
+    mocker.patch.object(
+        Container, "_fetch_inspect_result_json", return_value=json_object
+    )
+    docker = DockerClient(inspect_batch_window=10)
+    container = Container(docker.client_config, json_object["Id"], is_immutable_id=True)
+    start = time.monotonic()
+    container.reload()
+    assert time.monotonic() - start < 5
+
+
+def test_inspect_broker_raises_for_missing_objects(mocker):
+    json_objects = [json.loads(x.read_text()) for x in get_all_jsons("containers")]
+    json_object = json_objects[0]
+
+    def fake_fetch(reference):
+        if reference == json_object["Id"]:
+            return json_object
+        raise NoSuchContainer(["docker"], 1, stderr=b"Error: No such container: dodo")
+
+    mocker.patch.object(Container, "_fetch_inspect_result_json", side_effect=fake_fetch)
+    mocker.patch.object(
+        Container,
+        "_fetch_inspect_results_json",
+        side_effect=NoSuchContainer(
+            ["docker"],
+            1,
+            stdout=json.dumps([json_object]).encode(),
+            stderr=b"Error: No such container: dodo",
+        ),
+    )
+    docker = DockerClient(inspect_batch_window=0.2)
+    present = Container(docker.client_config, json_object["Id"], is_immutable_id=True)
+    missing = Container(docker.client_config, "dodo", is_immutable_id=True)
+    errors = _reload_concurrently([present, missing])
+    assert len(errors) == 1
+    assert isinstance(errors[0], NoSuchContainer)
+    assert present._inspect_result.id == json_object["Id"]
+
+
+class Interrupted(BaseException):
+    pass
+
+
+def test_inspect_broker_survives_an_interrupted_leader(mocker):
+    json_object = json.loads(get_all_jsons("containers")[0].read_text())
+    fetch_started = threading.Event()
+    calls = []
+
+    def fake_fetch(reference):
+        calls.append(reference)
+        if len(calls) == 1:
+            fetch_started.set()
+            # the follower joins the inspect in the meantime
+            time.sleep(0.2)
+            raise Interrupted
+        return json_object
+
+    mocker.patch.object(Container, "_fetch_inspect_result_json", side_effect=fake_fetch)
+    docker = DockerClient(inspect_batch_window=0.2)
+    container = Container(docker.client_config, json_object["Id"], is_immutable_id=True)
+    errors = []
+
+    def follow():
+        fetch_started.wait(timeout=5)
+        try:
+            container.reload()
+        except Exception as err:
+            errors.append(err)
+
+    follower = threading.Thread(target=follow)
+    follower.start()
+    with pytest.raises(Interrupted):
+        container.reload()
+    follower.join(timeout=5)
+    assert not follower.is_alive()
+    assert len(errors) == 1 and isinstance(errors[0], RuntimeError)
+
+    # the next inspects don't join the interrupted batch
+    container.reload()
+    assert container._inspect_result.id == json_object["Id"]
+
+    # interrupted while waiting for the batch to fill
+    broker = docker.client_config.get_inspect_broker()
+    broker._fetching[Container] = 1
+    mocker.patch("time.sleep", side_effect=Interrupted)
+    with pytest.raises(Interrupted):
+        container.reload()
+    broker._fetching[Container] = 0
+    mocker.stopall()
+    assert broker._open_batches == {} and broker._in_flight == {}
+
+
 def test_compose_env_file():
     """Test that the deprecated `compose_env_file` gives a warning, and adds the `--env-file` argument to the compose command"""
     with pytest.warns(UserWarning):
@@ -91,6 +522,43 @@ def test_compose_env_files_and_env_file():
         assert client_config.docker_compose_cmd[index + 1] == env_files_input
 
 
+def test_docker_cmd_is_built_once(mocker):
+    mocker.patch.object(
+        ClientConfig, "get_client_call_with_path", return_value=["docker"]
+    )
+    client_config = ClientConfig(host="tcp://dodo:2375")
+    build = mocker.spy(client_config, "_build_docker_cmd")
+    first = client_config.docker_cmd
+    first.append("ps")
+    assert client_config.docker_cmd == ["docker", "--host", "tcp://dodo:2375"]
+    assert build.call_count == 1
+
+
+def test_docker_cmd_is_rebuilt_when_the_config_changes(mocker):
+    mocker.patch.object(
+        ClientConfig, "get_client_call_with_path", return_value=["docker"]
+    )
+    client_config = ClientConfig(compose_project_name="dodo")
+    assert client_config.docker_cmd == ["docker"]
+    assert "dodo" in client_config.docker_compose_cmd
+
+    client_config.debug = True
+    client_config.compose_project_name = "dada"
+    assert client_config.docker_cmd == ["docker", "--debug"]
+    assert "dada" in client_config.docker_compose_cmd
+
+
+def test_compose_env_file_warns_once(mocker):
+    mocker.patch.object(
+        ClientConfig, "get_client_call_with_path", return_value=["docker"]
+    )
+    client_config = ClientConfig(compose_env_file="example.env")
+    with pytest.warns(UserWarning) as record:
+        client_config.docker_compose_cmd
+        client_config.docker_compose_cmd
+    assert len(record) == 1
+
+
 @contextmanager
 def _create_temp_env_files() -> Iterator[Tuple[Path, Path]]:
     """Creates two temporary env files and yields their paths. The files are deleted after the context manager is exited."""
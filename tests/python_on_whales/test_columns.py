@@ -0,0 +1,114 @@
+import json
+
+import pytest
+
+from python_on_whales import docker
+from python_on_whales.client_config import ClientConfig
+from python_on_whales.columns import Columns, model_columns, to_columns
+from python_on_whales.components.container.cli_wrapper import ContainerStats
+from python_on_whales.components.container.models import ContainerInspectResult
+from python_on_whales.components.image.models import ImageInspectResult
+from python_on_whales.test_utils import get_all_jsons
+
+
+@pytest.mark.parametrize(
+    "object_type, model_class",
+    [("containers", ContainerInspectResult), ("images", ImageInspectResult)],
+)
+def test_model_columns_match_the_models(object_type, model_class):
+    json_objects = [json.loads(x.read_text()) for x in get_all_jsons(object_type)]
+    columns = model_columns(model_class, json_objects)
+    assert columns.num_rows == len(json_objects)
+    for i, json_object in enumerate(json_objects):
+        model = model_class(**json_object)
+        assert columns["id"][i] == model.id
+        assert columns["created"][i] == model.created
+        if object_type == "images":
+            root_fs = model.root_fs
+            assert columns["root_fs.type"][i] == (root_fs and root_fs.type)
+        else:
+            state = model.state
+            assert columns["state.status"][i] == (state and state.status)
+            assert columns["state.running"][i] == (state and state.running)
+            assert columns["state.started_at"][i] == (state and state.started_at)
+            config = model.config
+            assert columns["config.image"][i] == (config and config.image)
+
+
+def test_model_columns_of_missing_nested_objects():
+    columns = model_columns(ContainerInspectResult, [{"Id": "dodo"}])
+    assert columns["id"] == ["dodo"]
+    assert columns["state.status"] == [None]
+    assert columns["host_config.memory"] == [None]
+
+
+def test_to_columns():
+    all_stats = [
+        ContainerStats(json.loads(x.read_text())) for x in get_all_jsons("stats")
+    ]
+    columns = to_columns(all_stats)
+    assert list(columns) == list(ContainerStats.__slots__)
+    assert columns["memory_used"] == [x.memory_used for x in all_stats]
+    assert to_columns([]) == Columns()
+
+
+def test_disk_free_columns(mocker):
+    lines = [
+        {
+            "Active": "2",
+            "Reclaimable": "1.2GB (50%)",
+            "Size": "2.4GB",
+            "TotalCount": "5",
+            "Type": "Images",
+        },
+        {
+            "Active": "0",
+            "Reclaimable": "0B",
+            "Size": "0B",
+            "TotalCount": "0",
+            "Type": "Build Cache",
+        },
+    ]
+    mocker.patch.object(
+        ClientConfig, "get_client_call_with_path", return_value=["docker"]
+    )
+    mocker.patch(
+        "python_on_whales.components.system.cli_wrapper.run",
+        return_value="\n".join(json.dumps(x) for x in lines),
+    )
+    columns = docker.system.disk_free(details="columns")
+    assert columns == {
+        "type": ["Images", "Build Cache"],
+        "active": [2, 0],
+        "reclaimable": [1_200_000_000, 0],
+        "reclaimable_percent": [50.0, 100.0],
+        "size": [2_400_000_000, 0],
+        "total_count": [5, 0],
+    }
+
+
+def test_container_list_columns_inspects_with_a_single_command(mocker):
+    json_objects = [json.loads(x.read_text()) for x in get_all_jsons("containers")]
+    ids = "\n".join(x["Id"] for x in json_objects)
+
+    def fake_run(full_cmd, *args, **kwargs):
+        if "list" in full_cmd:
+            return ids
+        return json.dumps(json_objects)
+
+    mocker.patch.object(
+        ClientConfig, "get_client_call_with_path", return_value=["docker"]
+    )
+    run_mock = mocker.patch(
+        "python_on_whales.components.container.cli_wrapper.run",
+        side_effect=fake_run,
+    )
+    validate = mocker.spy(ContainerInspectResult, "__init__")
+
+    columns = docker.container.list(all=True, details="columns")
+    assert run_mock.call_count == 2
+    assert validate.call_count == 0
+    assert columns["id"] == [x["Id"] for x in json_objects]
+
+    with pytest.raises(ValueError):
+        docker.container.list(details="columns", prefetch=True)
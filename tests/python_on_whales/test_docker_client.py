@@ -1,4 +1,6 @@
 import re
+import subprocess
+import sys
 import time
 from pathlib import Path
 
@@ -63,3 +65,51 @@ def test_docker_client_options(docker_client: DockerClient):
             client_call=["docker", "--host=tcp://localhost:2380"]
         )
         assert "Hello from Docker!" in dind_client.run("hello-world")
+
+
+def test_components_are_imported_on_first_use():
+    code = """
+import sys
+from python_on_whales import DockerClient, docker
+
+def components():
+    return {x for x in sys.modules if x.startswith("python_on_whales.components")}
+
+client = DockerClient(client_call=["not-docker"])
+assert components() == set(), components()
+assert client.ps.__self__ is client.container
+assert client.container.client_config is client.client_config
+assert "python_on_whales.components.container.cli_wrapper" in components()
+assert "python_on_whales.components.swarm.cli_wrapper" not in components()
+assert docker.client_config.client_type == "docker"
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parametrize(
+    "component",
+    [
+        "buildx",
+        "compose",
+        "config",
+        "container",
+        "context",
+        "image",
+        "manifest",
+        "network",
+        "node",
+        "plugin",
+        "pod",
+        "secret",
+        "service",
+        "stack",
+        "swarm",
+        "system",
+        "task",
+        "trust",
+        "volume",
+    ],
+)
+def test_component_module_can_be_imported_first(component: str):
+    module = f"python_on_whales.components.{component}.cli_wrapper"
+    subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
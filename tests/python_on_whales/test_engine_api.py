@@ -0,0 +1,145 @@
+import json
+import socketserver
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Dict, Generator, List
+
+import pytest
+
+from python_on_whales import DockerClient
+from python_on_whales.client_config import ClientConfig
+from python_on_whales.exceptions import NoSuchContainer, NoSuchImage
+from python_on_whales.test_utils import get_all_jsons
+
+CONTAINER_JSON = json.loads(get_all_jsons("containers")[0].read_text())
+IMAGE_JSON = json.loads(get_all_jsons("images")[0].read_text())
+
+
+class FakeDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str):
+        self.connections = 0
+        self.requests: List[str] = []
+        self.routes: Dict[str, tuple] = {
+            f"GET /containers/{CONTAINER_JSON['Id']}/json": (200, CONTAINER_JSON),
+            "GET /containers/json?all=1": (200, [{"Id": CONTAINER_JSON["Id"]}]),
+            f"POST /containers/{CONTAINER_JSON['Id']}/stop": (204, None),
+            "GET /images/ubuntu:22.04/json": (200, IMAGE_JSON),
+        }
+        super().__init__(socket_path, FakeDaemonHandler)
+
+
+class FakeDaemonHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self):
+        request = f"{self.command} {self.path}"
+        self.server.requests.append(request)
+        if request in self.server.routes:
+            status, body = self.server.routes[request]
+        elif "/containers/" in self.path:
+            status, body = 404, {"message": "No such container: dodo"}
+        else:
+            status, body = 404, {"message": "No such image: dodo"}
+        content = b"" if body is None else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = _handle
+    do_POST = _handle
+
+
+@pytest.fixture
+def fake_daemon() -> Generator[FakeDaemon, None, None]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        server = FakeDaemon(str(Path(tmp_dir) / "docker.sock"))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+
+def make_client(server: FakeDaemon) -> DockerClient:
+    return DockerClient(
+        host=f"unix://{server.server_address}",
+        client_call=["docker-binary-that-does-not-exist"],
+        client_type="docker",
+        transport="engine_api",
+    )
+
+
+def test_inspect_container_over_socket(fake_daemon: FakeDaemon):
+    docker = make_client(fake_daemon)
+    container = docker.container.inspect(CONTAINER_JSON["Id"])
+    assert container.id == CONTAINER_JSON["Id"]
+    assert container.state.status == CONTAINER_JSON["State"]["Status"]
+
+
+def test_connection_is_kept_alive(fake_daemon: FakeDaemon):
+    docker = make_client(fake_daemon)
+    for _ in range(5):
+        docker.container.inspect(CONTAINER_JSON["Id"]).reload()
+    docker.image.inspect("ubuntu:22.04")
+    assert len(fake_daemon.requests) == 11
+    assert fake_daemon.connections == 1
+
+
+def test_list_and_stop_over_socket(fake_daemon: FakeDaemon):
+    docker = make_client(fake_daemon)
+    containers = docker.container.list(all=True)
+    assert [c.id for c in containers] == [CONTAINER_JSON["Id"]]
+    docker.container.stop(containers)
+    assert fake_daemon.requests[-1] == f"POST /containers/{CONTAINER_JSON['Id']}/stop"
+
+
+def test_stop_many_containers_concurrently(fake_daemon: FakeDaemon, monkeypatch):
+    barrier = threading.Barrier(3, timeout=5)
+    handle = FakeDaemonHandler._handle
+
+    def wait_for_all_stops(handler):
+        if handler.path.endswith("/stop"):
+            # fails if the requests are sent one after the other
+            barrier.wait()
+        handle(handler)
+
+    monkeypatch.setattr(FakeDaemonHandler, "do_POST", wait_for_all_stops)
+    docker = make_client(fake_daemon)
+    with pytest.raises(NoSuchContainer):
+        docker.container.stop(["a", "b", "c"])
+    assert sorted(fake_daemon.requests) == [
+        f"POST /containers/{x}/stop" for x in ["a", "b", "c"]
+    ]
+
+
+def test_errors_are_mapped_to_exceptions(fake_daemon: FakeDaemon):
+    docker = make_client(fake_daemon)
+    with pytest.raises(NoSuchContainer):
+        docker.container.inspect("dodo")
+    with pytest.raises(NoSuchImage):
+        docker.image.inspect("dodo")
+
+
+def test_cli_is_used_when_engine_api_cannot_be_used():
+    assert ClientConfig().get_engine_api() is None
+    config = ClientConfig(transport="engine_api", host="tcp://localhost:2375")
+    assert config.get_engine_api() is None
+    config = ClientConfig(transport="engine_api", host="unix:///does/not/exist.sock")
+    assert config.get_engine_api() is None
+    config = ClientConfig(transport="engine_api", client_type="podman")
+    assert config.get_engine_api() is None
+    config = ClientConfig(transport="engine_api", client_call=["podman"])
+    assert config.get_engine_api() is None
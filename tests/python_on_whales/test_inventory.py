@@ -0,0 +1,228 @@
+import copy
+import json
+import queue
+import time
+from typing import Dict
+
+import pytest
+
+from python_on_whales import Container, DockerClient, Image, Network, Volume
+from python_on_whales.client_config import bulk_reload
+from python_on_whales.components.container.cli_wrapper import ContainerCLI
+from python_on_whales.components.image.cli_wrapper import ImageCLI
+from python_on_whales.components.network.cli_wrapper import NetworkCLI
+from python_on_whales.components.system.cli_wrapper import SystemCLI
+from python_on_whales.components.system.models import DockerEvent
+from python_on_whales.components.volume.cli_wrapper import VolumeCLI
+from python_on_whales.exceptions import DockerException
+from python_on_whales.test_utils import get_all_jsons
+
+
+def _load_json(object_type: str) -> dict:
+    return json.loads(get_all_jsons(object_type)[0].read_text())
+
+
+def make_container(container_id, name, labels, image_id, network, volume):
+    container_json = copy.deepcopy(_load_json("containers"))
+    container_json["Id"] = container_id
+    container_json["Name"] = "/" + name
+    container_json["Config"]["Labels"] = labels
+    container_json["Image"] = image_id
+    container_json["NetworkSettings"]["Networks"] = {
+        network: {"NetworkID": "net-" + network}
+    }
+    container_json["Mounts"] = [{"Type": "volume", "Name": volume}]
+    return container_json
+
+
+def make_image(image_id, tags):
+    image_json = copy.deepcopy(_load_json("images"))
+    image_json["Id"] = image_id
+    image_json["RepoTags"] = tags
+    return image_json
+
+
+class FakeDaemon:
+    """Objects of a fake daemon, listed and inspected through mocks."""
+
+    def __init__(self, mocker):
+        self.objects: Dict[str, Dict[str, dict]] = {
+            "container": {},
+            "image": {},
+            "network": {},
+            "volume": {},
+        }
+        self.events_queue = queue.Queue()
+        self.inspect_calls = []
+        self.inspect_error = None
+        self.list_calls = []
+
+        def fake_events(system_cli, since=None, until=None, filters={}):
+            yield from iter(self.events_queue.get, None)
+
+        mocker.patch.object(SystemCLI, "events", fake_events)
+        for object_type, cli_class, object_class in [
+            ("container", ContainerCLI, Container),
+            ("image", ImageCLI, Image),
+            ("network", NetworkCLI, Network),
+            ("volume", VolumeCLI, Volume),
+        ]:
+            mocker.patch.object(cli_class, "list", self._fake_list(object_type))
+            mocker.patch.object(
+                object_class,
+                "_fetch_inspect_results_json",
+                side_effect=self._fake_inspect(object_type),
+            )
+
+    def _fake_list(self, object_type):
+        object_class = {
+            "container": Container,
+            "image": Image,
+            "network": Network,
+            "volume": Volume,
+        }[object_type]
+
+        def fake_list(cli, all=False, prefetch=False):
+            self.list_calls.append(object_type)
+            objects = [
+                object_class(cli.client_config, x, is_immutable_id=True)
+                for x in self.objects[object_type]
+            ]
+            bulk_reload(objects, pin=True)
+            return objects
+
+        return fake_list
+
+    def _fake_inspect(self, object_type):
+        def fake_inspect(references):
+            self.inspect_calls.append((object_type, sorted(references)))
+            if self.inspect_error is not None:
+                raise self.inspect_error
+            return [
+                self.objects[object_type][x]
+                for x in references
+                if x in self.objects[object_type]
+            ]
+
+        return fake_inspect
+
+    def add(self, object_type: str, object_id: str, json_object: dict):
+        self.objects[object_type][object_id] = json_object
+
+    def send_event(self, inventory, event_type, action, actor_id, wait=True):
+        self.events_queue.put(
+            DockerEvent(
+                Type=event_type,
+                Action=action,
+                Actor={"ID": actor_id},
+            )
+        )
+        # wait for the event to be received by the inventory
+        for _ in range(5000):
+            with inventory._pending_lock:
+                if not wait or actor_id in inventory._pending[event_type]:
+                    return
+                if event_type in inventory._pending_full_reload:
+                    return
+            time.sleep(0.001)
+        raise TimeoutError
+
+
+@pytest.fixture
+def fake_daemon(mocker) -> FakeDaemon:
+    daemon = FakeDaemon(mocker)
+    daemon.add("image", "sha256:aaa", make_image("sha256:aaa", ["redis:7"]))
+    daemon.add("image", "sha256:bbb", make_image("sha256:bbb", ["busybox:1"]))
+    daemon.add("image", "sha256:ccc", make_image("sha256:ccc", []))
+    for network in ("frontend", "backend"):
+        network_json = dict(_load_json("networks"), Id="net-" + network, Name=network)
+        daemon.add("network", "net-" + network, network_json)
+    daemon.add("volume", "data", dict(_load_json("volumes"), Name="data"))
+    daemon.add("volume", "cache", dict(_load_json("volumes"), Name="cache"))
+    for container_id, name, role, image_id, network, volume in [
+        ("c1", "redis", "db", "sha256:aaa", "backend", "data"),
+        ("c2", "worker-1", "worker", "sha256:bbb", "backend", "data"),
+        ("c3", "worker-2", "worker", "sha256:bbb", "frontend", "data"),
+    ]:
+        daemon.add(
+            "container",
+            container_id,
+            make_container(
+                container_id, name, {"role": role}, image_id, network, volume
+            ),
+        )
+    return daemon
+
+
+def ids(docker_objects):
+    return sorted(str(x) for x in docker_objects)
+
+
+def test_inventory_queries(fake_daemon: FakeDaemon):
+    docker = DockerClient(client_call=["docker-binary-that-does-not-exist"])
+    with docker.inventory() as inventory:
+        calls = len(fake_daemon.inspect_calls), len(fake_daemon.list_calls)
+        assert calls == (4, 4)
+
+        assert ids(inventory.containers()) == ["c1", "c2", "c3"]
+        assert ids(inventory.containers(label="role=worker")) == ["c2", "c3"]
+        assert ids(inventory.containers(label="role")) == ["c1", "c2", "c3"]
+        assert ids(inventory.containers(name="redis")) == ["c1"]
+        assert ids(inventory.containers(image="busybox:1")) == ["c2", "c3"]
+        assert ids(inventory.containers(image="sha256:aaa")) == ["c1"]
+        assert ids(inventory.containers(label="role=worker", network="backend")) == [
+            "c2"
+        ]
+        assert ids(inventory.containers(network="net-frontend")) == ["c3"]
+        assert ids(inventory.containers(volume="data")) == ["c1", "c2", "c3"]
+        assert ids(inventory.images(tag="redis:7")) == ["sha256:aaa"]
+        assert ids(inventory.unused_images()) == ["sha256:ccc"]
+        assert ids(inventory.networks(name="frontend")) == ["net-frontend"]
+        assert ids(inventory.unused_volumes()) == ["cache"]
+        assert inventory.containers(name="redis")[0].name == "redis"
+
+        # no process launched by the queries
+        assert (len(fake_daemon.inspect_calls), len(fake_daemon.list_calls)) == calls
+
+
+def test_inventory_applies_events(fake_daemon: FakeDaemon):
+    docker = DockerClient(client_call=["docker-binary-that-does-not-exist"])
+    with docker.inventory() as inventory:
+        del fake_daemon.objects["container"]["c1"]
+        fake_daemon.send_event(inventory, "container", "destroy", "c1")
+        fake_daemon.add(
+            "container",
+            "c4",
+            make_container(
+                "c4", "worker-3", {"role": "worker"}, "sha256:ccc", "backend", "cache"
+            ),
+        )
+        fake_daemon.send_event(inventory, "container", "start", "c4")
+        fake_daemon.send_event(inventory, "container", "exec_start", "c2", wait=False)
+
+        assert ids(inventory.containers(network="backend")) == ["c2", "c4"]
+        assert fake_daemon.inspect_calls[-1] == ("container", ["c1", "c4"])
+        assert ids(inventory.unused_images()) == ["sha256:aaa"]
+        assert ids(inventory.unused_volumes()) == []
+
+        # the id of the image isn't known, all the images are listed again
+        fake_daemon.add("image", "sha256:ddd", make_image("sha256:ddd", ["nginx:1"]))
+        fake_daemon.send_event(inventory, "image", "pull", "nginx:1")
+        list_calls = len(fake_daemon.list_calls)
+        assert ids(inventory.images(tag="nginx:1")) == ["sha256:ddd"]
+        assert fake_daemon.list_calls[list_calls:] == ["image"]
+
+
+def test_inventory_keeps_objects_on_daemon_errors(fake_daemon: FakeDaemon):
+    docker = DockerClient(client_call=["docker-binary-that-does-not-exist"])
+    with docker.inventory() as inventory:
+        fake_daemon.send_event(inventory, "container", "start", "c1")
+        fake_daemon.inspect_error = DockerException(
+            ["docker"], 1, stderr=b"Cannot connect to the Docker daemon"
+        )
+        with pytest.raises(DockerException):
+            inventory.containers()
+
+        fake_daemon.inspect_error = None
+        assert ids(inventory.containers()) == ["c1", "c2", "c3"]
+        assert fake_daemon.inspect_calls[-1] == ("container", ["c1"])
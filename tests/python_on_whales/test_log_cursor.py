@@ -0,0 +1,114 @@
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from python_on_whales import DockerClient, LogCursor, LogRecord
+from python_on_whales.log_cursor import _split_timestamp
+
+FAKE_DOCKER_LOGS = """
+import sys
+import time
+from datetime import datetime
+
+LOGS = [
+    ("2024-01-01T00:00:00.5Z", "stdout", "zero"),
+    ("2024-01-01T00:00:01.000000001Z", "stdout", "one"),
+    ("2024-01-01T00:00:01.2Z", "stdout", "two"),
+    ("2024-01-01T00:00:01.2Z", "stdout", "two"),
+    ("2024-01-01T00:00:01.2Z", "stderr", "two"),
+    ("2024-01-01T00:00:01.2Z", "stdout", "two"),
+    ("2024-01-01T00:00:01.7Z", "stdout", "three"),
+    ("2024-01-01T00:00:02Z", "stdout", "four"),
+]
+if sys.argv[-1] != "my_container":
+    sys.stderr.write("Error: No such container: " + sys.argv[-1] + "\\n")
+    sys.exit(1)
+print(" ".join(sys.argv[1:]), file=open(sys.argv[0] + ".calls", "a"))
+since = None
+if "--since" in sys.argv:
+    since = datetime.fromisoformat(sys.argv[sys.argv.index("--since") + 1])
+for timestamp, source, line in LOGS:
+    second = datetime.fromisoformat(timestamp[:19] + "+00:00")
+    if since is None or second >= since:
+        output = getattr(sys, source)
+        print(timestamp, line, file=output, flush=True)
+        time.sleep(0.01)
+"""
+
+
+@pytest.fixture
+def fake_docker(tmp_path: Path) -> DockerClient:
+    script = tmp_path / "docker.py"
+    script.write_text(FAKE_DOCKER_LOGS)
+    return DockerClient(client_call=[sys.executable, str(script)])
+
+
+def read_lines(records):
+    return [(x.source, x.line) for x in records]
+
+
+def test_log_records(fake_docker: DockerClient):
+    records = list(fake_docker.container.log_records("my_container"))
+    assert records[0] == LogRecord(
+        datetime(2024, 1, 1, 0, 0, 0, 500000, tzinfo=timezone.utc),
+        "stdout",
+        b"zero\n",
+    )
+    assert len(records) == 8
+
+
+@pytest.mark.parametrize("records_before_restart", range(9))
+def test_log_records_resume_without_duplicates(
+    fake_docker: DockerClient, tmp_path: Path, records_before_restart: int
+):
+    all_lines = read_lines(fake_docker.container.log_records("my_container"))
+
+    cursor_path = tmp_path / "cursor.json"
+    cursor = LogCursor.load(cursor_path)
+    lines = []
+    for record in fake_docker.container.log_records("my_container", cursor=cursor):
+        if len(lines) == records_before_restart:
+            break
+        lines.append((record.source, record.line))
+        cursor.save(cursor_path)
+
+    cursor = LogCursor.load(cursor_path)
+    lines += read_lines(
+        fake_docker.container.log_records("my_container", cursor=cursor)
+    )
+    assert lines == all_lines
+
+
+def test_log_records_resume_uses_since(fake_docker: DockerClient, tmp_path: Path):
+    cursor = LogCursor()
+    records = fake_docker.container.log_records("my_container", cursor=cursor)
+    for _ in range(3):
+        next(records)
+    records.close()
+    assert cursor.positions["stdout"].timestamp_ns == 1704067201_200000000
+    assert cursor.since == datetime(2024, 1, 1, 0, 0, 1, tzinfo=timezone.utc)
+
+    lines = read_lines(fake_docker.container.log_records("my_container", cursor=cursor))
+    assert lines[0] == ("stdout", b"two\n")
+    calls = (tmp_path / "docker.py.calls").read_text().splitlines()
+    assert calls[-1] == (
+        "container logs --timestamps --since 2024-01-01T00:00:01+00:00 my_container"
+    )
+
+
+def test_log_records_no_such_container(fake_docker: DockerClient):
+    from python_on_whales.exceptions import NoSuchContainer
+
+    with pytest.raises(NoSuchContainer):
+        list(fake_docker.container.log_records("dodo"))
+
+
+def test_split_timestamp_with_container_prefix():
+    line, timestamp, timestamp_ns = _split_timestamp(
+        b"4a1b3c 2024-01-01T00:00:01.123456789Z hello world\n"
+    )
+    assert line == b"4a1b3c hello world\n"
+    assert timestamp == datetime(2024, 1, 1, 0, 0, 1, 123456, tzinfo=timezone.utc)
+    assert timestamp_ns == 1704067201_123456789
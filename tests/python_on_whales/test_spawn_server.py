@@ -0,0 +1,90 @@
+import os
+import sys
+from typing import Generator
+
+import pytest
+
+from python_on_whales import spawn_server
+from python_on_whales.exceptions import DockerException
+from python_on_whales.spawn_server import SpawnedProcess, SpawnServer
+from python_on_whales.utils import (
+    pipe_commands,
+    popen,
+    run,
+    stream_stdout_and_stderr,
+    stream_stdout_in_chunks,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="The spawn server is not available on Windows"
+)
+
+
+@pytest.fixture
+def server() -> Generator[SpawnServer, None, None]:
+    yield spawn_server.start_spawn_server()
+    spawn_server.stop_spawn_server()
+
+
+def test_run_goes_through_the_spawn_server(server: SpawnServer):
+    process = popen(["true"])
+    assert isinstance(process, SpawnedProcess)
+    assert process.wait() == 0
+
+    assert run(["echo", "hello"]) == "hello"
+    assert run(["cat"], input=b"some input") == "some input"
+
+
+def test_spawn_server_environment_variables(server: SpawnServer, monkeypatch):
+    # set after the start of the helper
+    monkeypatch.setenv("SOME_VARIABLE", "dododada")
+    stdout = run(
+        ["bash", "-c", "echo $SOME_VARIABLE && echo $OTHER_VARIABLE"],
+        env={"OTHER_VARIABLE": "dudu"},
+    )
+    assert stdout == "dododada\ndudu"
+
+
+def test_spawn_server_errors(server: SpawnServer):
+    with pytest.raises(DockerException) as err:
+        run(["bash", "-c", "echo 'No such image: dodo' >&2; exit 3"])
+    assert err.value.return_code == 3
+    assert "No such image: dodo" in err.value.stderr
+
+    with pytest.raises(FileNotFoundError):
+        run(["some-binary-that-does-not-exist"])
+
+
+def test_spawn_server_pass_fds(server: SpawnServer):
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"from the parent\n")
+    os.close(write_fd)
+    try:
+        stdout = run(["bash", "-c", f"cat <&{read_fd}"], pass_fds=[read_fd])
+        assert stdout == "from the parent"
+    finally:
+        os.close(read_fd)
+
+
+def test_spawn_server_streams(server: SpawnServer):
+    output = list(stream_stdout_and_stderr(["bash", "-c", "echo a; echo b >&2"]))
+    assert sorted(output) == [("stderr", b"b\n"), ("stdout", b"a\n")]
+
+    chunks = list(stream_stdout_in_chunks(["head", "-c", "100", "/dev/zero"], 30))
+    assert [len(x) for x in chunks] == [30, 30, 30, 10]
+
+    assert pipe_commands(["echo", "piped"], ["cat"]) == "piped"
+
+
+def test_spawn_server_kill(server: SpawnServer):
+    process = server.popen(["sleep", "60"])
+    assert process.poll() is None
+    process.kill()
+    assert process.wait() == -9
+
+
+def test_spawn_server_not_used_after_stop():
+    spawn_server.start_spawn_server()
+    spawn_server.stop_spawn_server()
+    assert spawn_server.get_spawn_server() is None
+    assert not isinstance(popen(["true"]), SpawnedProcess)
@@ -1,5 +1,40 @@
+import asyncio
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pydantic
+import pytest
+
 import python_on_whales.utils
-from python_on_whales.utils import ProcessStream, stream_stdout_and_stderr
+from python_on_whales.client_config import ParsingError
+from python_on_whales.components.container.models import ContainerInspectResult
+from python_on_whales.exceptions import DockerException, NoSuchImage
+from python_on_whales.test_utils import get_all_jsons
+from python_on_whales.utils import (
+    ProcessStream,
+    _get_subprocess_env,
+    inspect_fields_template,
+    iter_pipes_lines,
+    parse_byte_size,
+    parse_byte_size_pair,
+    parse_go_time,
+    parse_json_lines,
+    parse_rfc3339_nano,
+    parse_rfc3339_nano_with_ns,
+    pipe_commands,
+    run,
+    run_async,
+    select_inspect_fields,
+    split_json_array,
+    stream_stdout_and_stderr,
+    stream_stdout_and_stderr_async,
+    stream_stdout_in_chunks,
+)
 
 
 def test_environment_variables_propagation(monkeypatch):
@@ -40,3 +75,297 @@ def test_stream_stdout_and_stderr_non_interactive():
     assert result.stdin is None
     output = list(result)
     assert ("stdout", b"hi\n") in output
+
+
+def test_run_async(monkeypatch):
+    monkeypatch.setenv("SOME_VARIABLE", "dododada")
+    stdout = asyncio.run(
+        run_async(
+            ["bash", "-c", "echo $SOME_VARIABLE && echo $OTHER_VARIABLE"],
+            env={"OTHER_VARIABLE": "dudu"},
+        )
+    )
+    assert stdout == "dododada\ndudu"
+
+
+def test_run_async_raises():
+    with pytest.raises(DockerException) as err:
+        asyncio.run(run_async(["bash", "-c", "echo oops >&2 && exit 3"]))
+    assert err.value.return_code == 3
+    assert err.value.stderr == "oops\n"
+
+
+def test_stream_stdout_and_stderr_async():
+    async def read_all():
+        result = await stream_stdout_and_stderr_async(
+            ["bash", "-c", "echo out1 && echo err1 >&2 && printf out2"]
+        )
+        return [x async for x in result]
+
+    output = asyncio.run(read_all())
+    assert ("stdout", b"out1\n") in output
+    assert ("stdout", b"out2") in output
+    assert ("stderr", b"err1\n") in output
+
+
+def test_stream_stdout_and_stderr_async_interactive():
+    async def read_all():
+        result = await stream_stdout_and_stderr_async(["cat"], pipe_stdin=True)
+        result.stdin.write(b"hello world\n")
+        await result.stdin.drain()
+        result.stdin.close()
+        return [x async for x in result]
+
+    assert asyncio.run(read_all()) == [("stdout", b"hello world\n")]
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["0B", "962B", "1.41MiB", "5.805GiB", "1.2kB", "3.5MB", "10GB", " 1 KiB", "12"],
+)
+def test_parse_byte_size_is_the_same_as_pydantic(value):
+    expected = pydantic.TypeAdapter(pydantic.ByteSize).validate_python(value)
+    assert parse_byte_size(value) == expected
+    assert isinstance(parse_byte_size(value), pydantic.ByteSize)
+
+
+def test_parse_byte_size_pair():
+    assert parse_byte_size_pair("1.41MiB / 5.805GiB") == (1478492, 6233071288)
+    with pytest.raises(ValueError):
+        parse_byte_size("--")
+    with pytest.raises(ValueError):
+        parse_byte_size("12 parsecs")
+
+
+def test_stream_stdout_in_chunks():
+    # the output is written in small irregular pieces, with newlines
+    code = (
+        "import sys\n"
+        "for i in range(1000):\n"
+        "    sys.stdout.buffer.write(bytes([i % 256]) * (i % 7) + b'\\n')\n"
+    )
+    expected = b"".join(bytes([i % 256]) * (i % 7) + b"\n" for i in range(1000))
+    chunks = list(stream_stdout_in_chunks([sys.executable, "-c", code], 1000))
+    assert b"".join(chunks) == expected
+    assert [len(x) for x in chunks[:-1]] == [1000] * (len(expected) // 1000)
+
+
+def test_stream_stdout_in_chunks_raises():
+    code = "import sys; sys.stderr.write('Error: No such image: dodo'); sys.exit(1)"
+    with pytest.raises(NoSuchImage):
+        list(stream_stdout_in_chunks([sys.executable, "-c", code]))
+
+
+def test_stream_stdout_in_chunks_stopped_early():
+    code = "import sys\nwhile True: sys.stdout.buffer.write(b'a' * 4096)"
+    iterator = stream_stdout_in_chunks([sys.executable, "-c", code], 1024)
+    assert next(iterator) == b"a" * 1024
+    # closing the iterator kills the process instead of waiting forever
+    iterator.close()
+
+
+SOURCE_CODE = "import sys\nfor i in range(300): sys.stdout.buffer.write(bytes([i % 256]) * 10_000)"
+DESTINATION_CODE = (
+    "import sys, hashlib\nprint(hashlib.md5(sys.stdin.buffer.read()).hexdigest())"
+)
+
+
+@pytest.mark.parametrize("with_progress", [False, True])
+def test_pipe_commands(with_progress):
+    expected = b"".join(bytes([i % 256]) * 10_000 for i in range(300))
+    counts = []
+    stdout = pipe_commands(
+        [sys.executable, "-c", SOURCE_CODE],
+        [sys.executable, "-c", DESTINATION_CODE],
+        counts.append if with_progress else None,
+    )
+    assert stdout == hashlib.md5(expected).hexdigest()
+    if with_progress:
+        assert sum(counts) == len(expected)
+
+
+def test_pipe_commands_source_fails():
+    source_code = (
+        "import sys; sys.stderr.write('Error: No such image: dodo'); sys.exit(1)"
+    )
+    with pytest.raises(NoSuchImage):
+        pipe_commands(
+            [sys.executable, "-c", source_code],
+            [sys.executable, "-c", DESTINATION_CODE],
+        )
+
+
+@pytest.mark.parametrize("with_progress", [False, True])
+def test_pipe_commands_destination_fails(with_progress):
+    destination_code = "import sys; sys.stderr.write('invalid tar header'); sys.exit(1)"
+    with pytest.raises(DockerException) as err:
+        pipe_commands(
+            [sys.executable, "-c", SOURCE_CODE],
+            [sys.executable, "-c", destination_code],
+            (lambda x: None) if with_progress else None,
+        )
+    assert "invalid tar header" in str(err.value)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="selectors don't support pipes")
+def test_iter_pipes_lines_multiple_processes():
+    code = (
+        "import sys\n"
+        "for i in range(1000):\n"
+        "    sys.stdout.write(f'{sys.argv[1]} {i}\\n')\n"
+        "sys.stdout.write('no newline at the end')\n"
+    )
+    processes = [
+        subprocess.Popen([sys.executable, "-c", code, str(x)], stdout=subprocess.PIPE)
+        for x in range(20)
+    ]
+    lines = {x: [] for x in range(20)}
+    for key, line in iter_pipes_lines({p.stdout: i for i, p in enumerate(processes)}):
+        lines[key].append(line)
+    for p in processes:
+        p.stdout.close()
+        assert p.wait() == 0
+
+    for x in range(20):
+        expected = [f"{x} {i}\n".encode() for i in range(1000)]
+        assert lines[x] == expected + [b"no newline at the end"]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (
+            "2024-03-05T10:11:12.123456789Z",
+            datetime(2024, 3, 5, 10, 11, 12, 123456, tzinfo=timezone.utc),
+        ),
+        (
+            "2024-03-05T10:11:12Z",
+            datetime(2024, 3, 5, 10, 11, 12, tzinfo=timezone.utc),
+        ),
+        (
+            "2024-03-05T10:11:12.5+02:00",
+            datetime(
+                2024, 3, 5, 10, 11, 12, 500000, tzinfo=timezone(timedelta(hours=2))
+            ),
+        ),
+    ],
+)
+def test_parse_rfc3339_nano(value, expected):
+    assert parse_rfc3339_nano(value) == expected
+
+
+def test_parse_rfc3339_nano_invalid():
+    with pytest.raises(ValueError):
+        parse_rfc3339_nano("Error: No such container: dodo")
+
+
+def test_parse_rfc3339_nano_with_ns():
+    assert parse_rfc3339_nano_with_ns("2024-01-01T02:00:01.123456789+02:00") == (
+        datetime(2024, 1, 1, 2, 0, 1, 123456, tzinfo=timezone(timedelta(hours=2))),
+        1704067201_123456789,
+    )
+    assert parse_rfc3339_nano_with_ns("2024-01-01T00:00:01Z")[1] == 1704067201 * 10**9
+
+
+def test_get_subprocess_env_inherits_when_nothing_changes():
+    assert _get_subprocess_env(["docker", "ps"], {}) is None
+    env = _get_subprocess_env(["docker", "buildx", "ls"], {})
+    assert env["DOCKER_CLI_EXPERIMENTAL"] == "enabled"
+    assert env["PATH"] == os.environ["PATH"]
+
+
+def test_parse_go_time():
+    assert parse_go_time("2024-03-05 10:11:12.123456789 +0200 CEST") == datetime(
+        2024, 3, 5, 10, 11, 12, 123456, tzinfo=timezone(timedelta(hours=2))
+    )
+    assert parse_go_time("2024-03-05 10:11:12 +0000 UTC") == datetime(
+        2024, 3, 5, 10, 11, 12, tzinfo=timezone.utc
+    )
+
+
+def test_parse_json_lines():
+    assert parse_json_lines("") == []
+    assert parse_json_lines('{"a": "multi\\nline"}\n{"b": 2}') == [
+        {"a": "multi\nline"},
+        {"b": 2},
+    ]
+
+
+@pytest.mark.parametrize("indent", [None, 2, 4, 5])
+def test_split_json_array(indent):
+    elements = [
+        {"Id": "a", "Nested": [{"Key": "value"}, {}]},
+        {"Id": "b", "Tricky": "}\n    },\n    {"},
+        {"Id": "c", "Labels": {"x": "y"}},
+    ]
+    for i in range(len(elements) + 1):
+        json_array = json.dumps(elements[:i], indent=indent).encode()
+        result = split_json_array(json_array)
+        assert all(isinstance(x, bytes) for x in result)
+        assert [json.loads(x) for x in result] == elements[:i]
+        assert [json.loads(x) for x in split_json_array(json_array.decode())] == (
+            elements[:i]
+        )
+
+
+def test_run_without_decoding():
+    assert run(["echo", "dodo"], decode=False) == b"dodo\n"
+
+
+def test_select_inspect_fields():
+    json_object = json.loads(get_all_jsons("containers")[0].read_text())
+    fields = ["State.Status", "Config.Labels", "Id", "State.Missing", "Id.Missing"]
+    assert select_inspect_fields(json_object, fields) == {
+        "State.Status": json_object["State"]["Status"],
+        "Config.Labels": json_object["Config"]["Labels"],
+        "Id": json_object["Id"],
+        "State.Missing": None,
+        "Id.Missing": None,
+    }
+    assert inspect_fields_template([]) == "{}"
+    with pytest.raises(ValueError):
+        select_inspect_fields(json_object, ["State..Status"])
+
+
+def test_lazy_docker_camel_model():
+    json_object = json.loads(get_all_jsons("containers")[0].read_text())
+    inspect_result = ContainerInspectResult(**json_object)
+    assert "host_config" not in inspect_result.__dict__
+    assert inspect_result.state.status == json_object["State"]["Status"]
+    assert "state" in inspect_result.__dict__
+    assert "host_config" not in inspect_result.__dict__
+    assert "host_config" in inspect_result.model_fields_set
+
+    other = ContainerInspectResult.model_validate_json(json.dumps(json_object))
+    assert other == inspect_result
+    assert other.model_dump() == inspect_result.model_dump()
+    assert "host_config" in inspect_result.__dict__
+
+    json_object["HostConfig"]["Memory"] = "not a number"
+    inspect_result = ContainerInspectResult(**json_object)
+    assert inspect_result.state.status == json_object["State"]["Status"]
+    with pytest.raises(ParsingError) as err:
+        inspect_result.host_config
+    assert isinstance(err.value.__cause__, pydantic.ValidationError)
+    error_message = str(err.value)
+    assert "This is a bug with python-on-whales itself" in error_message
+    json_response_file = next(x for x in error_message.split() if ".json" in x)
+    with open(json_response_file) as f:
+        assert json.load(f) == {"HostConfig": json_object["HostConfig"]}
+
+
+def test_stream_stdout_and_stderr_writing_stdin_before_iterating():
+    # more than the buffer of a pipe, `cat` blocks if its stdout isn't read
+    data = b"a" * 1023 + b"\n"
+    data *= 2048
+    stream = stream_stdout_and_stderr(["cat"], pipe_stdin=True)
+
+    def write():
+        stream.stdin.write(data)
+        stream.stdin.close()
+
+    writer = threading.Thread(target=write, daemon=True)
+    writer.start()
+    writer.join(timeout=5)
+    assert not writer.is_alive()
+    assert b"".join(line for _, line in stream) == data